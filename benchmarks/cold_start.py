@@ -0,0 +1,105 @@
+"""
+This script measures the cold start of the bot: the time a fresh Python
+process takes to import its modules and, with a snapshot, to bootstrap the
+controller. It fails when the median is above a target, so CI catches
+startup regressions:
+
+    python3 benchmarks/cold_start.py --max-ms 1000
+    python3 benchmarks/cold_start.py --snapshot isaac.db --max-ms 3000
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Modules imported by each runtime on startup
+MODULES = ['controller', 'isaacbot', 'isaacbot_async']
+
+# Measured in the child process, printing milliseconds
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import {module}
+print((time.perf_counter() - start) * 1000)
+"""
+
+BOOTSTRAP_SCRIPT = """
+import time
+start = time.perf_counter()
+import bootstrap
+bootstrap.create_controller()
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def measure(script, runs, env):
+    """
+    Run a script in fresh processes and collect the time it reports.
+
+    Args:
+        script (str): Python code printing the milliseconds it measured.
+        runs (int): Number of processes to run.
+        env (dict): Environment of the processes.
+
+    Returns:
+        list: The milliseconds reported by every run.
+    """
+    times = []
+    for _ in range(runs):
+        # Without stdin, a prompt for a missing token fails instead of
+        # blocking
+        output = subprocess.run(
+            [sys.executable, '-c', script], cwd=SRC, env=env, check=True,
+            stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, universal_newlines=True).stdout
+        times.append(float(output.split()[-1]))
+    return times
+
+
+def main():
+    """
+    Measure the cold start and check it against the target.
+
+    Returns:
+        int: Exit status, 1 if a median is above the target.
+    """
+    parser = argparse.ArgumentParser(
+        description='Measure the cold start of the bot.')
+    parser.add_argument('--runs', type=int, default=5,
+                        help='processes started per measure')
+    parser.add_argument('--max-ms', type=float,
+                        help='fail if a median is above this many ms')
+    parser.add_argument('--snapshot',
+                        help='also bootstrap a controller from this SQLite '
+                        'snapshot')
+    args = parser.parse_args()
+
+    env = {key: value for key, value in os.environ.items()
+           if key not in ('TOKEN', 'MONGO_TOKEN')}
+    measures = {f"import {module}": IMPORT_SCRIPT.format(module=module)
+                for module in MODULES}
+    if args.snapshot:
+        env['SNAPSHOT_PATH'] = os.path.abspath(args.snapshot)
+        measures['bootstrap controller'] = BOOTSTRAP_SCRIPT
+
+    status = 0
+    print(f"{'measure':<24}{'median ms':>12}{'max ms':>12}")
+    for name, script in measures.items():
+        times = measure(script, args.runs, env)
+        median = statistics.median(times)
+        print(f"{name:<24}{median:>12.1f}{max(times):>12.1f}")
+        if args.max_ms is not None and median > args.max_ms:
+            print(f"{name} is above the {args.max_ms:.0f} ms target")
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
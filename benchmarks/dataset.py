@@ -0,0 +1,493 @@
+"""
+This module generates synthetic datasets with the shapes of the Isaac
+collections, so the benchmarks don't depend on MongoDB Atlas and can scale
+well beyond the real dataset, as merged mod datasets do.
+
+Elements are split between types in the proportions of the real dataset.
+Names are built from word pools picked with a Zipf distribution, so common
+words such as "Mom's" or "Book of" are shared by many names, as they are in
+the game. Section arrays, health, pickups and conditions follow the shapes
+the entity classes render.
+
+A dataset is exported into a snapshot, which the bot serves with
+SNAPSHOT_PATH, with:
+
+    python3 benchmarks/dataset.py --size 100000 isaac-100k.db
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import argparse
+import itertools
+import os
+import random
+import sys
+
+# Emoji keys, as used by health, pickups and transformation effects
+EMOJIS = {
+    'Red': '\\u2764\\ufe0f',
+    'Soul': '\\U0001f499',
+    'Black': '\\U0001f5a4',
+    'Bone': '\\U0001f9b4',
+    'Eternal': '\\U0001f90d',
+    'Golden': '\\U0001f49b',
+    'Rotten': '\\U0001f9df',
+    'Broken': '\\U0001f494',
+    'Coins': '\\U0001fa99',
+    'Bombs': '\\U0001f4a3',
+    'Keys': '\\U0001f511',
+    'Damage': '\\U0001f5e1\\ufe0f',
+    'Tears': '\\U0001f4a7',
+    'Speed': '\\U0001f45f',
+    'Range': '\\U0001f4cf',
+    'Luck': '\\U0001f340'
+}
+
+# Share of every type in the real dataset
+WEIGHTS = {
+    'Items': 719,
+    'Trinkets': 189,
+    'Cards': 97,
+    'Runes': 11,
+    'SoulStones': 17,
+    'Pills': 50,
+    'Pickups': 60,
+    'Curses': 10,
+    'Transformations': 15,
+    'Challenges': 45,
+    'Characters': 34,
+    'Achievements': 637
+}
+
+SECTIONS = ('effects', 'notes', 'synergies', 'interactions')
+
+# Candidate names built before numbering a clashing one
+ATTEMPTS = 8
+
+# Word pools, most common first
+ADJECTIVES = (
+    'Sad', 'Little', 'Big', 'Golden', 'Dead', 'Broken', 'Holy', 'Dark',
+    'Lost', 'Cursed', 'Lucky', 'Bloody', 'Tiny', 'Magic', 'Evil', 'Blue',
+    'Rotten', 'Crooked', 'Hungry', 'Empty', 'Eternal', 'Wooden', 'Burnt',
+    'Spider', 'Sacred', 'Odd', 'Angry', 'Lazy', 'Sharp', 'Wavy', 'Mysterious'
+)
+NOUNS = (
+    'Eye', 'Heart', 'Bomb', 'Key', 'Knife', 'Onion', 'Tooth', 'Head', 'Tears',
+    'Coin', 'Book', 'Bag', 'Box', 'Lump', 'Cross', 'Worm', 'Halo', 'Bean',
+    'Cube', 'Paw', 'Tail', 'Skull', 'Cap', 'Shovel', 'Candle', 'Bible',
+    'Mirror', 'Rock', 'Horn', 'Lung', 'Bobby', 'Baby', 'Fly', 'Leech', 'Sack',
+    'Battery', 'Dice', 'Mushroom', 'Pendant', 'Bandage', 'Ring', 'Wafer'
+)
+OWNERS = ('Mom', 'Dad', 'Guppy', 'Judas', 'Satan', 'Cain', 'Eve', 'Samson',
+          'Isaac', 'Maggy', 'Lilith', 'Azazel', 'Bethany', 'Jacob', 'Esau')
+SYLLABLES = ('ha', 'ga', 'laz', 'je', 'ra', 'per', 'thro', 'al', 'gíz',
+             'an', 'su', 'ku', 'be', 'th', 'dag', 'az', 'o', 'eh', 'wa', 'ber')
+SUITS = ('Hearts', 'Spades', 'Clubs', 'Diamonds')
+RANKS = ('Ace', 'Two', 'Three', 'Four', 'Five', 'Six', 'Seven', 'Eight',
+         'Nine', 'Ten', 'Jack', 'Queen', 'King')
+CHALLENGES = ('Trauma', 'Falls', 'Hunt', 'Rush', 'Party', 'Run', 'Race',
+              'Time', 'Pact', 'Trip')
+PICKUPS = ('Heart', 'Coin', 'Key', 'Bomb', 'Chest', 'Battery', 'Sack')
+DECKS = ('Tarot', 'Playing', 'Reversed Tarot', 'Special', 'Object')
+WORDS = ('tears', 'damage', 'speed', 'range', 'shot', 'luck', 'room', 'enemy',
+         'flight', 'bomb', 'heart', 'familiar', 'boss', 'chance', 'floor',
+         'Isaac', 'spawns', 'grants', 'while', 'the', 'a', 'of', 'for', 'on')
+
+
+class NameGenerator:
+    """
+    Generates unique names from Zipf distributed word pools.
+
+    Attributes:
+        __rng (random.Random): The random generator.
+        __weights (dict): Maps word pools to their cumulative weights.
+        __names (set): The names generated so far, of every type.
+    """
+
+    def __init__(self, rng):
+        """
+        Initializes a new instance of the NameGenerator class.
+
+        Args:
+            rng (random.Random): The random generator.
+        """
+        self.__rng = rng
+        self.__weights = {}
+        self.__names = set()
+
+    def word(self, pool):
+        """
+        Pick a word of a pool, the first words being the most common.
+
+        Args:
+            pool (tuple): The words, most common first.
+
+        Returns:
+            str: The word.
+        """
+        weights = self.__weights.get(pool)
+        if weights is None:
+            weights = self.__weights[pool] = list(itertools.accumulate(
+                1 / rank for rank in range(1, len(pool) + 1)))
+        return self.__rng.choices(pool, cum_weights=weights)[0]
+
+    def syllables(self, count):
+        """
+        Build a made up word, such as a rune or character name.
+
+        Args:
+            count (int): Number of syllables.
+
+        Returns:
+            str: The word.
+        """
+        return ''.join(self.word(SYLLABLES)
+                       for _ in range(count)).capitalize()
+
+    def unique(self, build):
+        """
+        Build a name unique among the generated ones.
+
+        Clashing candidates are retried, prefixed with a made up word once
+        the common ones run out, and the last one is numbered, as merged
+        mods do with clashing names.
+
+        Args:
+            build (callable): Builds a candidate name.
+
+        Returns:
+            str: The unique name.
+        """
+        for attempt in range(ATTEMPTS):
+            name = build()
+            if attempt >= ATTEMPTS // 2:
+                name = f"{self.syllables(2)} {name}"
+            if name not in self.__names:
+                break
+        unique_name = name
+        for number in itertools.count(2):
+            if unique_name not in self.__names:
+                break
+            unique_name = f"{name} {number}"
+        self.__names.add(unique_name)
+        return unique_name
+
+    def item(self):
+        """
+        Build the name of an item, trinket, transformation or achievement.
+
+        Returns:
+            str: The name.
+        """
+        return self.unique(self.__item)
+
+    def __item(self):
+        """
+        Build a candidate name of an item.
+
+        Returns:
+            str: The candidate name.
+        """
+        # Disable too many return statements, since every template builds
+        # its name differently
+        # pylint: disable=R0911
+        template = self.__rng.randrange(8)
+        if not template:
+            return self.word(NOUNS)
+        if template == 1:
+            return f"{self.word(ADJECTIVES)} {self.word(NOUNS)}"
+        if template == 2:
+            return f"The {self.word(ADJECTIVES)} {self.word(NOUNS)}"
+        if template == 3:
+            return f"{self.word(OWNERS)}'s {self.word(NOUNS)}"
+        if template == 4:
+            return f"Book of {self.word(OWNERS)}"
+        if template == 5:
+            # Made up words keep large datasets from running out of names
+            return f"{self.syllables(2)}'s {self.word(NOUNS)}"
+        if template == 6:
+            return f"{self.word(ADJECTIVES)} {self.syllables(3)}"
+        return f"{self.word(NOUNS)} of the {self.word(NOUNS)}"
+
+    def card(self):
+        """
+        Build the name of a card and its deck.
+
+        Returns:
+            tuple: The name and the deck, or None for cards without a deck.
+        """
+        deck = self.word(DECKS)
+        name = self.unique(lambda: self.__card(deck))
+        return name, deck if deck != 'Object' else None
+
+    def __card(self, deck):
+        """
+        Build a candidate name of a card.
+
+        Args:
+            deck (str): The deck of the card.
+
+        Returns:
+            str: The candidate name.
+        """
+        if deck == 'Playing':
+            return f"{self.word(RANKS)} of {self.word(SUITS)}"
+        if deck == 'Tarot':
+            return f"{self.__rng.randrange(22)} - The {self.word(NOUNS)}"
+        if deck == 'Reversed Tarot':
+            return f"{self.__rng.randrange(22)} - The {self.word(NOUNS)}?"
+        if deck == 'Object':
+            return f"{self.word(ADJECTIVES)} Card"
+        return f"{self.syllables(2)}'s {self.word(NOUNS)}"
+
+    def build(self, collection):
+        """
+        Build the name of an element of a collection, other than items and
+        cards.
+
+        Args:
+            collection (str): The collection of the element.
+
+        Returns:
+            str: The name.
+        """
+        return self.unique(lambda: self.__build(collection))
+
+    def __build(self, collection):
+        """
+        Build a candidate name of an element of a collection.
+
+        Args:
+            collection (str): The collection of the element.
+
+        Returns:
+            str: The candidate name.
+        """
+        # Disable too many return statements, since every collection names
+        # its elements differently
+        # pylint: disable=R0911
+        if collection == 'Runes':
+            return self.syllables(self.__rng.randint(2, 3))
+        if collection == 'SoulStones':
+            return f"Soul of {self.syllables(self.__rng.randint(1, 3))}"
+        if collection == 'Pills':
+            return f"{self.word(ADJECTIVES)} {self.word(NOUNS)}s"
+        if collection == 'Pickups':
+            return f"{self.word(ADJECTIVES)} {self.word(PICKUPS)}"
+        if collection == 'Curses':
+            return f"Curse of the {self.word(ADJECTIVES)}"
+        if collection == 'Challenges':
+            return f"{self.word(NOUNS)} {self.word(CHALLENGES)}"
+        if collection == 'Characters':
+            name = self.syllables(self.__rng.randint(1, 3))
+            return f"Tainted {name}" if self.__rng.random() < 0.5 else name
+        return self.__item()
+
+
+def sentence(rng, words=8):
+    """
+    Generate a sentence of filler words.
+
+    Args:
+        rng (random.Random): The random generator.
+        words (int, optional): Number of words. Defaults to 8.
+
+    Returns:
+        str: The sentence.
+    """
+    text = ' '.join(rng.choices(WORDS, k=words))
+    return text[0].upper() + text[1:]
+
+
+def section(rng, mean):
+    """
+    Generate a section of an item or trinket, as [depth, text] pairs.
+
+    Lengths are exponentially distributed, since most elements have a few
+    entries and a handful have dozens.
+
+    Args:
+        rng (random.Random): The random generator.
+        mean (float): Mean number of entries.
+
+    Returns:
+        list: The entries of the section.
+    """
+    length = min(int(rng.expovariate(1 / mean)), 60)
+    entries = []
+    depth = 0
+    for _ in range(length):
+        # Nested entries follow the entry they refine
+        depth = rng.choice((0, depth, depth + 1)) if depth < 2 else 0
+        entries.append([depth, sentence(rng, rng.randint(4, 16))])
+    return entries
+
+
+def health(rng):
+    """
+    Generate the health of a character, with soul hearts nested by kind.
+
+    Args:
+        rng (random.Random): The random generator.
+
+    Returns:
+        dict: Maps heart kinds to their count.
+    """
+    hearts = {'red': rng.randint(0, 4)}
+    kinds = rng.sample(('soul', 'black', 'bone'), rng.randint(0, 2))
+    souls = {kind: rng.randint(1, 3) for kind in kinds}
+    if souls:
+        hearts['soul'] = souls
+    if rng.random() < 0.2:
+        hearts[rng.choice(('eternal', 'golden', 'broken'))] = True
+    return hearts
+
+
+def counts(size):
+    """
+    Split a number of elements between the collections, in the proportions
+    of the real dataset.
+
+    Args:
+        size (int): Total number of elements.
+
+    Returns:
+        dict: Maps collection names to their number of elements, at least 1.
+    """
+    total = sum(WEIGHTS.values())
+    return {collection: max(1, round(size * weight / total))
+            for collection, weight in WEIGHTS.items()}
+
+
+def generate(size, seed=0):
+    """
+    Generate a dataset with a number of elements.
+
+    Args:
+        size (int): Total number of elements, split between the types in the
+        proportions of the real dataset.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        dict: Maps collection names to their documents.
+    """
+    # Disable too many locals, since every collection has its own shape
+    # pylint: disable=R0914
+    rng = random.Random(seed)
+    names = NameGenerator(rng)
+    sizes = counts(size)
+    # Transformations change stats and health
+    keys = ['Damage', 'Tears', 'Speed', 'Range', 'Luck', 'Red', 'Soul']
+    dataset = {
+        'Emojis': [{'key': key, 'value': value}
+                   for key, value in EMOJIS.items()],
+        'Replies': []
+    }
+
+    dataset['Items'] = [{
+        'name': names.item(), 'message': sentence(rng, 4),
+        'description': sentence(rng), 'unlock': 'Default',
+        'quality': rng.randint(0, 4), 'recharge': rng.randint(0, 6),
+        **{name: section(rng, 4) for name in SECTIONS}
+    } for _ in range(sizes['Items'])]
+    item_names = [item['name'] for item in dataset['Items']]
+
+    dataset['Trinkets'] = [{
+        'name': names.item(), 'message': sentence(rng, 4),
+        'description': sentence(rng), 'unlock': 'Default',
+        **{name: section(rng, 2) for name in SECTIONS}
+    } for _ in range(sizes['Trinkets'])]
+
+    dataset['Cards'] = []
+    for _ in range(sizes['Cards']):
+        name, deck = names.card()
+        card = {'name': name, 'message': sentence(rng, 4),
+                'unlock': 'Default', 'effect': sentence(rng)}
+        if deck:
+            card['deck'] = deck
+        dataset['Cards'].append(card)
+
+    for collection in ('Runes', 'SoulStones', 'Pickups'):
+        dataset[collection] = [{
+            'name': names.build(collection), 'message': sentence(rng, 4),
+            'unlock': 'Default', 'effect': sentence(rng)
+        } for _ in range(sizes[collection])]
+
+    dataset['Pills'] = [{
+        'name': names.build('Pills'), 'effect': sentence(rng),
+        'horse_effect': sentence(rng)
+    } for _ in range(sizes['Pills'])]
+
+    dataset['Curses'] = [{
+        'name': names.build('Curses'), 'description': sentence(rng)
+    } for _ in range(sizes['Curses'])]
+
+    dataset['Transformations'] = [{
+        'name': names.build('Transformations'), 'description': sentence(rng),
+        'condition': sentence(rng),
+        'effects': {key: sentence(rng, 3)
+                    for key in rng.sample(keys, rng.randint(1, 4))}
+    } for _ in range(sizes['Transformations'])]
+
+    dataset['Characters'] = [{
+        'name': names.build('Characters'), 'health': health(rng),
+        'unlock': rng.choice(('Default', sentence(rng))),
+        'pickups': {'coins': str(rng.randint(0, 5)),
+                    'bombs': str(rng.randint(0, 3)),
+                    'keys': str(rng.randint(0, 2))},
+        'items': rng.sample(item_names, min(len(item_names),
+                                            rng.randint(0, 3))),
+        'conditions': [sentence(rng, 6) for _ in range(rng.randint(0, 2))]
+    } for _ in range(sizes['Characters'])]
+    character_names = [character['name']
+                       for character in dataset['Characters']]
+
+    dataset['Challenges'] = [{
+        'name': names.build('Challenges'),
+        'character': {'name': rng.choice(character_names)},
+        'conditions': {
+            'curse': rng.choice(('None', 'Darkness', 'Lost', 'Maze')),
+            'items': {'starting': rng.sample(
+                item_names, min(len(item_names), rng.randint(1, 3)))}},
+        'goal': rng.choice(('Mom', "Mom's Heart", 'Satan', 'The Lamb')),
+        'unlock': 'Default', 'prize': rng.choice(item_names)
+    } for _ in range(sizes['Challenges'])]
+
+    dataset['Achievements'] = [{
+        'number': str(number), 'name': names.item(),
+        'description': sentence(rng), 'unlock': sentence(rng)
+    } for number in range(1, sizes['Achievements'] + 1)]
+    return dataset
+
+
+def main():
+    """
+    Generate a dataset and export it into a snapshot.
+    """
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                       'src')
+    sys.path.insert(0, src)
+    # Disable import outside toplevel, since the snapshot module is only
+    # found once the source directory is in the path
+    # pylint: disable=C0415
+    from fake_database import DictDatabase
+    from snapshot import export_snapshot
+
+    parser = argparse.ArgumentParser(
+        description='Generate a synthetic dataset into a snapshot.')
+    parser.add_argument('path', help='path of the snapshot to write')
+    parser.add_argument('--size', type=int, default=2000,
+                        help='total number of elements')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the random generator')
+    args = parser.parse_args()
+
+    dataset = generate(args.size, args.seed)
+    export_snapshot(DictDatabase(dataset), args.path)
+    for collection, documents in dataset.items():
+        print(f"{collection:<16}{len(documents):>8}")
+
+
+if __name__ == '__main__':
+    main()
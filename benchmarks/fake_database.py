@@ -0,0 +1,209 @@
+"""
+This module provides a local stand-in for the MongoDB database, seeded with
+a generated dataset, which simulates the latency of every round trip and
+counts them.
+
+The dataset is exported into a temporary SQLite snapshot, so queries run
+through the same SnapshotDatabase the bot can serve from.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import os
+import tempfile
+import time
+
+from snapshot import SnapshotDatabase, export_snapshot
+
+
+class DictCollection:
+    """
+    Collection of in-memory documents, as read by export_snapshot.
+
+    Attributes:
+        __documents (list): The documents of the collection.
+    """
+
+    # Disable too few public methods warning, since only the export reads it
+    # pylint: disable=R0903
+
+    def __init__(self, documents):
+        """
+        Initializes a new instance of the DictCollection class.
+
+        Args:
+            documents (list): The documents of the collection.
+        """
+        self.__documents = documents
+
+    def find(self, *_):
+        """
+        Retrieve every document, as the export queries them, without an
+        '_id'.
+
+        Returns:
+            list: The documents.
+        """
+        return self.__documents
+
+
+class DictDatabase:
+    """
+    Database of in-memory collections, as read by export_snapshot.
+
+    Attributes:
+        __collections (dict): Maps collection names to their documents.
+    """
+
+    def __init__(self, collections):
+        """
+        Initializes a new instance of the DictDatabase class.
+
+        Args:
+            collections (dict): Maps collection names to their documents.
+        """
+        self.__collections = collections
+
+    def list_collection_names(self):
+        """
+        Retrieve the names of the collections.
+
+        Returns:
+            list: The collection names.
+        """
+        return list(self.__collections)
+
+    def __getitem__(self, name):
+        """
+        Retrieve a collection.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            DictCollection: The collection.
+        """
+        return DictCollection(self.__collections[name])
+
+
+class LatencyCollection:
+    """
+    Collection delaying and counting every query, as round trips to MongoDB.
+
+    Attributes:
+        __database (LatencyDatabase): The database the collection belongs to.
+        __collection (SnapshotCollection): The collection queried.
+    """
+
+    def __init__(self, database, collection):
+        """
+        Initializes a new instance of the LatencyCollection class.
+
+        Args:
+            database (LatencyDatabase): The database the collection belongs
+            to.
+            collection (SnapshotCollection): The collection queried.
+        """
+        self.__database = database
+        self.__collection = collection
+
+    def find(self, *args, **kwargs):
+        """
+        Retrieve the documents matching a query after a round trip.
+
+        Returns:
+            list: The matching documents.
+        """
+        self.__database.round_trip()
+        return self.__collection.find(*args, **kwargs)
+
+    def find_one(self, *args, **kwargs):
+        """
+        Retrieve the first document matching a query after a round trip.
+
+        Returns:
+            dict or None: The first matching document, or None.
+        """
+        self.__database.round_trip()
+        return self.__collection.find_one(*args, **kwargs)
+
+    def aggregate(self, *args, **kwargs):
+        """
+        Run an aggregation pipeline after a round trip.
+
+        Returns:
+            list: The resulting documents.
+        """
+        self.__database.round_trip()
+        return self.__collection.aggregate(*args, **kwargs)
+
+
+class LatencyDatabase:
+    """
+    Database seeded with a dataset, which simulates the latency of MongoDB
+    and counts its round trips.
+
+    Attributes:
+        latency (float): Seconds every round trip takes.
+        round_trips (int): Number of round trips made.
+        __path (str): Path of the temporary snapshot.
+        __snapshot (SnapshotDatabase): The snapshot queried.
+    """
+
+    def __init__(self, dataset, latency=0.0):
+        """
+        Initializes a new instance of the LatencyDatabase class, exporting
+        the dataset into a temporary snapshot.
+
+        Args:
+            dataset (dict): Maps collection names to their documents.
+            latency (float, optional): Seconds every round trip takes.
+            Defaults to 0.
+        """
+        self.latency = latency
+        self.round_trips = 0
+        handle, self.__path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        export_snapshot(DictDatabase(dataset), self.__path)
+        self.__snapshot = SnapshotDatabase(self.__path)
+
+    def round_trip(self):
+        """
+        Count a round trip and wait for its latency.
+        """
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def close(self):
+        """
+        Remove the temporary snapshot.
+        """
+        os.remove(self.__path)
+
+    def __getitem__(self, name):
+        """
+        Retrieve a collection.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            LatencyCollection: The collection.
+        """
+        return LatencyCollection(self, self.__snapshot[name])
+
+    def __getattr__(self, name):
+        """
+        Retrieve a collection as an attribute, as pymongo does.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            LatencyCollection: The collection.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self[name]
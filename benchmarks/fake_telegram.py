@@ -0,0 +1,436 @@
+"""
+This script exercises the webhook mode of the bot end to end, in-process. A
+fake Telegram client posts updates to the WebhookServer as Telegram would,
+and a fake Telegram Bot API records the calls the bot makes to answer them.
+The dataset is generated, so neither Telegram nor MongoDB are needed:
+
+    python3 benchmarks/fake_telegram.py
+
+It fails when an update isn't answered, or a forged or malformed one isn't
+refused, so CI catches regressions of the webhook mode. The milliseconds
+from posting an update to the bot answering it are reported too.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+
+# Disable wrong import position, since the modules of the bot are only found
+# once its source directory is in the path
+# pylint: disable=C0413
+from telebot import apihelper  # noqa: E402
+
+from dataset import generate  # noqa: E402
+from fake_database import LatencyDatabase  # noqa: E402
+import isaacbot  # noqa: E402
+from controller import Controller  # noqa: E402
+from markups import TYPE_CODES  # noqa: E402
+from router import callback_data  # noqa: E402
+from webhook import SECRET_HEADER, WebhookServer  # noqa: E402
+
+TOKEN = '123456:FAKE'
+SECRET = 'fake-telegram-secret'
+WEBHOOK_PATH = '/webhook'
+
+# Seconds to wait for the bot to answer an update
+TIMEOUT = 5
+
+
+class FakeTelegram:
+    """
+    Fake Telegram Bot API, recording the calls made by the bot.
+
+    Attributes:
+        calls (list): (method, parameters, time) tuples of every call.
+        server (ThreadingHTTPServer): The underlying HTTP server.
+        __condition (threading.Condition): Notified on every call.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new instance of the FakeTelegram class, listening on a
+        free local port.
+        """
+        self.calls = []
+        self.__condition = threading.Condition()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.__handler())
+        self.server.daemon_threads = True
+
+    @property
+    def url(self):
+        """
+        Retrieves the URL template of the API, as used by telebot.
+
+        Returns:
+            str: The URL, with placeholders for the token and method.
+        """
+        port = self.server.server_address[1]
+        return f"http://127.0.0.1:{port}/bot{{0}}/{{1}}"
+
+    def __handler(self):
+        """
+        Build the request handler class bound to this API.
+
+        Returns:
+            type: A BaseHTTPRequestHandler subclass.
+        """
+        telegram = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Handles the requests made by the bot.
+            """
+
+            def do_GET(self):  # pylint: disable=C0103
+                """
+                Records a call and answers it.
+                """
+                url = urlparse(self.path)
+                params = dict(parse_qsl(url.query))
+                length = int(self.headers.get('Content-Length', 0))
+                if length:
+                    params.update(parse_qsl(
+                        self.rfile.read(length).decode('utf-8')))
+                method = url.path.rsplit('/', 1)[-1]
+                body = json.dumps({
+                    'ok': True,
+                    'result': telegram.record(method, params)
+                }).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, *args):  # pylint: disable=W0221
+                """
+                Silences the per-request access log.
+                """
+
+        return Handler
+
+    def record(self, method, params):
+        """
+        Record a call, building its result.
+
+        Args:
+            method (str): The Bot API method.
+            params (dict): The parameters of the call.
+
+        Returns:
+            The result of the call: the message sent or edited, or True.
+        """
+        with self.__condition:
+            self.calls.append((method, params, time.perf_counter()))
+            self.__condition.notify_all()
+
+        if not method.startswith(('send', 'edit')):
+            return True
+        return {
+            'message_id': int(params.get('message_id', len(self.calls))),
+            'date': int(time.time()),
+            'chat': {'id': int(params.get('chat_id', 0)), 'type': 'private'},
+            'text': params.get('text', '')
+        }
+
+    def wait(self, method, since):
+        """
+        Wait for the bot to call a method.
+
+        Args:
+            method (str): The Bot API method.
+            since (int): Number of calls made before the awaited one.
+
+        Returns:
+            tuple or None: The parameters and time of the call, or None if it
+            isn't made in time.
+        """
+        deadline = time.monotonic() + TIMEOUT
+        with self.__condition:
+            while True:
+                for name, params, called in self.calls[since:]:
+                    if name == method:
+                        return params, called
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.__condition.wait(remaining)
+
+    def start(self):
+        """
+        Serve the API from a background thread.
+        """
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+
+    def shutdown(self):
+        """
+        Stop serving.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class FakeClient:
+    """
+    Fake Telegram client posting updates to the webhook server.
+
+    Attributes:
+        __url (str): URL the updates are posted to.
+        __ids (itertools.count): Generates the IDs of the updates.
+    """
+
+    def __init__(self, address, path):
+        """
+        Initializes a new instance of the FakeClient class.
+
+        Args:
+            address (tuple): The (host, port) of the webhook server.
+            path (str): URL path the updates are posted to.
+        """
+        self.__url = f"http://127.0.0.1:{address[1]}{path}"
+        self.__ids = itertools.count(1)
+
+    def message(self, chat_id, text):
+        """
+        Build an update with a text message.
+
+        Args:
+            chat_id (int): The chat the message is sent from.
+            text (str): The text of the message.
+
+        Returns:
+            dict: The update.
+        """
+        update_id = next(self.__ids)
+        return {
+            'update_id': update_id,
+            'message': {
+                'message_id': update_id,
+                'from': {'id': chat_id, 'is_bot': False,
+                         'first_name': 'Isaac'},
+                'chat': {'id': chat_id, 'type': 'private'},
+                'date': int(time.time()),
+                'text': text
+            }
+        }
+
+    def callback(self, chat_id, data):
+        """
+        Build an update with a tapped button.
+
+        Args:
+            chat_id (int): The chat the button is tapped in.
+            data (str): The callback data of the button.
+
+        Returns:
+            dict: The update.
+        """
+        update = self.message(chat_id, 'Buttons')
+        message = update.pop('message')
+        update['callback_query'] = {
+            'id': str(update['update_id']),
+            'from': message['from'],
+            'chat_instance': str(chat_id),
+            'message': message,
+            'data': data
+        }
+        return update
+
+    def post(self, update, secret_token=SECRET, path=None):
+        """
+        Post an update, as Telegram does.
+
+        Args:
+            update (dict or bytes): The update, or a raw body.
+            secret_token (str, optional): The secret token sent, if any.
+            Defaults to the registered one.
+            path (str, optional): Path posted to instead of the webhook's.
+
+        Returns:
+            int: The HTTP status of the response, or 0 if there isn't one.
+        """
+        body = update if isinstance(update, bytes) else \
+            json.dumps(update).encode('utf-8')
+        url = self.__url if path is None else \
+            self.__url.rsplit('/', 1)[0] + path
+        request = urllib.request.Request(
+            url, data=body, headers={'Content-Type': 'application/json'})
+        if secret_token is not None:
+            request.add_header(SECRET_HEADER, secret_token)
+        try:
+            with urllib.request.urlopen(request, timeout=TIMEOUT) as response:
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+        except OSError:
+            # The server closed the connection without answering
+            return 0
+
+
+def check(description, passed, detail=''):
+    """
+    Print the outcome of a check.
+
+    Args:
+        description (str): What was checked.
+        passed (bool): Whether the check passed.
+        detail (str, optional): Printed after the outcome.
+
+    Returns:
+        bool: Whether the check passed.
+    """
+    print(f"{'ok' if passed else 'FAIL':<6}{description:<56}{detail}")
+    return passed
+
+
+def answered(telegram, client, update, method):
+    """
+    Post an update and wait for the bot to answer it.
+
+    Args:
+        telegram (FakeTelegram): The fake API.
+        client (FakeClient): The fake client.
+        update (dict): The update to post.
+        method (str): The Bot API method answering the update.
+
+    Returns:
+        tuple: The parameters of the answer, or None if it isn't answered,
+        and the milliseconds it took.
+    """
+    since = len(telegram.calls)
+    start = time.perf_counter()
+    if client.post(update) != 200:
+        return None, 0
+    call = telegram.wait(method, since)
+    if call is None:
+        return None, 0
+    params, called = call
+    return params, (called - start) * 1000
+
+
+def check_answered(telegram, client, dataset):
+    """
+    Check the bot answers the updates of every kind of handler.
+
+    Args:
+        telegram (FakeTelegram): The fake API.
+        client (FakeClient): The fake client.
+        dataset (dict): The generated dataset.
+
+    Returns:
+        bool: Whether every check passed.
+    """
+    name = dataset['Items'][0]['name']
+    elem_id = str(isaacbot.controller.get_id('items', name))
+    code = TYPE_CODES['items']
+    updates = [
+        ('/start', client.message(1, '/start'), 'sendPhoto', None),
+        ('/pickups', client.message(2, '/pickups'), 'sendMessage',
+         'reply_markup'),
+        ('item name', client.message(3, name), 'sendMessage', 'text'),
+        ('item button', client.callback(4, callback_data(code, elem_id)),
+         'editMessageText', 'text'),
+        ('item section button',
+         client.callback(5, callback_data(code, elem_id, 'Effects')),
+         'sendMessage', 'text'),
+        ('forged section button',
+         client.callback(6, callback_data(code, elem_id, 'Bogus')),
+         'answerCallbackQuery', None)
+    ]
+
+    passed = True
+    for description, update, method, field in updates:
+        params, milliseconds = answered(telegram, client, update, method)
+        passed &= check(f"{description} answered with {method}",
+                        params is not None and (not field or field in params),
+                        f"{milliseconds:.1f} ms" if params else '')
+    return passed
+
+
+def check_refused(webhook, telegram, client):
+    """
+    Check forged and malformed updates are refused, and not answered.
+
+    Args:
+        webhook (WebhookServer): The webhook server.
+        telegram (FakeTelegram): The fake API.
+        client (FakeClient): The fake client.
+
+    Returns:
+        bool: Whether every check passed.
+    """
+    passed = True
+    calls = len(telegram.calls)
+    forged = client.message(7, '/start')
+    passed &= check('update without the secret token refused',
+                    client.post(forged, secret_token=None) == 403)
+    passed &= check('update with a wrong secret token refused',
+                    client.post(forged, secret_token='forged') == 403)
+    passed &= check('update to an unknown path refused',
+                    client.post(forged, path='/unknown') == 404)
+    for body in (b'[]', b'"x"', b'not json'):
+        passed &= check(f"malformed body {body.decode()} refused",
+                        client.post(body) == 400)
+    passed &= check('malformed body refused in-process',
+                    webhook.submit(b'null', SECRET) == 400)
+    time.sleep(0.2)
+    passed &= check('refused updates not answered',
+                    len(telegram.calls) == calls)
+    return passed
+
+
+def main():
+    """
+    Exercise the webhook mode against a fake Telegram.
+
+    Returns:
+        int: Exit status, 1 if a check failed.
+    """
+    parser = argparse.ArgumentParser(
+        description='Exercise the webhook mode against a fake Telegram.')
+    parser.add_argument('--size', type=int, default=1000,
+                        help='elements in the dataset')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the generated dataset')
+    args = parser.parse_args()
+
+    dataset = generate(args.size, args.seed)
+    database = LatencyDatabase(dataset)
+    telegram = FakeTelegram()
+    telegram.start()
+    apihelper.API_URL = telegram.url
+    isaacbot.bot.token = TOKEN
+    isaacbot.controller.set(Controller(database))
+    webhook = WebhookServer(isaacbot.bot, SECRET, address=('127.0.0.1', 0),
+                            path=WEBHOOK_PATH)
+    webhook.start()
+    try:
+        client = FakeClient(webhook.address, WEBHOOK_PATH)
+        passed = check_answered(telegram, client, dataset)
+        passed &= check_refused(webhook, telegram, client)
+    finally:
+        webhook.shutdown()
+        telegram.shutdown()
+        database.close()
+    return 0 if passed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""
+This script measures the hot paths of the bot: searching, rendering elements
+and sections, building list keyboards and routing callbacks. It seeds a local
+stand-in for MongoDB with a generated dataset, simulating the latency of
+every round trip, and reports latency percentiles and round trips per
+operation:
+
+    python3 benchmarks/hot_paths.py --size 2000 --latency-ms 1
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import argparse
+import itertools
+import os
+import statistics
+import sys
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, SRC)
+
+# Disable wrong import position, since the modules of the bot are only found
+# once its source directory is in the path
+# pylint: disable=C0413
+from dataset import generate  # noqa: E402
+from fake_database import LatencyDatabase  # noqa: E402
+import isaacbot  # noqa: E402
+from characters import Character  # noqa: E402
+from controller import Controller  # noqa: E402
+from markups import Markup, TYPE_CODES  # noqa: E402
+from router import callback_data  # noqa: E402
+
+
+def measure(operation, iterations, database, setup=None):
+    """
+    Run an operation repeatedly, timing every run.
+
+    Args:
+        operation (callable): The operation, called without arguments.
+        iterations (int): Number of runs.
+        database (LatencyDatabase): The database counting round trips.
+        setup (callable, optional): Called before every run, untimed.
+
+    Returns:
+        tuple: The milliseconds of every run, and the round trips per run.
+    """
+    times = []
+    round_trips = 0
+    for _ in range(iterations):
+        if setup:
+            setup()
+        start_trips = database.round_trips
+        start = time.perf_counter()
+        operation()
+        times.append((time.perf_counter() - start) * 1000)
+        round_trips += database.round_trips - start_trips
+    return times, round_trips / iterations
+
+
+def percentiles(times):
+    """
+    Compute the latency percentiles of an operation.
+
+    Args:
+        times (list): The milliseconds of every run.
+
+    Returns:
+        tuple: The p50, p90, p99 and max milliseconds.
+    """
+    if len(times) < 2:
+        return times[0], times[0], times[0], times[0]
+    cuts = statistics.quantiles(times, n=100, method='inclusive')
+    return cuts[49], cuts[89], cuts[98], max(times)
+
+
+def report(name, times, round_trips):
+    """
+    Print the latency percentiles and round trips of an operation.
+
+    Args:
+        name (str): The operation name.
+        times (list): The milliseconds of every run.
+        round_trips (float): The round trips per run.
+    """
+    columns = ''.join(f"{value:>10.3f}" for value in percentiles(times))
+    print(f"{name:<28}{columns}{round_trips:>10.2f}")
+
+
+def operations(controller, dataset):
+    """
+    Build the operations to measure.
+
+    Args:
+        controller (Controller): The controller over the seeded database.
+        dataset (dict): The seeded dataset.
+
+    Returns:
+        dict: Maps operation names to their operation and setup.
+    """
+    items = itertools.cycle(item['name'] for item in dataset['Items'])
+    item = dataset['Items'][0]['name']
+    character = dataset['Characters'][0]
+    buttons = controller.get_list_buttons('items')
+    data = callback_data(TYPE_CODES['items'],
+                         str(controller.get_id('items', item)), 'Effects')
+    cold = controller.render_cache.clear
+
+    def search_typo():
+        name = next(items)
+        # Swap two letters, as a typing mistake would
+        return controller.search_element(name[1] + name[0] + name[2:])
+
+    def correct_typos():
+        name = next(items)
+        # Swap the first and the last two letters, two typing mistakes
+        return controller.name_index.correct(
+            name[1] + name[0] + name[2:-2] + name[-1] + name[-2])
+
+    def list_keyboard():
+        controller.list_cache.clear()
+        return Markup.markup_entity(
+            'items', controller.get_list_buttons('items'))
+
+    return {
+        'search_element hit (cold)': (
+            lambda: controller.search_element(next(items)), cold),
+        'search_element typo (cold)': (search_typo, cold),
+        'correct two typos': (correct_typos, None),
+        'search_element miss': (
+            lambda: controller.search_element('qzxj wvkp'), None),
+        'complete_element': (
+            lambda: controller.complete_element(next(items)[:3]), None),
+        'get_element (cold)': (
+            lambda: controller.get_element('items', next(items)), cold),
+        'get_element (warm)': (
+            lambda: controller.get_element('items', item), None),
+        'get_element_section (cold)': (
+            lambda: controller.get_element_section('Effects', next(items)),
+            cold),
+        'Character.to_str': (lambda: Character.to_str(character), None),
+        'markup_entity (cold)': (
+            lambda: Markup.markup_entity('items', buttons),
+            Markup.markup_entity.cache_clear),
+        'markup_entity (warm)': (
+            lambda: Markup.markup_entity('items', buttons), None),
+        'list keyboard (cold)': (
+            list_keyboard, Markup.markup_entity.cache_clear),
+        'list keyboard (warm)': (
+            lambda: Markup.markup_entity(
+                'items', controller.get_list_buttons('items')), None),
+        'dispatch': (lambda: isaacbot.router.resolve(data), None)
+    }
+
+
+def main():
+    """
+    Measure the hot paths over a generated dataset.
+    """
+    parser = argparse.ArgumentParser(
+        description='Measure the hot paths of the bot.')
+    parser.add_argument('--size', type=int, default=2000,
+                        help='elements in the dataset')
+    parser.add_argument('--latency-ms', type=float, default=1.0,
+                        help='simulated latency of every round trip')
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='runs per operation')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the generated dataset')
+    args = parser.parse_args()
+
+    dataset = generate(args.size, args.seed)
+    database = LatencyDatabase(dataset, args.latency_ms / 1000)
+    try:
+        print(f"{'operation':<28}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}"
+              f"{'max ms':>10}{'trips':>10}")
+        controllers = []
+        times, round_trips = measure(
+            lambda: controllers.append(Controller(database)), 1, database)
+        report('bootstrap', times, round_trips)
+
+        for name, (operation, setup) in operations(
+                controllers[0], dataset).items():
+            report(name, *measure(operation, args.iterations, database,
+                                  setup))
+    finally:
+        database.close()
+
+
+if __name__ == '__main__':
+    main()
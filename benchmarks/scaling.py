@@ -0,0 +1,89 @@
+"""
+This script measures how the hot paths of the bot scale with the size of
+the dataset, running them over generated datasets of increasing size. The
+median latency of every operation is printed per size, or as CSV for
+charting:
+
+    python3 benchmarks/scaling.py --sizes 1000,10000,100000 --csv
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import argparse
+
+# The hot paths module puts the source directory of the bot in the path, so
+# it goes first
+from hot_paths import Controller, measure, operations, percentiles
+from dataset import generate
+from fake_database import LatencyDatabase
+
+
+def measure_size(size, iterations, latency, seed):
+    """
+    Measure every operation over a dataset of a size.
+
+    Args:
+        size (int): Number of elements in the dataset.
+        iterations (int): Runs per operation.
+        latency (float): Seconds every round trip takes.
+        seed (int): Seed of the generated dataset.
+
+    Returns:
+        dict: Maps operation names to their median milliseconds.
+    """
+    dataset = generate(size, seed)
+    database = LatencyDatabase(dataset, latency)
+    try:
+        controllers = []
+        times, _ = measure(
+            lambda: controllers.append(Controller(database)), 1, database)
+        medians = {'bootstrap': times[0]}
+        for name, (operation, setup) in operations(
+                controllers[0], dataset).items():
+            times, _ = measure(operation, iterations, database, setup)
+            medians[name] = percentiles(times)[0]
+        return medians
+    finally:
+        database.close()
+
+
+def main():
+    """
+    Measure the hot paths over datasets of increasing size.
+    """
+    parser = argparse.ArgumentParser(
+        description='Measure how the hot paths scale with the dataset.')
+    parser.add_argument('--sizes', default='1000,10000,100000',
+                        help='comma separated dataset sizes')
+    parser.add_argument('--latency-ms', type=float, default=0.0,
+                        help='simulated latency of every round trip')
+    parser.add_argument('--iterations', type=int, default=50,
+                        help='runs per operation')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='seed of the generated datasets')
+    parser.add_argument('--csv', action='store_true',
+                        help='print CSV instead of a table')
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    results = {size: measure_size(size, args.iterations,
+                                  args.latency_ms / 1000, args.seed)
+               for size in sizes}
+
+    names = list(results[sizes[0]])
+    if args.csv:
+        print(','.join(['operation'] + [str(size) for size in sizes]))
+        for name in names:
+            print(','.join([name] + [f"{results[size][name]:.3f}"
+                                     for size in sizes]))
+        return
+
+    print(f"{'median ms':<28}" + ''.join(f"{size:>12}" for size in sizes))
+    for name in names:
+        print(f"{name:<28}" + ''.join(f"{results[size][name]:>12.3f}"
+                                      for size in sizes))
+
+
+if __name__ == '__main__':
+    main()
@@ -66,6 +66,20 @@ class Achievement:
         number = int(self.__number)
         return 1 <= number <= 637
 
+    def get_list_elements(self, database):
+        """
+        Retrieve a list of achievement numbers from the provided database.
+
+        Args:
+            database: A database object with an Achievements collection.
+
+        Returns:
+            A list of achievement numbers extracted from the Achievements
+            collection in the database.
+        """
+        achievements = database.Achievements.find({}, {'_id': 0, 'number': 1})
+        return [achievement.get('number') for achievement in achievements]
+
     def get_element(self, database):
         """
         Retrieves the description and details of the achievement if it exists.
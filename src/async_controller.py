@@ -0,0 +1,265 @@
+"""
+This module provides an asynchronous controller for the asyncio runtime of
+the bot, fetching game elements with the Motor MongoDB driver.
+
+The in-memory indexes and caches are shared with a synchronous Controller,
+so only cache misses reach the database, without blocking the event loop.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+from achievements import Achievement
+from cards import DECKS_PIPELINE
+from controller import find_deck, normalize_query
+
+# Collection of every element type
+COLLECTIONS = {
+    'achievements': 'Achievements',
+    'pickups': 'Pickups',
+    'runes': 'Runes',
+    'soulstones': 'SoulStones',
+    'cards': 'Cards',
+    'curses': 'Curses',
+    'pills': 'Pills',
+    'transformations': 'Transformations',
+    'challenges': 'Challenges',
+    'characters': 'Characters',
+    'items': 'Items',
+    'trinkets': 'Trinkets'
+}
+
+
+class AsyncController:
+    """
+    The AsyncController class handles the searching and retrieval of game
+    element information with non-blocking database access.
+
+    Attributes:
+        controller (Controller): Controller owning the in-memory indexes and
+        caches.
+        database: A Motor database object, or None to serve everything from
+        the controller's own (local) database.
+    """
+
+    def __init__(self, controller, database=None):
+        """
+        Initializes a new instance of the AsyncController class.
+
+        Args:
+            controller (Controller): Controller owning the in-memory indexes
+            and caches.
+            database (optional): A Motor database object. Defaults to None,
+            which serves everything from the controller's own database.
+        """
+        self.controller = controller
+        self.database = database
+
+    async def get_list_elements(self, elem_type, deck=False):
+        """
+        Get a list of elements of a specified type from the database.
+
+        Args:
+            elem_type (str): The type of elements to retrieve.
+            deck (bool, optional): Whether to retrieve elements associated with
+            a deck. Defaults to False.
+
+        Returns:
+            tuple: The elements of the specified type.
+        """
+        if self.database is None:
+            return self.controller.get_list_elements(elem_type, deck)
+
+        key = (elem_type, deck)
+        elements = self.controller.list_cache.get(key)
+        if elements is None:
+            collection = self.database[COLLECTIONS[elem_type]]
+            if elem_type == 'cards' and not deck:
+                cursor, field = collection.aggregate(DECKS_PIPELINE), '_id'
+            elif deck:
+                cursor = collection.find({'deck': deck},
+                                         {'_id': 0, 'name': 1})
+                field = 'name'
+            else:
+                cursor = collection.find({}, {'_id': 0, 'name': 1})
+                field = 'name'
+            elements = tuple(document.get(field)
+                             for document in await cursor.to_list(None))
+            self.controller.list_cache[key] = elements
+        return elements
+
+    async def get_list_buttons(self, elem_type, deck=False):
+        """
+        Get the label and ID of the buttons choosing the elements of a list.
+
+        Args:
+            elem_type (str): The type of elements to retrieve.
+            deck (bool, optional): Whether to retrieve elements associated with
+            a deck. Defaults to False.
+
+        Returns:
+            Buttons: (label, id) tuples of the elements of the list.
+        """
+        return self.controller.to_buttons(
+            elem_type, await self.get_list_elements(elem_type, deck), deck)
+
+    async def get_name(self, elem_type, elem_id):
+        """
+        Get the name of the element with an ID.
+
+        Args:
+            elem_type (str): The type of the element, or 'decks' for a deck.
+            elem_id (str): The ID of the element, as found in a button.
+
+        Returns:
+            str or None: The name, or None if there isn't such element.
+        """
+        if elem_type == 'decks':
+            # Decks are listed from the database
+            return find_deck(await self.get_list_elements('cards'), elem_id)
+        return self.controller.get_name(elem_type, elem_id)
+
+    def get_id(self, elem_type, name):
+        """
+        Get the ID of an element, used to refer to it in buttons.
+
+        Args:
+            elem_type (str): The type of the element.
+            name (str): The name of the element.
+
+        Returns:
+            int or None: The ID, or None if the element isn't indexed.
+        """
+        return self.controller.get_id(elem_type, name)
+
+    async def get_element(self, elem_type, elem_id):
+        """
+        Get a specific element of a specified type from the database.
+
+        Args:
+            elem_type (str): The type of element to retrieve.
+            elem_id: The unique identifier of the element.
+
+        Returns:
+            str or bool: The rendered element, or False if it doesn't exist.
+        """
+        if self.database is None:
+            return self.controller.get_element(elem_type, elem_id)
+
+        key = (elem_type, elem_id)
+        result = self.controller.get_cached(key)
+        if result is None:
+            generation = self.controller.render_cache.generation
+            collection = self.database[COLLECTIONS[elem_type]]
+            element_class = self.controller.element_types[elem_type]
+            if elem_type == 'achievements':
+                if not Achievement(elem_id).check_achievement():
+                    return False
+                document = await collection.find_one({'number': elem_id})
+            else:
+                # Items and trinkets only fetch the fields they render
+                document = await collection.find_one(
+                    {'name': elem_id}, getattr(element_class, 'FIELDS', None))
+            result = element_class.to_str(document)
+            self.controller.render_cache.put(key, result, generation)
+        return result
+
+    async def search_element(self, query, exact=False):
+        """
+        Searches for the given query among different game elements and returns
+        the corresponding information if found.
+
+        Args:
+            query (str): The query to search for.
+            exact (bool): Flag indicating whether an exact match is required.
+            (default: False)
+
+        Returns:
+            tuple, list or bool: As Controller.search_element.
+        """
+        result = self.controller.match_element(query, exact)
+        if isinstance(result, tuple):
+            elem_type, name = result
+            return await self.get_element(elem_type, name), elem_type, name
+        return result
+
+    async def inline_elements(self, query):
+        """
+        Retrieves the rendered elements completing an inline query.
+
+        Args:
+            query (str): The inline query.
+
+        Returns:
+            tuple: As Controller.inline_elements.
+        """
+        if self.database is None:
+            return self.controller.inline_elements(query)
+
+        key = normalize_query(query)
+        result = self.controller.inline_cache.get(key)
+        if result is None:
+            generation = self.controller.inline_cache.generation
+            result = tuple([
+                (name, elem_type, elem_id,
+                 await self.get_element(elem_type, name))
+                for name, elem_type, elem_id
+                in self.controller.complete_element(key)
+            ]) if key else ()
+            self.controller.inline_cache.put(key, result, generation)
+        return result
+
+    async def get_element_section(self, section, element):
+        """
+        Retrieves a specific section of information for a given game element.
+
+        Args:
+            section (str): The section to retrieve info.
+            element (str): The element to be inspected.
+
+        Returns:
+            str: The requested section of information for the specified game
+            element.
+        """
+        if self.database is None:
+            return self.controller.get_element_section(section, element)
+
+        elem_type = self.controller.name_index.get_type(element)
+        if elem_type in ('items', 'trinkets'):
+            key = (elem_type, element, section)
+            result = self.controller.get_cached(key)
+            if result is None:
+                generation = self.controller.render_cache.generation
+                document = await self.database[
+                    COLLECTIONS[elem_type]].find_one(
+                        {'name': element}, {'_id': 0, section.lower(): 1})
+                result = self.controller.element_types[
+                    elem_type].section_to_str(document, section)
+                self.controller.render_cache.put(key, result, generation)
+            return result
+        return f"No information was found for section *{section}*."
+
+    def get_reply(self, command, reply_type):
+        """
+        Get a reply message based on a command and reply type.
+
+        Args:
+            command (str): The command to which the reply is associated.
+            reply_type (str): The type of the reply.
+
+        Returns:
+            str: The reply message.
+        """
+        return self.controller.get_reply(command, reply_type)
+
+    def find_elements(self, words):
+        """
+        Finds the game elements whose sections best match the given words.
+
+        Args:
+            words (str): The words to search for.
+
+        Returns:
+            list: (name, type, id) tuples of the matching game elements.
+        """
+        return self.controller.find_elements(words)
@@ -0,0 +1,262 @@
+"""
+This module provides the bootstrap of the bot: reading its settings from the
+environment and creating its data backends and controller.
+
+Nothing here runs at import time. Backends are created when first needed, so
+the controller, the entity classes and the bot modules can be imported
+without connecting to MongoDB or prompting for tokens.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+# Disable import outside toplevel, since the database drivers are only
+# imported by the runtime that needs them.
+# pylint: disable=C0415
+
+import logging
+import os
+import signal
+import threading
+
+from dotenv import load_dotenv
+
+from controller import Controller
+from metrics import MeteredDatabase, MetricsServer, watch_controller
+from packed_snapshot import PackedSnapshot
+from snapshot import SnapshotDatabase
+
+logger = logging.getLogger(__name__)
+
+# Prompts for the settings that can be typed in when missing
+PROMPTS = {
+    'TOKEN': '\nPlease enter a valid Telegram Bot Token: ',
+    'MONGO_TOKEN': '\nPlease enter a valid MongoDB Atlas Token: ',
+    'WEBHOOK_SECRET': '\nPlease enter the secret token of the webhook: '
+}
+
+
+def load_environment(path='.env'):
+    """
+    Load the settings of a dotenv file into the environment.
+
+    Args:
+        path (str, optional): Path of the dotenv file. Defaults to '.env'.
+    """
+    load_dotenv(dotenv_path=path)
+
+
+def get_setting(name):
+    """
+    Retrieve a setting from the environment, prompting for it if it's
+    missing and can be typed in.
+
+    Args:
+        name (str): The name of the setting.
+
+    Returns:
+        str or None: The value of the setting.
+    """
+    value = os.getenv(name)
+    if not value and name in PROMPTS:
+        value = input(PROMPTS[name])
+        os.environ[name] = value
+    return value
+
+
+def create_database():
+    """
+    Create the database backend: the local snapshot if SNAPSHOT_PATH is set,
+    or MongoDB Atlas otherwise.
+
+    Returns:
+        MeteredDatabase: A SnapshotDatabase or a pymongo database object,
+        counting the queries made to it.
+    """
+    # Serve from a local snapshot when available, so MongoDB Atlas isn't needed
+    if os.getenv('SNAPSHOT_PATH'):
+        return MeteredDatabase(SnapshotDatabase(os.getenv('SNAPSHOT_PATH')))
+
+    import pymongo
+    client = pymongo.MongoClient(get_setting('MONGO_TOKEN'),
+                                 serverSelectionTimeoutMS=2000,
+                                 event_listeners=[create_query_tracer()])
+    return MeteredDatabase(client.Isaac)
+
+
+def create_query_tracer():
+    """
+    Create the tracer of the MongoDB commands, logging the commands slower
+    than MONGO_SLOW_MS (100 by default) and the updates making more than
+    MONGO_MAX_COMMANDS commands (10 by default).
+
+    Returns:
+        QueryTracer: The command listener.
+    """
+    from query_tracer import QueryTracer
+    return QueryTracer(float(os.getenv('MONGO_SLOW_MS', '100')),
+                       int(os.getenv('MONGO_MAX_COMMANDS', '10')))
+
+
+def create_packed_snapshot():
+    """
+    Open the packed snapshot if PACKED_SNAPSHOT_PATH is set.
+
+    Returns:
+        PackedSnapshot or None: The packed snapshot, if any.
+    """
+    path = os.getenv('PACKED_SNAPSHOT_PATH')
+    return PackedSnapshot(path) if path else None
+
+
+def create_controller(prewarm=False):
+    """
+    Create a controller over the backends configured in the environment.
+
+    Args:
+        prewarm (bool, optional): Whether to render every searchable element
+        upfront. Defaults to False.
+
+    Returns:
+        Controller: The controller, with its indexes loaded.
+    """
+    return Controller(create_database(), create_packed_snapshot(), prewarm)
+
+
+def create_async_controller():
+    """
+    Create an asynchronous controller over the backends configured in the
+    environment, fetching from MongoDB Atlas with Motor unless a local
+    snapshot is used.
+
+    Returns:
+        AsyncController: The asynchronous controller.
+    """
+    from async_controller import AsyncController
+
+    controller = create_controller()
+    if os.getenv('SNAPSHOT_PATH'):
+        # The snapshot is local, so there is no network I/O to wait for
+        return AsyncController(controller)
+
+    from motor.motor_asyncio import AsyncIOMotorClient
+    client = AsyncIOMotorClient(get_setting('MONGO_TOKEN'),
+                                serverSelectionTimeoutMS=2000,
+                                event_listeners=[create_query_tracer()])
+    return AsyncController(controller, MeteredDatabase(client.Isaac))
+
+
+def start_metrics_server(controller):
+    """
+    Serve the metrics in the background if METRICS_PORT is set, exposing the
+    caches of a controller.
+
+    The server listens on METRICS_HOST, 127.0.0.1 by default, so the metrics
+    are only reachable locally.
+
+    Args:
+        controller (Controller): The controller whose caches are exposed.
+
+    Returns:
+        MetricsServer or None: The server, if started.
+    """
+    port = os.getenv('METRICS_PORT')
+    if not port:
+        return None
+
+    watch_controller(controller)
+    server = MetricsServer(
+        address=(os.getenv('METRICS_HOST', '127.0.0.1'), int(port)))
+    server.start()
+    return server
+
+
+def reload_on_hangup(controller):
+    """
+    Reload the dataset of a controller whenever the process receives SIGHUP
+    (kill -HUP <pid>), so changes in the dataset are picked up without
+    restarting the bot.
+
+    The reload runs in the background, so updates are served from the
+    previous indexes meanwhile. Reloads don't overlap.
+
+    Args:
+        controller (Controller): The controller to reload.
+
+    Returns:
+        bool: Whether the signal handler was installed, since SIGHUP isn't
+        available on every platform.
+    """
+    if not hasattr(signal, 'SIGHUP'):
+        return False
+
+    lock = threading.Lock()
+
+    def reload():
+        with lock:
+            logger.info("Reloading the dataset")
+            controller.reload()
+            logger.info("Dataset reloaded")
+
+    signal.signal(signal.SIGHUP, lambda *_: threading.Thread(
+        target=reload, name='reload', daemon=True).start())
+    return True
+
+
+class Lazy:
+    """
+    Proxy to an object created on first use, unless one is injected before.
+
+    Attributes:
+        __factory (callable): Creates the object.
+        __target: The object, once created or injected.
+        __lock (threading.Lock): Makes sure the object is created once.
+    """
+
+    def __init__(self, factory):
+        """
+        Initializes a new instance of the Lazy class.
+
+        Args:
+            factory (callable): Creates the object when called without
+            arguments.
+        """
+        self.__factory = factory
+        self.__target = None
+        self.__lock = threading.Lock()
+
+    def set(self, target):
+        """
+        Inject the object, instead of creating it.
+
+        Args:
+            target: The object to proxy.
+        """
+        self.__target = target
+
+    def get(self):
+        """
+        Retrieve the object, creating it if needed.
+
+        Returns:
+            The proxied object.
+        """
+        if self.__target is None:
+            with self.__lock:
+                if self.__target is None:
+                    self.__target = self.__factory()
+        return self.__target
+
+    def __getattr__(self, name):
+        """
+        Retrieve an attribute of the proxied object.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            The attribute of the proxied object.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
@@ -5,7 +5,12 @@ Author: Carlos Morales Aguilera
 Date: 04-Nov-2023
 """
 
-from collections import OrderedDict
+# Group decks on the server, in order of their first card
+DECKS_PIPELINE = [
+    {'$match': {'deck': {'$ne': None}}},
+    {'$group': {'_id': '$deck', 'first': {'$min': '$_id'}}},
+    {'$sort': {'first': 1}}
+]
 
 
 class Card:
@@ -65,17 +70,24 @@ class Card:
             list: A list of unique 'deck' values found in the collection.
         """
         if deck:
-            cards = database.Cards.find({'deck': deck})
+            cards = database.Cards.find({'deck': deck}, {'_id': 0, 'name': 1})
             return [card.get('name') for card in cards]
 
-        cards = database.Cards.find({})
-        decks = OrderedDict()
-        for card in cards:
-            deck = card.get('deck')
-            if deck is not None:
-                decks[deck] = None
+        decks = database.Cards.aggregate(DECKS_PIPELINE)
+        return [deck.get('_id') for deck in decks]
 
-        return list(decks.keys())
+    def get_names(self, database):
+        """
+        Retrieve a list of every card name from the provided database.
+
+        Args:
+            database: A database object with a Cards collection.
+
+        Returns:
+            list: A list of card names from every deck.
+        """
+        cards = database.Cards.find({}, {'_id': 0, 'name': 1})
+        return [card.get('name') for card in cards]
 
     def get_element(self, database):
         """
@@ -5,6 +5,8 @@ Author: Carlos Morales Aguilera
 Date: 05-Nov-2023
 """
 
+from emojis import Emojis
+
 
 class Challenge:
     """
@@ -24,7 +26,7 @@ class Challenge:
         self.__name = name
 
     @staticmethod
-    def to_str(challenge, database):
+    def to_str(challenge):
         """
         Convert a challenge to a formatted string representation.
 
@@ -46,12 +48,12 @@ class Challenge:
         # Add character
         item_values.append(
             Challenge.get_dict_values(
-                'Character', challenge.get('character'), database))
+                'Character', challenge.get('character')))
 
         # Add conditions
         item_values.append(
             Challenge.get_dict_values(
-                'Conditions', challenge.get('conditions'), database))
+                'Conditions', challenge.get('conditions')))
 
         # Add goal
         item_values.append(f"*Goal:* {challenge.get('goal')}.")
@@ -66,7 +68,7 @@ class Challenge:
         return "\n\n".join(item_values)
 
     @staticmethod
-    def get_dict_values(section, dictionary, database):
+    def get_dict_values(section, dictionary):
         """
         Generate formatted content from a dictionary with optional emoji
         support.
@@ -75,7 +77,6 @@ class Challenge:
             section (str): The section label to include in the content.
             dictionary (dict): The dictionary containing key-value pairs to
             format.
-            database: The database object for emoji retrieval.
 
         Returns:
             str: Formatted content with keys and values, including emoji if
@@ -84,14 +85,8 @@ class Challenge:
         content = [f"*{section}*:"]
         for key, value in dictionary.items():
             # Retrieve emoji if defined
-            format_key = database.Emojis.find_one({'key': key.title()})
-            format_val = database.Emojis.find_one({'key': str(value).title()})
-            if format_key:
-                format_key = format_key.get('value').encode('utf-8').decode(
-                    'unicode_escape')
-            if format_val:
-                format_val = format_val.get('value').encode('utf-8').decode(
-                        'unicode_escape')
+            format_key = Emojis.get(key.title())
+            format_val = Emojis.get(str(value).title())
             if isinstance(value, dict):
                 format_key = "Items"
                 content_dict = ['']
@@ -124,7 +119,7 @@ class Challenge:
             A list of challenge names extracted from the Challenges collection
             in the database.
         """
-        challenges = database.Challenges.find({})
+        challenges = database.Challenges.find({}, {'_id': 0, 'name': 1})
         return [challenge.get('name') for challenge in challenges]
 
     def get_element(self, database):
@@ -135,4 +130,4 @@ class Challenge:
             str: Description and details of the challenge
         """
         challenge = database.Challenges.find_one({"name": self.__name})
-        return self.to_str(challenge, database)
+        return self.to_str(challenge)
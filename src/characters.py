@@ -9,6 +9,8 @@ Date: 08-Nov-2023
 # dict formatting from Challenges entity class.
 # pylint: disable=R0801
 
+from emojis import Emojis
+
 
 class Character:
     """
@@ -28,7 +30,7 @@ class Character:
         self.__name = name
 
     @staticmethod
-    def to_str(character, database):
+    def to_str(character):
         """
         Convert a character to a formatted string representation.
 
@@ -49,8 +51,7 @@ class Character:
 
         # Add health
         item_values.append(
-            Character.get_health_values('Health', character.get('health'),
-                                        database))
+            Character.get_health_values('Health', character.get('health')))
 
         # Add unlock
         item_values.append(f"*Unlock method*: {character.get('unlock')}")
@@ -58,8 +59,7 @@ class Character:
         # Add pickups
         if character.get('pickups'):
             item_values.append(
-                Character.get_dict_values('Pickups', character.get('pickups'),
-                                          database))
+                Character.get_dict_values('Pickups', character.get('pickups')))
 
         # Add items
         if character.get('items'):
@@ -75,7 +75,7 @@ class Character:
         return "\n\n".join(item_values)
 
     @staticmethod
-    def get_health_values(section, dictionary, database):
+    def get_health_values(section, dictionary):
         """
         Generate healthformatted content from a dictionary with emoji
         support.
@@ -84,7 +84,6 @@ class Character:
             section (str): The section label to include in the content.
             dictionary (dict): The dictionary containing key-value pairs to
             format.
-            database: The database object for emoji retrieval.
 
         Returns:
             str: Formatted content with keys and values, including emoji if
@@ -94,13 +93,10 @@ class Character:
         for key, value in dictionary.items():
             if isinstance(value, dict):
                 content.append(
-                    Character.get_health_values(key, value, database))
+                    Character.get_health_values(key, value))
             else:
                 # Retrieve emoji if defined
-                emoji = database.Emojis.find_one({'key': key.title()})
-                if emoji:
-                    emoji = emoji.get('value').encode('utf-8').decode(
-                        'unicode_escape')
+                emoji = Emojis.get(key.title())
                 if isinstance(value, bool):
                     health = 1
                 else:
@@ -132,7 +128,7 @@ class Character:
         return "\n".join(content)
 
     @staticmethod
-    def get_dict_values(section, dictionary, database):
+    def get_dict_values(section, dictionary):
         """
         Generate formatted content from a dictionary with optional emoji
         support.
@@ -141,7 +137,6 @@ class Character:
             section (str): The section label to include in the content.
             dictionary (dict): The dictionary containing key-value pairs to
             format.
-            database: The database object for emoji retrieval.
 
         Returns:
             str: Formatted content with keys and values, including emoji if
@@ -150,14 +145,8 @@ class Character:
         content = [f"*{section}*:"]
         for key, value in dictionary.items():
             # Retrieve emoji if defined
-            format_key = database.Emojis.find_one({'key': key.title()})
-            format_val = database.Emojis.find_one({'key': str(value).title()})
-            if format_key:
-                format_key = format_key.get('value').encode('utf-8').decode(
-                    'unicode_escape')
-            if format_val:
-                format_val = format_val.get('value').encode('utf-8').decode(
-                    'unicode_escape')
+            format_key = Emojis.get(key.title())
+            format_val = Emojis.get(str(value).title())
             if isinstance(value, dict):
                 content_dict = ['']
                 for key_dict, value_dict in value.items():
@@ -189,7 +178,7 @@ class Character:
             A list of character names extracted from the Characters collection
             in the database.
         """
-        characters = database.Characters.find({})
+        characters = database.Characters.find({}, {'_id': 0, 'name': 1})
         return [character.get('name') for character in characters]
 
     def get_element(self, database):
@@ -200,4 +189,4 @@ class Character:
             str: Description and details of the character
         """
         character = database.Characters.find_one({"name": self.__name})
-        return self.to_str(character, database)
+        return self.to_str(character)
@@ -11,12 +11,15 @@ Date: 04-Nov-2023
 # still be respected.
 # pylint: disable=C0411
 
-import os
-import pymongo
-from dotenv import load_dotenv
+# Disable too many instance attributes, since the controller owns every
+# in-memory index and cache of the dataset.
+# pylint: disable=R0902
+
+from functools import partial
 
 from achievements import Achievement
 from cards import Card
+from emojis import Emojis
 from challenges import Challenge
 from characters import Character
 from curses import Curse
@@ -27,15 +30,66 @@ from soulstones import SoulStone
 from transformations import Transformation
 from items import Item
 from trinkets import Trinket
+from name_index import NameIndex, stable_id
+from packed_snapshot import PackedSnapshot
+from render_cache import RenderCache
+from single_flight import SingleFlight
+from text_index import TextIndex
+
+
+def normalize_query(query):
+    """
+    Normalizes an inline query, so queries differing only in case or spacing
+    share their results.
+
+    Args:
+        query (str): The query to normalize.
 
-load_dotenv(dotenv_path='.env')
+    Returns:
+        str: The casefolded query with single spaces.
+    """
+    return ' '.join(query.split()).casefold()
+
+
+def find_deck(decks, elem_id):
+    """
+    Finds the deck with an ID, derived from its name since decks aren't
+    indexed.
 
-MONGO_TOKEN = os.getenv('MONGO_TOKEN')
-if not MONGO_TOKEN:
-    MONGO_TOKEN = input('\nPlease enter a valid MongoDB Atlas Token: ')
+    Args:
+        decks (tuple): The decks of the cards.
+        elem_id (str): The ID of the deck, as found in a button.
+
+    Returns:
+        str or None: The deck, or None if there isn't such deck.
+    """
+    for deck in decks:
+        if str(stable_id(deck)) == elem_id:
+            return deck
+    return None
+
+
+class Buttons(tuple):
+    """
+    (label, id) tuples of the buttons of a list. The hash is computed once,
+    since the same buttons key the markup cache on every list command.
+    """
+
+    def __hash__(self):
+        """
+        Retrieve the hash of the buttons, computing it on first use.
 
-client = pymongo.MongoClient(MONGO_TOKEN, serverSelectionTimeoutMS=2000)
-database = client.Isaac
+        Returns:
+            int: The hash.
+        """
+        try:
+            return self.__hash
+        except AttributeError:
+            # Disable attribute defined outside __init__, since tuples are
+            # built in __new__
+            # pylint: disable=W0201
+            self.__hash = super().__hash__()
+            return self.__hash
 
 
 class Controller:
@@ -43,11 +97,15 @@ class Controller:
     The Controller class handles the searching and retrieval of game element
     information.
 
+    The data backends are injected, so importing this module doesn't
+    connect to anything. See bootstrap.py for creating them from the
+    environment.
+
     Methods:
         - get_achievement(number): Retrieves the info of a specific
         achievement.
     """
-    def __init__(self):
+    def __init__(self, database, packed_snapshot=None, prewarm=False):
         """
         Initializes an instance of a class with a dictionary that maps element
         types to their respective classes.
@@ -60,7 +118,14 @@ class Controller:
 
         Parameters:
         - self: The instance of the class to be initialized.
+        - database: A pymongo database object, or a SnapshotDatabase.
+        - packed_snapshot (PackedSnapshot): Pre-rendered elements served
+        before the render cache, if available.
+        - prewarm (bool): Whether to render every searchable element upfront
+        instead of on first use.
         """
+        self.database = database
+        self.packed_snapshot = packed_snapshot
         self.element_types = {
             'achievements': Achievement,
             'pickups': Pickup,
@@ -71,8 +136,84 @@ class Controller:
             'pills': Pill,
             'transformations': Transformation,
             'challenges': Challenge,
-            'characters': Character
+            'characters': Character,
+            'items': Item,
+            'trinkets': Trinket
         }
+        # Element types reachable from a free-text search, in priority order
+        self.search_types = [
+            'trinkets', 'items', 'cards', 'runes', 'soulstones', 'pills',
+            'pickups', 'curses', 'transformations', 'challenges', 'characters'
+        ]
+        loaders = {
+            elem_type: self.element_types[elem_type]('List').get_list_elements
+            for elem_type in self.search_types
+        }
+        loaders['cards'] = Card('List').get_names
+        self.name_index = NameIndex(loaders)
+        self.name_index.load(self.database)
+        self.text_index = TextIndex({
+            'items': Item('List').get_list_texts,
+            'trinkets': Trinket('List').get_list_texts
+        })
+        self.text_index.load(self.database)
+        Emojis.load(self.database)
+        self.replies = {}
+        self.load_replies()
+        self.list_cache = {}
+        self.button_cache = {}
+        self.render_cache = RenderCache()
+        self.inline_cache = RenderCache(maxsize=1024)
+        self.single_flight = SingleFlight()
+        self.prewarm = prewarm
+        if prewarm:
+            self.prewarm_cache()
+
+    def reload(self):
+        """
+        Reloads the in-memory indexes from the database, so changes in the
+        dataset are picked up without restarting the bot.
+
+        The packed snapshot, if any, is reopened from its path, so a pack
+        rebuilt in place replaces the old one too, and the old one is
+        closed once it is swapped.
+        """
+        if self.packed_snapshot is not None:
+            old_snapshot = self.packed_snapshot
+            self.packed_snapshot = PackedSnapshot(old_snapshot.path)
+            old_snapshot.close()
+        self.name_index.load(self.database)
+        self.text_index.load(self.database)
+        Emojis.load(self.database)
+        self.load_replies()
+        self.list_cache = {}
+        self.button_cache = {}
+        self.render_cache.clear()
+        self.inline_cache.clear()
+        if self.prewarm:
+            self.prewarm_cache()
+
+    def load_replies(self):
+        """
+        Loads every reply message from the database, indexed by command and
+        reply type.
+        """
+        replies = {}
+        for reply in self.database.Replies.find(
+                {}, {'_id': 0, 'command': 1, 'type': 1, 'message': 1}):
+            # Keep the first reply of a command and type, as find_one would
+            replies.setdefault(
+                (reply.get('command'), reply.get('type')),
+                reply.get('message').encode('utf-8').decode('unicode_escape'))
+        self.replies = replies
+
+    def prewarm_cache(self):
+        """
+        Renders every searchable element into the render cache.
+        """
+        for elem_type in self.search_types:
+            for name in self.name_index.get_names(elem_type):
+                self.get_element(elem_type, name)
 
     def get_list_elements(self, elem_type, deck=False):
         """
@@ -85,15 +226,100 @@ class Controller:
                 Defaults to False.
 
         Returns:
-            list: A list of elements of the specified type.
+            tuple: The elements of the specified type. The same tuple is
+            returned until the dataset is reloaded, so it can be used as a
+            cache key.
         """
-        element = self.element_types[elem_type]('List')
-        if deck:
-            elements = element.get_list_elements(database, deck)
-            return elements
-        elements = element.get_list_elements(database)
+        key = (elem_type, deck)
+        elements = self.list_cache.get(key)
+        if elements is None:
+            element = self.element_types[elem_type]('List')
+            if deck:
+                elements = element.get_list_elements(self.database, deck)
+            else:
+                elements = element.get_list_elements(self.database)
+            elements = tuple(elements)
+            self.list_cache[key] = elements
         return elements
 
+    def get_list_buttons(self, elem_type, deck=False):
+        """
+        Get the label and ID of the buttons choosing the elements of a list.
+
+        Args:
+            elem_type (str): The type of elements to retrieve.
+            deck (bool, optional): Whether to retrieve elements associated with
+            a deck. Defaults to False.
+
+        Returns:
+            Buttons: (label, id) tuples of the elements of the list.
+        """
+        return self.to_buttons(
+            elem_type, self.get_list_elements(elem_type, deck), deck)
+
+    def to_buttons(self, elem_type, elements, deck=False):
+        """
+        Pair the elements of a list with their IDs.
+
+        The list of cards holds the decks, which aren't indexed, so the ID of
+        a deck is derived from its name, as indexed names are.
+
+        The buttons are cached until the list is loaded again, so a repeated
+        list command neither pairs nor hashes them again.
+
+        Args:
+            elem_type (str): The type of the elements.
+            elements (tuple): The elements of the list, as cached in
+            list_cache.
+            deck (bool, optional): Whether the elements are the cards of a
+            deck. Defaults to False.
+
+        Returns:
+            Buttons: (label, id) tuples of the elements.
+        """
+        key = (elem_type, deck)
+        cached = self.button_cache.get(key)
+        if cached is not None and cached[0] is elements:
+            return cached[1]
+
+        if elem_type == 'cards' and not deck:
+            buttons = Buttons((name, stable_id(name)) for name in elements)
+        else:
+            buttons = Buttons((name, self.name_index.get_id(elem_type, name))
+                              for name in elements)
+        self.button_cache[key] = (elements, buttons)
+        return buttons
+
+    def get_id(self, elem_type, name):
+        """
+        Get the ID of an element, used to refer to it in buttons.
+
+        Args:
+            elem_type (str): The type of the element.
+            name (str): The name of the element.
+
+        Returns:
+            int or None: The ID, or None if the element isn't indexed.
+        """
+        return self.name_index.get_id(elem_type, name)
+
+    def get_name(self, elem_type, elem_id):
+        """
+        Get the name of the element with an ID.
+
+        Args:
+            elem_type (str): The type of the element, or 'decks' for a deck.
+            elem_id (str): The ID of the element, as found in a button.
+
+        Returns:
+            str or None: The name, or None if there isn't such element.
+        """
+        if not elem_id.isdigit():
+            return None
+        if elem_type == 'decks':
+            return find_deck(self.get_list_elements('cards'), elem_id)
+        return self.name_index.get_name(elem_type, int(elem_id))
+
     def get_element(self, elem_type, elem_id):
         """
         Get a specific element of a specified type from the database.
@@ -105,10 +331,50 @@ class Controller:
         Returns:
             object: The retrieved element.
         """
+        key = (elem_type, elem_id)
+        result = self.get_cached(key)
+        if result is None:
+            # Concurrent misses of the same element share a single fetch
+            result = self.single_flight.do(
+                key, partial(self.render_element, elem_type, elem_id))
+        return result
+
+    def render_element(self, elem_type, elem_id):
+        """
+        Render an element from the database into the render cache.
+
+        Args:
+            elem_type (str): The type of element to render.
+            elem_id: The unique identifier of the element.
+
+        Returns:
+            str or bool: The rendered element, or False if it doesn't exist.
+        """
+        generation = self.render_cache.generation
         element = self.element_types[elem_type](elem_id)
-        result = element.get_element(database)
+        result = element.get_element(self.database)
+        if result:
+            self.render_cache.put((elem_type, elem_id), result, generation)
         return result
 
+    def get_cached(self, key):
+        """
+        Get a rendered element or section from the packed snapshot, if
+        available, or from the render cache.
+
+        Args:
+            key (tuple): The (type, name) key of an element, or the
+            (type, name, section) key of a section.
+
+        Returns:
+            str or None: The rendered Markdown, or None if it isn't cached.
+        """
+        if self.packed_snapshot is not None:
+            result = self.packed_snapshot.get(key[0], str(key[1]), *key[2:])
+            if result is not None:
+                return result
+        return self.render_cache.get(key)
+
     def get_reply(self, command, reply_type):
         """
         Get a reply message based on a command and reply type.
@@ -122,11 +388,7 @@ class Controller:
             str: The reply message associated with the given command and reply
             type.
         """
-        reply = database.Replies.find_one({
-            "command": command,
-            "type": reply_type,
-            })
-        return reply.get('message').encode('utf-8').decode('unicode_escape')
+        return self.replies.get((command, reply_type))
 
     def search_element(self, query, exact=False):
         """
@@ -140,39 +402,109 @@ class Controller:
             (default: False)
 
         Returns:
-            tuple: A tuple containing the result information (dict) and the
-            type of game element (str) if found. If no match is found, it
-            returns a tuple containing all the search results and the type
-            'Similar'.
+            tuple, list or bool: A tuple containing the result information
+            (str), the type and the name of the game element if found.
+            Otherwise, a list of (name, type, id) tuples of similar game
+            elements, or False if there aren't any.
+        """
+        result = self.match_element(query, exact)
+        if isinstance(result, tuple):
+            elem_type, name = result
+            return self.get_element(elem_type, name), elem_type, name
+        return result
+
+    def complete_element(self, query, limit=20):
+        """
+        Completes a partially typed name, for inline queries.
+
+        Args:
+            query (str): The partially typed name.
+            limit (int, optional): Maximum number of elements. Defaults to 20.
+
+        Returns:
+            list: (name, type, id) tuples of the names starting with the
+            query, followed by the names similar to it.
+        """
+        result = self.name_index.complete(query, limit)
+        if len(result) < limit:
+            names = {name for name, _, _ in result}
+            result += [match for match in self.name_index.similar(query)
+                       if match[0] not in names][:limit - len(result)]
+        return result
+
+    def inline_elements(self, query):
+        """
+        Retrieves the rendered elements completing an inline query.
+
+        Results are cached by normalized query, so repeated keystrokes
+        don't complete and render them again.
+
+        Args:
+            query (str): The inline query.
+
+        Returns:
+            tuple: (name, type, id, text) tuples of the completed elements.
+        """
+        key = normalize_query(query)
+        result = self.inline_cache.get(key)
+        if result is None:
+            generation = self.inline_cache.generation
+            result = tuple(
+                (name, elem_type, elem_id, self.get_element(elem_type, name))
+                for name, elem_type, elem_id in self.complete_element(key)
+            ) if key else ()
+            self.inline_cache.put(key, result, generation)
+        return result
+
+    def match_element(self, query, exact=False):
         """
+        Matches the given query against the names of every searchable game
+        element, without rendering it.
 
-        # Check if query is a trinket
-        trinket = Trinket(query)
-        item = Item(query)
-        result_trinket = trinket.get_list_elements(database, query, exact)
-        result_item = item.get_list_elements(database, query, exact)
+        Args:
+            query (str): The query to search for.
+            exact (bool): Flag indicating whether an exact match is required.
+            (default: False)
+
+        Returns:
+            tuple, list or bool: A tuple containing the type and the name of
+            the game element if found. Otherwise, a list of (name, type, id)
+            tuples of similar game elements, or False if there aren't any.
+        """
+        name = query
+        elem_type = self.name_index.get_type(name)
+        if not elem_type and not exact:
+            # Resolve queries with a couple of typos directly
+            name = self.name_index.correct(query)
+            elem_type = self.name_index.get_type(name)
+        if elem_type:
+            return elem_type, name
         if exact:
-            if isinstance(result_trinket, str):
-                result = trinket.get_element(database)
-            if isinstance(result_item, str):
-                result = item.get_element(database)
-            return result
-        result = result_trinket + result_item
+            return False
 
-        if isinstance(result_trinket, str):
-            return trinket.get_element(database)
-        if isinstance(result_item, str):
-            return item.get_element(database)
-        if len(result) == 0:
+        result = self.name_index.similar(query)
+        if not result:
             return False
         if len(result) == 1:
-            if len(result_item) == 0:
-                elem = Trinket(result_trinket[0])
-            else:
-                elem = Item(result_item[0])
-            return elem.get_element(database)
+            name, elem_type, _ = result[0]
+            return elem_type, name
         return result
 
+    def find_elements(self, words):
+        """
+        Finds the game elements whose effects, notes, synergies or
+        interactions best match the given words.
+
+        Args:
+            words (str): The words to search for.
+
+        Returns:
+            list: (name, type, id) tuples of the matching game elements, best
+            first.
+        """
+        return [(name, elem_type, self.name_index.get_id(elem_type, name))
+                for name, elem_type in self.text_index.search(words)]
+
     def get_element_section(self, section, element):
         """
         Retrieves a specific section of information for a given game element.
@@ -186,9 +518,64 @@ class Controller:
             element.
         """
 
-        trinket = Trinket(element)
-        result = trinket.get_list_elements(database, element, True)
-        if isinstance(result, str):
-            result = trinket.get_element_section(database, section)
+        elem_type = self.name_index.get_type(element)
+        if elem_type in ('items', 'trinkets'):
+            key = (elem_type, element, section)
+            result = self.get_cached(key)
+            if result is None:
+                result = self.single_flight.do(
+                    key, partial(self.render_section, elem_type, element,
+                                 section))
             return result
         return f"No information was found for section *{section}*."
+
+    def render_section(self, elem_type, element, section):
+        """
+        Render a section of an item or trinket from the database into the
+        render cache.
+
+        Args:
+            elem_type (str): The type of the element.
+            element (str): The element to be inspected.
+            section (str): The section to render.
+
+        Returns:
+            str: The rendered section.
+        """
+        generation = self.render_cache.generation
+        elem = self.element_types[elem_type](element)
+        result = elem.get_element_section(self.database, section)
+        self.render_cache.put((elem_type, element, section), result,
+                              generation)
+        return result
+
+    def get_records(self):
+        """
+        Renders every game element, and every section of items and
+        trinkets, straight from the database.
+
+        Returns:
+            dict: Maps (type, name) and (type, name, section) keys to the
+            rendered Markdown.
+        """
+        records = {}
+        names = {
+            elem_type: self.name_index.get_names(elem_type)
+            for elem_type in self.search_types
+        }
+        names['achievements'] = Achievement('List').get_list_elements(
+            self.database)
+
+        for elem_type, elem_names in names.items():
+            for name in elem_names:
+                element = self.element_types[elem_type](name)
+                result = element.get_element(self.database)
+                if result:
+                    records[(elem_type, str(name))] = result
+                if elem_type not in ('items', 'trinkets'):
+                    continue
+                for section in ('Effects', 'Notes', 'Synergies',
+                                'Interactions'):
+                    records[(elem_type, name, section)] = \
+                        element.get_element_section(self.database, section)
+        return records
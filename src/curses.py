@@ -57,7 +57,7 @@ class Curse:
             A list of curse names extracted from the Curses collection in the
             database.
         """
-        curses = database.Curses.find({})
+        curses = database.Curses.find({}, {'_id': 0, 'name': 1})
         return [curse.get('name') for curse in curses]
 
     def get_element(self, database):
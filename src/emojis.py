@@ -0,0 +1,52 @@
+"""
+This file provides a class for looking up the emojis used when rendering
+game elements.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+from types import MappingProxyType
+
+
+class Emojis:
+    """
+    Shared, read-only table of emojis by key.
+
+    The table is loaded once from the database, with the unicode escapes
+    already decoded, so rendering doesn't query the database.
+
+    Attributes:
+        __table (MappingProxyType): Maps every emoji key to its emoji.
+    """
+
+    __table = MappingProxyType({})
+
+    @classmethod
+    def load(cls, database):
+        """
+        Loads (or reloads) every emoji from the database.
+
+        Args:
+            database: A database object with an Emojis collection.
+        """
+        table = {}
+        for emoji in database.Emojis.find({}, {'_id': 0, 'key': 1,
+                                               'value': 1}):
+            # Keep the first emoji of a key, as find_one would
+            table.setdefault(emoji.get('key'), emoji.get('value').encode(
+                'utf-8').decode('unicode_escape'))
+        cls.__table = MappingProxyType(table)
+
+    @classmethod
+    def get(cls, key):
+        """
+        Retrieves the emoji of a key.
+
+        Args:
+            key (str): The emoji key.
+
+        Returns:
+            str or None: The emoji, or None if the key has no emoji.
+        """
+        return cls.__table.get(key)
@@ -6,6 +6,7 @@ Controller class.
 Dependencies:
     - controller: The Controller class for searching and retrieving game
     element information.
+    - bootstrap: Creates the controller from the environment on startup.
 
 Author: Carlos Morales Aguilera
 Date: 04-Nov-2023
@@ -13,25 +14,159 @@ Date: 04-Nov-2023
 
 import re
 import os
+from functools import partial
+from urllib.parse import urlparse
 import telebot
-from dotenv import load_dotenv
 
-from controller import Controller
-from markups import Markup
+from bootstrap import (Lazy, create_controller, get_setting, load_environment,
+                       reload_on_hangup, start_metrics_server)
+from markups import BACK_CODE, SECTIONS, TYPE_CODES, Markup
+from metrics import queue_telegram_call, record_telegram_call, timed
+from rate_limiter import BULK, INTERACTIVE, RateLimiter
+from router import CallbackRouter
+from webhook import WebhookServer
+
+# The token is set and the controller and limiter created on startup, so
+# importing this module doesn't connect to anything
+bot = telebot.TeleBot(None)
+controller = Lazy(create_controller)
+markup = Markup()
+router = CallbackRouter()
+limiter = Lazy(RateLimiter)
 
-load_dotenv(dotenv_path='.env')
+# Seconds Telegram may serve inline query results from its own cache
+INLINE_CACHE_TIME = 300
 
-TOKEN = os.getenv('TOKEN')
+# Element type of every code in callback data
+CODE_TYPES = {code: elem_type for elem_type, code in TYPE_CODES.items()}
 
-if not TOKEN:
-    TOKEN = input('\nPlease enter a valid Telegram Bot Token: ')
 
-bot = telebot.TeleBot(TOKEN)
-controller = Controller()
-markup = Markup()
+def send_message(chat_id, text, priority=INTERACTIVE, **kwargs):
+    """
+    Queues a message through the rate limiter.
+
+    Args:
+        chat_id (int): The chat to send the message to.
+        text (str): The text of the message.
+        priority (int, optional): INTERACTIVE or BULK. Defaults to
+        INTERACTIVE.
+        **kwargs: Other arguments of telebot.TeleBot.send_message.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the sent message.
+    """
+    return queue_telegram_call(
+        'sendMessage', partial(limiter.submit, chat_id, priority=priority),
+        partial(bot.send_message, chat_id, text, **kwargs))
+
+
+def show_content(call, text, reply_markup=None):
+    """
+    Replaces the message whose button was tapped with new content, instead
+    of deleting it and sending a new one.
+
+    Edits of the same message are coalesced while they wait, so only the
+    last of several quick taps is sent.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+        text (str): The new Markdown text of the message.
+        reply_markup (optional): The new markup of the message.
+    """
+    chat_id, message_id = call.message.chat.id, call.message.id
+    queue_telegram_call(
+        'editMessageText',
+        partial(limiter.submit, chat_id, key=('edit', chat_id, message_id)),
+        partial(bot.edit_message_text, text, chat_id, message_id,
+                parse_mode="Markdown", reply_markup=reply_markup))
+
+
+@bot.callback_query_handler(func=lambda call: True)
+def callback(call):
+    """
+    Handles every callback query, dispatching it to the handler of its
+    operation.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+    """
+    router.dispatch(call)
+
+
+def element_content(call, elem_type, elem_id, section=None):
+    """
+    Handles callback queries for retrieving specific content from an
+    element (pickup, rune, card...), the cards of a deck or a section of an
+    item or trinket.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+        elem_type (str): The type of the element, or 'decks' for a deck.
+        elem_id (str): The ID of the element.
+        section (str, optional): The section to retrieve. Defaults to None,
+        which retrieves the whole element.
+    """
+    if section is not None and section not in SECTIONS:
+        # Only forged buttons carry other sections, answered so the client
+        # stops waiting
+        record_telegram_call('answerCallbackQuery')
+        bot.answer_callback_query(call.id, 'Unknown section.')
+        return
+
+    name = controller.get_name(elem_type, elem_id)
+    if name is None:
+        return
+
+    if section:
+        result = controller.get_element_section(section, name)
+        send_message(call.message.chat.id, result, parse_mode="Markdown")
+    elif elem_type == 'decks':
+        reply = controller.get_list_buttons("cards", name)
+        show_content(call, f"*{name}* deck.",
+                     markup.markup_entity('cards', reply, 'cards'))
+    else:
+        result = controller.get_element(elem_type, name)
+        # Items and trinkets show their sections, the rest go back to a list
+        show_content(call, result,
+                     markup.markup_content(elem_type, elem_id) or
+                     markup.markup_back(elem_type))
+
+
+@router.route(BACK_CODE)
+@timed('back')
+def back(call, code):
+    """
+    Handles callback queries for going back from an element to the list it
+    was chosen from.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+        code (str): The code of the element type of the list.
+    """
+    elem_type = CODE_TYPES.get(code)
+    if elem_type is None:
+        return
+
+    reply = controller.get_list_buttons(elem_type)
+    header = controller.get_reply(f"/{elem_type}", "header")
+    show_content(call, header, markup.markup_entity(
+        'decks' if elem_type == 'cards' else elem_type, reply))
+
+
+# Buttons of every element type open their elements, timed per type
+for button_type, button_code in TYPE_CODES.items():
+    router.route(button_code, arity=2, optional=1)(
+        timed(f"{button_type}_content")(
+            lambda call, elem_id, section=None, elem_type=button_type:
+            element_content(call, elem_type, elem_id, section)))
 
 
 @bot.message_handler(commands=['start'])
+@timed('start')
 def start(message):
     """
     Handles the /start command and sends a welcome message with a photo.
@@ -42,13 +177,15 @@ def start(message):
     photo = "https://media.vandal.net/master/3-2023/20233192354223_1.jpg"
     caption = "Hi! My name is Isaac! \n\nWelcome to The Binding of Isaac: " \
               "Rebirth unofficial bot."
-    bot.send_photo(message.chat.id,
-                   photo=photo,
-                   caption=caption,
-                   parse_mode="Markdown")
+    queue_telegram_call('sendPhoto', partial(limiter.submit, message.chat.id),
+                        partial(bot.send_photo, message.chat.id,
+                                photo=photo,
+                                caption=caption,
+                                parse_mode="Markdown"))
 
 
 @bot.message_handler(commands=['achievement'])
+@timed('achievement')
 def achievement(message):
     """
     Handles the /achievement command and checks the id indicated.
@@ -60,13 +197,14 @@ def achievement(message):
     if not re.match(pattern, message.text) or len(message.text.split()) != 2:
         # Get wrong command message
         reply = controller.get_reply("/achievement", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
         reply = controller.get_element("achievements", message.text.split()[1])
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
 
 
 @bot.message_handler(commands=['pickups'])
+@timed('pickups')
 def pickups(message):
     """
     Handles the /pickups command and returns all available pickups in-game.
@@ -77,33 +215,18 @@ def pickups(message):
     if not message.text == '/pickups':
         # Get wrong command message
         reply = controller.get_reply("/pickups", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("pickups")
+        reply = controller.get_list_buttons("pickups")
         header = controller.get_reply("/pickups", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('pickup', reply))
-
-
-@bot.callback_query_handler(lambda call: '/pickup' in call.data)
-def pickup_content(call):
-    """
-    Handles callback queries for retrieving specific content from a pickup.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element(
-        "pickups", call.data.replace('/pickup ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('pickups', reply))
 
 
 @bot.message_handler(commands=['runes'])
+@timed('runes')
 def runes(message):
     """
     Handles the /runes command and returns all available runes in-game.
@@ -114,32 +237,18 @@ def runes(message):
     if not message.text == '/runes':
         # Get wrong command message
         reply = controller.get_reply("/runes", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("runes")
+        reply = controller.get_list_buttons("runes")
         header = controller.get_reply("/runes", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('rune', reply))
-
-
-@bot.callback_query_handler(lambda call: '/rune' in call.data)
-def rune_content(call):
-    """
-    Handles callback queries for retrieving specific content from a rune.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element("runes", call.data.replace('/rune ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('runes', reply))
 
 
 @bot.message_handler(commands=['soulstones'])
+@timed('soulstones')
 def soulstones(message):
     """
     Handles the /soulstones command and returns all available soul stones
@@ -151,33 +260,18 @@ def soulstones(message):
     if not message.text == '/soulstones':
         # Get wrong command message
         reply = controller.get_reply("/soulstones", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("soulstones")
+        reply = controller.get_list_buttons("soulstones")
         header = controller.get_reply("/soulstones", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('soulstone', reply))
-
-
-@bot.callback_query_handler(lambda call: '/soulstone' in call.data)
-def soulstone_content(call):
-    """
-    Handles callback queries for retrieving specific content from a soul stone.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element(
-        "soulstones", call.data.replace('/soulstone ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('soulstones', reply))
 
 
 @bot.message_handler(commands=['cards'])
+@timed('cards')
 def cards(message):
     """
     Handles the /cards command and returns all available cards in-game.
@@ -188,52 +282,18 @@ def cards(message):
     if not message.text == '/cards':
         # Get wrong command message
         reply = controller.get_reply("/cards", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("cards")
+        reply = controller.get_list_buttons("cards")
         header = controller.get_reply("/cards", "header")
-        bot.send_message(
-            message.chat.id, text=header,
-            parse_mode="Markdown",
-            reply_markup=markup.markup_entity('deck', reply))
-
-
-@bot.callback_query_handler(lambda call: '/deck' in call.data)
-def deck_content(call):
-    """
-    Handles callback queries for retrieving specific content from a deck.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    reply = controller.get_list_elements(
-        "cards", call.data.replace('/deck ', ''))
-    header = f"*{call.data.replace('/deck ', '')}* deck."
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(
-            call.message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('card', reply))
-
-
-@bot.callback_query_handler(lambda call: '/card' in call.data)
-def card_content(call):
-    """
-    Handles callback queries for retrieving specific content from a card.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element("cards", call.data.replace('/card ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('decks', reply))
 
 
 @bot.message_handler(commands=['curses'])
+@timed('curses')
 def curses(message):
     """
     Handles the /curses command and returns all available curses
@@ -245,32 +305,18 @@ def curses(message):
     if not message.text == '/curses':
         # Get wrong command message
         reply = controller.get_reply("/curses", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("curses")
+        reply = controller.get_list_buttons("curses")
         header = controller.get_reply("/curses", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('curse', reply))
-
-
-@bot.callback_query_handler(lambda call: '/curse' in call.data)
-def curse_content(call):
-    """
-    Handles callback queries for retrieving specific content from a curse.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element("curses", call.data.replace('/curse ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('curses', reply))
 
 
 @bot.message_handler(commands=['pills'])
+@timed('pills')
 def pills(message):
     """
     Handles the /pills command and returns all available pills
@@ -282,32 +328,18 @@ def pills(message):
     if not message.text == '/pills':
         # Get wrong command message
         reply = controller.get_reply("/pills", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("pills")
+        reply = controller.get_list_buttons("pills")
         header = controller.get_reply("/pills", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('pill', reply))
-
-
-@bot.callback_query_handler(lambda call: '/pill' in call.data)
-def pill_content(call):
-    """
-    Handles callback queries for retrieving specific content from a pill.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element("pills", call.data.replace('/pill ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('pills', reply))
 
 
 @bot.message_handler(commands=['transformations'])
+@timed('transformations')
 def transformations(message):
     """
     Handles the /transformations command and returns all available
@@ -319,34 +351,18 @@ def transformations(message):
     if not message.text == '/transformations':
         # Get wrong command message
         reply = controller.get_reply("/transformations", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("transformations")
+        reply = controller.get_list_buttons("transformations")
         header = controller.get_reply("/transformations", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('transformation', reply))
-
-
-@bot.callback_query_handler(lambda call: '/transformation' in call.data)
-def transformation_content(call):
-    """
-    Handles callback queries for retrieving specific content from a
-    transformation.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element(
-        "transformations", call.data.replace('/transformation ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('transformations', reply))
 
 
 @bot.message_handler(commands=['challenges'])
+@timed('challenges')
 def challenges(message):
     """
     Handles the /challenges command and returns all available
@@ -358,34 +374,18 @@ def challenges(message):
     if not message.text == '/challenges':
         # Get wrong command message
         reply = controller.get_reply("/challenges", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("challenges")
+        reply = controller.get_list_buttons("challenges")
         header = controller.get_reply("/challenges", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('challenge', reply))
-
-
-@bot.callback_query_handler(lambda call: '/challenge' in call.data)
-def challenge_content(call):
-    """
-    Handles callback queries for retrieving specific content from a
-    challenge.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.get_element(
-        "challenges", call.data.replace('/challenge ', ''))
-
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+            reply_markup=markup.markup_entity('challenges', reply))
 
 
 @bot.message_handler(commands=['characters'])
+@timed('characters')
 def characters(message):
     """
     Handles the /characters command and returns all available
@@ -397,34 +397,65 @@ def characters(message):
     if not message.text == '/characters':
         # Get wrong command message
         reply = controller.get_reply("/characters", "wrong_command")
-        bot.send_message(message.chat.id, text=reply, parse_mode="Markdown")
+        send_message(message.chat.id, text=reply, parse_mode="Markdown")
     else:
-        reply = controller.get_list_elements("characters")
+        reply = controller.get_list_buttons("characters")
         header = controller.get_reply("/characters", "header")
-        bot.send_message(
-            message.chat.id, text=header,
+        send_message(
+            message.chat.id, text=header, priority=BULK,
             parse_mode="Markdown",
-            reply_markup=markup.markup_entity('character', reply))
+            reply_markup=markup.markup_entity('characters', reply))
 
 
-@bot.callback_query_handler(lambda call: '/character' in call.data)
-def character_content(call):
+@bot.message_handler(commands=['find'])
+@timed('find')
+def find(message):
     """
-    Handles callback queries for retrieving specific content from a
-    character.
+    Handles the /find command and returns the game elements whose sections
+    mention the given words.
 
     Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
+        message (telebot.types.Message): The message object from Telegram.
+    """
+    words = message.text.partition(' ')[2].strip()
+    if not words:
+        send_message(
+            message.chat.id,
+            "Usage: `/find <words>`, for example `/find flight`.",
+            parse_mode="Markdown")
+        return
+
+    result = controller.find_elements(words)
+    if result:
+        send_message(
+            message.chat.id,
+            f"Elements related to \"{words}\".",
+            reply_markup=markup.markup_similar(result))
+    else:
+        send_message(
+            message.chat.id,
+            f"There aren't any elements related to \"{words}\".")
+
+
+@bot.inline_handler(lambda inline_query: True)
+@timed('inline')
+def inline(inline_query):
     """
-    result = controller.get_element(
-        "characters", call.data.replace('/character ', ''))
+    Handles inline queries (@bot name) from any chat and answers with the
+    elements completing the query.
 
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
+    Args:
+        inline_query (telebot.types.InlineQuery): The inline query object from
+        Telegram.
+    """
+    results = controller.inline_elements(inline_query.query)
+    record_telegram_call('answerInlineQuery')
+    bot.answer_inline_query(inline_query.id, markup.markup_inline(results),
+                            cache_time=INLINE_CACHE_TIME)
 
 
 @bot.message_handler(func=lambda message: True)
+@timed('query')
 def query(message):
     """
     Handles user queries and sends information about game elements.
@@ -433,60 +464,49 @@ def query(message):
         message (telebot.types.Message): The message object from Telegram.
     """
     result = controller.search_element(message.text, False)
-    if isinstance(result, str):
-        bot.send_message(message.chat.id,
-                         text=result,
-                         parse_mode="Markdown",
-                         reply_markup=markup.markup_content(message.text))
+    if isinstance(result, tuple):
+        text, elem_type, name = result
+        send_message(message.chat.id,
+                     text=text,
+                     parse_mode="Markdown",
+                     reply_markup=markup.markup_content(
+                         elem_type, controller.get_id(elem_type, name)))
 
     elif isinstance(result, list):
-        bot.send_message(
+        send_message(
             message.chat.id,
             f"\"{message.text}\" was not found, but here are some similar"
             f" possibilities.",
             reply_markup=markup.markup_similar(result))
 
     else:
-        bot.send_message(
+        send_message(
             message.chat.id,
             f"\"{message.text}\" was not found, and there aren't any similar"
             f" possibilities."
             )
 
 
-@bot.callback_query_handler(lambda call: '_' in call.data)
-def query_content(call):
-    """
-    Handles callback queries for retrieving specific content sections of game
-    elements.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    section = call.data.split('_')[0]
-    element = call.data.split('_')[1]
-    result = controller.get_element_section(section, element)
-
-    bot.send_message(call.message.chat.id, result, parse_mode="Markdown")
-
-
-@bot.callback_query_handler(lambda call: '_' not in call.data)
-def query_similar(call):
-    """
-    Handles callback queries for retrieving information about similar game
-    elements.
-
-    Args:
-        call (telebot.types.CallbackQuery): The callback query object from
-        Telegram.
-    """
-    result = controller.search_element(call.data, True)
-    bot.delete_message(call.message.chat.id, call.message.id)
-    bot.send_message(call.message.chat.id,
-                     text=result,
-                     parse_mode="Markdown",
-                     reply_markup=markup.markup_content(call.data))
-
-
-bot.polling()
+if __name__ == '__main__':
+    load_environment()
+    bot.token = get_setting('TOKEN')
+    # Load the indexes before serving the first update
+    start_metrics_server(controller.get())
+    reload_on_hangup(controller.get())
+
+    WEBHOOK_URL = os.getenv('WEBHOOK_URL')
+    if WEBHOOK_URL:
+        # Receive updates through the embedded HTTP server, only accepting
+        # the ones carrying the secret token registered with Telegram
+        WEBHOOK_SECRET = get_setting('WEBHOOK_SECRET')
+        webhook = WebhookServer(
+            bot, WEBHOOK_SECRET,
+            address=(os.getenv('WEBHOOK_HOST', '0.0.0.0'),
+                     int(os.getenv('WEBHOOK_PORT', '8443'))),
+            path=urlparse(WEBHOOK_URL).path or '/',
+            workers=int(os.getenv('WEBHOOK_WORKERS', '8')))
+        bot.remove_webhook()
+        bot.set_webhook(url=WEBHOOK_URL, secret_token=WEBHOOK_SECRET)
+        webhook.serve_forever()
+    else:
+        bot.polling()
@@ -0,0 +1,351 @@
+"""
+This module provides the asyncio runtime of the Telegram bot for The Binding
+of Isaac: Rebirth game. It serves the same commands as isaacbot.py from a
+single event loop, with non-blocking Telegram and MongoDB I/O.
+
+Dependencies:
+    - async_controller: The AsyncController class for searching and
+    retrieving game element information.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+# Disable order due to error with pylint, but the order will
+# still be respected.
+# pylint: disable=C0411
+
+# Disable similar code check which is triggered compared to the handlers of
+# the synchronous runtime in isaacbot.py.
+# pylint: disable=R0801
+
+import asyncio
+import re
+from telebot.async_telebot import AsyncTeleBot
+
+from bootstrap import (Lazy, create_async_controller, get_setting,
+                       load_environment, reload_on_hangup,
+                       start_metrics_server)
+from markups import BACK_CODE, SECTIONS, TYPE_CODES, Markup
+from metrics import record_telegram_call, timed
+from router import CallbackRouter
+
+# List commands and the element type of their buttons
+LIST_COMMANDS = {
+    'pickups': 'pickups',
+    'runes': 'runes',
+    'soulstones': 'soulstones',
+    'cards': 'decks',
+    'curses': 'curses',
+    'pills': 'pills',
+    'transformations': 'transformations',
+    'challenges': 'challenges',
+    'characters': 'characters'
+}
+
+# Seconds Telegram may serve inline query results from its own cache
+INLINE_CACHE_TIME = 300
+
+# Element type of every code in callback data
+CODE_TYPES = {code: elem_type for elem_type, code in TYPE_CODES.items()}
+
+# The token is set and the controller created on startup, so importing this
+# module doesn't connect to anything
+bot = AsyncTeleBot(None)
+controller = Lazy(create_async_controller)
+markup = Markup()
+router = CallbackRouter()
+
+
+async def send_message(chat_id, text, **kwargs):
+    """
+    Sends a message, counting the call in the metrics.
+
+    Args:
+        chat_id (int): The chat to send the message to.
+        text (str): The text of the message.
+        **kwargs: Other arguments of AsyncTeleBot.send_message.
+
+    Returns:
+        telebot.types.Message: The sent message.
+    """
+    record_telegram_call('sendMessage')
+    return await bot.send_message(chat_id, text, **kwargs)
+
+
+async def show_content(call, text, reply_markup=None):
+    """
+    Replaces the message whose button was tapped with new content, instead
+    of deleting it and sending a new one.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+        text (str): The new Markdown text of the message.
+        reply_markup (optional): The new markup of the message.
+    """
+    record_telegram_call('editMessageText')
+    await bot.edit_message_text(text, call.message.chat.id, call.message.id,
+                                parse_mode="Markdown",
+                                reply_markup=reply_markup)
+
+
+async def start(message):
+    """
+    Handles the /start command and sends a welcome message with a photo.
+
+    Args:
+        message (telebot.types.Message): The message object from Telegram.
+    """
+    photo = "https://media.vandal.net/master/3-2023/20233192354223_1.jpg"
+    caption = "Hi! My name is Isaac! \n\nWelcome to The Binding of Isaac: " \
+              "Rebirth unofficial bot."
+    record_telegram_call('sendPhoto')
+    await bot.send_photo(message.chat.id,
+                         photo=photo,
+                         caption=caption,
+                         parse_mode="Markdown")
+
+
+async def achievement(message):
+    """
+    Handles the /achievement command and checks the id indicated.
+
+    Args:
+        message (telebot.types.Message): The message object from Telegram.
+    """
+    pattern = r"/achievement (\d+)"
+    if not re.match(pattern, message.text) or len(message.text.split()) != 2:
+        # Get wrong command message
+        reply = controller.get_reply("/achievement", "wrong_command")
+    else:
+        reply = await controller.get_element(
+            "achievements", message.text.split()[1])
+    await send_message(message.chat.id, text=reply, parse_mode="Markdown")
+
+
+async def list_elements(message):
+    """
+    Handles the list commands (/pickups, /runes, /cards...) and returns all
+    available elements of their type in-game.
+
+    Args:
+        message (telebot.types.Message): The message object from Telegram.
+    """
+    elem_type = message.text.split()[0].split('@')[0][1:]
+    if not message.text == f"/{elem_type}":
+        # Get wrong command message
+        reply = controller.get_reply(f"/{elem_type}", "wrong_command")
+        await send_message(message.chat.id, text=reply,
+                           parse_mode="Markdown")
+    else:
+        reply = await controller.get_list_buttons(elem_type)
+        header = controller.get_reply(f"/{elem_type}", "header")
+        await send_message(
+            message.chat.id, text=header,
+            parse_mode="Markdown",
+            reply_markup=markup.markup_entity(LIST_COMMANDS[elem_type],
+                                              reply))
+
+
+async def element_content(call, elem_type, elem_id, section=None):
+    """
+    Handles callback queries for retrieving specific content from an
+    element (pickup, rune, card...), the cards of a deck or a section of an
+    item or trinket.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+        elem_type (str): The type of the element, or 'decks' for a deck.
+        elem_id (str): The ID of the element.
+        section (str, optional): The section to retrieve. Defaults to None,
+        which retrieves the whole element.
+    """
+    if section is not None and section not in SECTIONS:
+        # Only forged buttons carry other sections, answered so the client
+        # stops waiting
+        record_telegram_call('answerCallbackQuery')
+        await bot.answer_callback_query(call.id, 'Unknown section.')
+        return
+
+    name = await controller.get_name(elem_type, elem_id)
+    if name is None:
+        return
+
+    if section:
+        result = await controller.get_element_section(section, name)
+        await send_message(call.message.chat.id, result,
+                           parse_mode="Markdown")
+    elif elem_type == 'decks':
+        reply = await controller.get_list_buttons("cards", name)
+        await show_content(call, f"*{name}* deck.",
+                           markup.markup_entity('cards', reply, 'cards'))
+    else:
+        result = await controller.get_element(elem_type, name)
+        # Items and trinkets show their sections, the rest go back to a list
+        await show_content(call, result,
+                           markup.markup_content(elem_type, elem_id) or
+                           markup.markup_back(elem_type))
+
+
+@router.route(BACK_CODE)
+@timed('back')
+async def back(call, code):
+    """
+    Handles callback queries for going back from an element to the list it
+    was chosen from.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+        code (str): The code of the element type of the list.
+    """
+    elem_type = CODE_TYPES.get(code)
+    if elem_type is None:
+        return
+
+    reply = await controller.get_list_buttons(elem_type)
+    header = controller.get_reply(f"/{elem_type}", "header")
+    await show_content(
+        call, header, markup.markup_entity(LIST_COMMANDS[elem_type], reply))
+
+
+async def find(message):
+    """
+    Handles the /find command and returns the game elements whose sections
+    mention the given words.
+
+    Args:
+        message (telebot.types.Message): The message object from Telegram.
+    """
+    words = message.text.partition(' ')[2].strip()
+    if not words:
+        await send_message(
+            message.chat.id,
+            "Usage: `/find <words>`, for example `/find flight`.",
+            parse_mode="Markdown")
+        return
+
+    result = controller.find_elements(words)
+    if result:
+        await send_message(
+            message.chat.id,
+            f"Elements related to \"{words}\".",
+            reply_markup=markup.markup_similar(result))
+    else:
+        await send_message(
+            message.chat.id,
+            f"There aren't any elements related to \"{words}\".")
+
+
+async def inline(inline_query):
+    """
+    Handles inline queries (@bot name) from any chat and answers with the
+    elements completing the query.
+
+    Args:
+        inline_query (telebot.types.InlineQuery): The inline query object from
+        Telegram.
+    """
+    results = await controller.inline_elements(inline_query.query)
+    record_telegram_call('answerInlineQuery')
+    await bot.answer_inline_query(inline_query.id,
+                                  markup.markup_inline(results),
+                                  cache_time=INLINE_CACHE_TIME)
+
+
+async def query(message):
+    """
+    Handles user queries and sends information about game elements.
+
+    Args:
+        message (telebot.types.Message): The message object from Telegram.
+    """
+    result = await controller.search_element(message.text, False)
+    if isinstance(result, tuple):
+        text, elem_type, name = result
+        await send_message(
+            message.chat.id,
+            text=text,
+            parse_mode="Markdown",
+            reply_markup=markup.markup_content(
+                elem_type, controller.get_id(elem_type, name)))
+
+    elif isinstance(result, list):
+        await send_message(
+            message.chat.id,
+            f"\"{message.text}\" was not found, but here are some similar"
+            f" possibilities.",
+            reply_markup=markup.markup_similar(result))
+
+    else:
+        await send_message(
+            message.chat.id,
+            f"\"{message.text}\" was not found, and there aren't any similar"
+            f" possibilities."
+            )
+
+
+async def callback(call):
+    """
+    Handles every callback query, dispatching it to the handler of its
+    operation.
+
+    Args:
+        call (telebot.types.CallbackQuery): The callback query object from
+        Telegram.
+    """
+    coroutine = router.dispatch(call)
+    if coroutine is not None:
+        await coroutine
+
+
+def content_handler(elem_type):
+    """
+    Builds the handler of the buttons opening the elements of a type.
+
+    The handler is a coroutine function itself, so timed() tracks the
+    update until the element is shown, not only until the coroutine is
+    created.
+
+    Args:
+        elem_type (str): The type of the elements.
+
+    Returns:
+        function: The callback handler.
+    """
+    async def handler(call, elem_id, section=None):
+        await element_content(call, elem_type, elem_id, section)
+    return handler
+
+
+# Buttons of every element type open their elements, timed per type
+for button_type, button_code in TYPE_CODES.items():
+    router.route(button_code, arity=2, optional=1)(
+        timed(f"{button_type}_content")(content_handler(button_type)))
+
+# List commands are timed per command, as in isaacbot.py
+for list_command in LIST_COMMANDS:
+    bot.register_message_handler(timed(list_command)(list_elements),
+                                 commands=[list_command])
+
+bot.register_message_handler(timed('start')(start), commands=['start'])
+bot.register_message_handler(timed('achievement')(achievement),
+                             commands=['achievement'])
+bot.register_message_handler(timed('find')(find), commands=['find'])
+bot.register_message_handler(timed('query')(query),
+                             func=lambda message: True)
+bot.register_inline_handler(timed('inline')(inline),
+                            func=lambda inline_query: True)
+bot.register_callback_query_handler(callback, func=lambda call: True)
+
+
+if __name__ == '__main__':
+    load_environment()
+    bot.token = get_setting('TOKEN')
+    # Load the indexes before serving the first update
+    start_metrics_server(controller.get().controller)
+    reload_on_hangup(controller.get().controller)
+
+    asyncio.run(bot.polling(non_stop=True))
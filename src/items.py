@@ -5,8 +5,6 @@ Author: Carlos Morales Aguilera
 Date: 21-Nov-2023
 """
 
-from difflib import SequenceMatcher
-
 
 class Item:
     """
@@ -14,8 +12,12 @@ class Item:
 
     Attributes:
         __name (str): The name of the item.
+        FIELDS (dict): Projection of the fields rendered by to_str.
     """
 
+    FIELDS = {'_id': 0, 'name': 1, 'message': 1, 'description': 1,
+              'unlock': 1, 'quality': 1, 'recharge': 1}
+
     def __init__(self, name: str):
         """
         Initializes a new instance of the Item class.
@@ -43,8 +45,6 @@ class Item:
         """
         item_values = []
 
-        print(item)
-
         # Add name
         item_values.append(f"*{item.get('name')}*.")
 
@@ -84,35 +84,40 @@ class Item:
             item_content.append(f"• {element}")
         return "\n".join(item_content)
 
-    def get_list_elements(self, database, query, exact):
+    def get_list_elements(self, database):
         """
         Retrieve a list of item names from the provided database.
 
         Args:
             database: A database object with a Items collection.
-            query: Item name to find.
-            exact: Whether to retrieve a item or a list of possible results.
 
         Returns:
             A list of item names extracted from the Items
             collection in the database.
         """
-        items = database.Items.find({})
-        items = [item.get('name') for item in items]
-        result_items = []
+        items = database.Items.find({}, {'_id': 0, 'name': 1})
+        return [item.get('name') for item in items]
 
-        if query in items:
-            return query
-        if exact:
-            return False
+    def get_list_texts(self, database):
+        """
+        Retrieve the section texts of every item from the provided
+        database.
 
-        for item in items:
-            similarity_ratio = SequenceMatcher(None, query, item).ratio()
-            if similarity_ratio > 0.5:
-                result_items.append(item)
-        if len(result_items) == 0:
-            return []
-        return result_items
+        Args:
+            database: A database object with a Items collection.
+
+        Returns:
+            list: (name, texts) tuples with the effects, notes, synergies and
+            interactions texts of every item.
+        """
+        sections = ('effects', 'notes', 'synergies', 'interactions')
+        items = database.Items.find(
+            {}, {'_id': 0, 'name': 1, 'effects': 1, 'notes': 1, 'synergies': 1,
+                 'interactions': 1})
+        return [(item.get('name'),
+                 [value[1] for section in sections
+                  for value in item.get(section) or []])
+                for item in items]
 
     def get_element(self, database):
         """
@@ -121,7 +126,7 @@ class Item:
         Returns:
             str: Description and details of the item
         """
-        item = database.Items.find_one({"name": self.__name})
+        item = database.Items.find_one({"name": self.__name}, self.FIELDS)
         return self.to_str(item)
 
     def get_element_section(self, database, section):
@@ -131,7 +136,22 @@ class Item:
         Returns:
             section (str): Section to retrieve.
         """
-        item = database.Items.find_one({"name": self.__name})
+        item = database.Items.find_one(
+            {"name": self.__name}, {'_id': 0, section.lower(): 1})
+        return self.section_to_str(item, section)
+
+    @staticmethod
+    def section_to_str(item, section):
+        """
+        Convert a section of an item to a formatted string representation.
+
+        Args:
+            item (dict): A dictionary representing an item.
+            section (str): Section to convert.
+
+        Returns:
+            str: A formatted string representation of the section.
+        """
         values = item.get(section.lower())
         item_content = [f"*{section}*:"]
 
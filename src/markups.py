@@ -11,12 +11,53 @@ Date: 04-Nov-2023
 """
 
 
+from functools import lru_cache
+
 import telebot
 
+from router import callback_data
+
 # Disable too few public methods warning, since it will grow in the future, but
 # just to pass pylint checks now
 # pylint: disable=R0903
 
+# Labels used to tag search results with their element type
+TYPE_LABELS = {
+    'items': 'Item',
+    'trinkets': 'Trinket',
+    'cards': 'Card',
+    'runes': 'Rune',
+    'soulstones': 'Soul stone',
+    'pills': 'Pill',
+    'pickups': 'Pickup',
+    'curses': 'Curse',
+    'transformations': 'Transformation',
+    'challenges': 'Challenge',
+    'characters': 'Character'
+}
+
+# Short codes of the element types in callback data, which is limited to 64
+# bytes. Buttons carry "<code>:<id>", or "<code>:<id>:<section>" for item and
+# trinket sections, and back buttons "b:<code>".
+TYPE_CODES = {
+    'items': 'i',
+    'trinkets': 't',
+    'cards': 'c',
+    'decks': 'd',
+    'runes': 'r',
+    'soulstones': 's',
+    'pills': 'p',
+    'pickups': 'k',
+    'curses': 'u',
+    'transformations': 'f',
+    'challenges': 'h',
+    'characters': 'x'
+}
+BACK_CODE = 'b'
+
+# Sections of items and trinkets offered as buttons
+SECTIONS = ('Effects', 'Notes', 'Synergies', 'Interactions')
+
 
 class Markup:
     """
@@ -26,26 +67,58 @@ class Markup:
     """
 
     @staticmethod
-    def markup_entity(entity, values):
+    @lru_cache(maxsize=256)
+    def markup_entity(elem_type, values, back=None):
         """
         Create a markup for choosing values of an entity.
 
+        The markup is serialized and cached, since list commands always show
+        the same values until the dataset is reloaded.
+
         Args:
-            entity (str): A str containing the entity type.
-            values (list): A list of elements to display as buttons.
+            elem_type (str): The element type of the values, or 'decks'.
+            values (tuple): (label, id) tuples of the elements to display as
+            buttons.
+            back (str, optional): Element type of the list to go back to.
+            Defaults to None, without a back button.
 
         Returns:
-            telebot.types.InlineKeyboardMarkup: Markup for selecting similar
-            elements.
+            str: Serialized markup for selecting the elements.
         """
         markup = telebot.types.InlineKeyboardMarkup(row_width=1)
 
-        for value in values:
+        for label, elem_id in values:
             button = telebot.types.InlineKeyboardButton(
-                value, callback_data=f"/{entity} {value}")
+                label,
+                callback_data=callback_data(TYPE_CODES[elem_type],
+                                            str(elem_id)))
             markup.add(button)
 
-        return markup
+        if back:
+            markup.add(telebot.types.InlineKeyboardButton(
+                '« Back',
+                callback_data=callback_data(BACK_CODE, TYPE_CODES[back])))
+
+        return markup.to_json()
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def markup_back(elem_type):
+        """
+        Create a markup for going back to the list of an element type.
+
+        Args:
+            elem_type (str): The element type of the list.
+
+        Returns:
+            str: Serialized markup with a back button.
+        """
+        markup = telebot.types.InlineKeyboardMarkup(row_width=1)
+        markup.add(telebot.types.InlineKeyboardButton(
+            '« Back',
+            callback_data=callback_data(BACK_CODE, TYPE_CODES[elem_type])))
+
+        return markup.to_json()
 
     @staticmethod
     def markup_similar(similarities):
@@ -53,7 +126,8 @@ class Markup:
         Create a markup for choosing similar elements.
 
         Args:
-            similarities (list): A list of elements to display as buttons.
+            similarities (list): A list of (name, type, id) tuples of the
+            elements to display as buttons.
 
         Returns:
             telebot.types.InlineKeyboardMarkup: Markup for selecting similar
@@ -61,38 +135,62 @@ class Markup:
         """
         markup = telebot.types.InlineKeyboardMarkup(row_width=1)
 
-        for elem in similarities:
+        for elem, elem_type, elem_id in similarities:
             button = telebot.types.InlineKeyboardButton(
-                elem, callback_data=elem)
+                f"{elem} ({TYPE_LABELS[elem_type]})",
+                callback_data=callback_data(TYPE_CODES[elem_type],
+                                            str(elem_id)))
             markup.add(button)
 
         return markup
 
     @staticmethod
-    def markup_content(elem):
+    def markup_content(elem_type, elem):
         """
         Create a markup based on the element type.
 
         Args:
-            elem (str): The name or identifier of the element.
+            elem_type (str): The type of the element.
+            elem (int): The ID of the element.
 
         Returns:
-            telebot.types.InlineKeyboardMarkup or False: Markup for the
+            telebot.types.InlineKeyboardMarkup or None: Markup for the
             specified element type,
-            or False if not supported.
+            or None if not supported.
         """
-        markup = telebot.types.InlineKeyboardMarkup(row_width=2)
+        if elem_type not in ('items', 'trinkets'):
+            return None
 
-        bt1 = telebot.types.InlineKeyboardButton(
-            'Effects', callback_data=f"Effects_{elem}")
-        bt2 = telebot.types.InlineKeyboardButton(
-            'Notes', callback_data=f"Notes_{elem}")
-        bt3 = telebot.types.InlineKeyboardButton(
-            'Synergies', callback_data=f"Synergies_{elem}")
-        bt4 = telebot.types.InlineKeyboardButton(
-            'Interactions',
-            callback_data=f"Interactions_{elem}")
+        markup = telebot.types.InlineKeyboardMarkup(row_width=2)
+        code, elem = TYPE_CODES[elem_type], str(elem)
 
-        markup.add(bt1, bt2, bt3, bt4)
+        markup.add(*(telebot.types.InlineKeyboardButton(
+            section, callback_data=callback_data(code, elem, section))
+            for section in SECTIONS))
 
         return markup
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def markup_inline(results):
+        """
+        Create the inline query results of rendered elements.
+
+        The results are cached, since the same completions are answered for
+        every repeated query.
+
+        Args:
+            results (tuple): (name, type, id, text) tuples of the rendered
+            elements.
+
+        Returns:
+            tuple: telebot.types.InlineQueryResultArticle of every element.
+        """
+        return tuple(
+            telebot.types.InlineQueryResultArticle(
+                callback_data(TYPE_CODES[elem_type], str(elem_id)),
+                elem,
+                telebot.types.InputTextMessageContent(
+                    text, parse_mode="Markdown"),
+                description=TYPE_LABELS[elem_type])
+            for elem, elem_type, elem_id, text in results)
@@ -0,0 +1,862 @@
+"""
+This module provides the metrics of the bot: latency histograms of the
+handlers, counts of the MongoDB and Telegram calls made by every update,
+cache hit ratios and in-flight gauges. They are exposed in the Prometheus
+text format by a local HTTP server:
+
+    METRICS_PORT=9100 python3 src/isaacbot.py
+    curl http://127.0.0.1:9100/metrics
+
+Handlers are timed by decorating them with timed(), which also tracks the
+update they handle, so the calls they make are counted per update.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import asyncio
+import bisect
+import contextvars
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Upper bounds of the buckets of calls made by an update
+CALL_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def format_labels(names, values, extra=''):
+    """
+    Format the labels of a sample.
+
+    Args:
+        names (tuple): The label names.
+        values (tuple): The label values.
+        extra (str, optional): Formatted label appended to the others.
+
+    Returns:
+        str: The labels in braces, or an empty string without labels.
+    """
+    labels = [f'{name}="{escape(value)}"'
+              for name, value in zip(names, values)]
+    if extra:
+        labels.append(extra)
+    return '{' + ','.join(labels) + '}' if labels else ''
+
+
+def escape(value):
+    """
+    Escape a label value.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        str: The escaped value.
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace(
+        '\n', '\\n')
+
+
+def format_value(value):
+    """
+    Format the value of a sample.
+
+    Args:
+        value (float): The value.
+
+    Returns:
+        str: The formatted value.
+    """
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """
+    Base of the metrics, holding a value per combination of label values.
+
+    Attributes:
+        name (str): The metric name.
+        help (str): The description of the metric.
+        kind (str): The Prometheus type of the metric.
+        labels (tuple): The label names.
+        _values (dict): Maps label values to the value of the metric.
+        _lock (threading.Lock): Guards the values.
+    """
+
+    kind = 'untyped'
+
+    def __init__(self, name, description, labels=()):
+        """
+        Initializes a new instance of the Metric class.
+
+        Args:
+            name (str): The metric name.
+            description (str): The description of the metric.
+            labels (tuple, optional): The label names. Defaults to none.
+        """
+        self.name = name
+        self.help = description
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def key(self, labels):
+        """
+        Retrieve the label values of a sample.
+
+        Args:
+            labels (dict): Maps the label names to their values.
+
+        Returns:
+            tuple: The label values, in the order of the label names.
+        """
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def samples(self):
+        """
+        Retrieve the samples of the metric.
+
+        Returns:
+            list: (suffix, labels, value) tuples of the samples.
+        """
+        with self._lock:
+            return [('', format_labels(self.labels, key), value)
+                    for key, value in self._values.items()]
+
+
+class Counter(Metric):
+    """
+    Metric that only goes up, such as a number of calls.
+    """
+
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        """
+        Increase the counter.
+
+        Args:
+            amount (float, optional): The increase. Defaults to 1.
+            **labels: The label values.
+        """
+        key = self.key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Counter):
+    """
+    Metric that goes up and down, such as the updates in flight.
+    """
+
+    kind = 'gauge'
+
+    def dec(self, amount=1, **labels):
+        """
+        Decrease the gauge.
+
+        Args:
+            amount (float, optional): The decrease. Defaults to 1.
+            **labels: The label values.
+        """
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    """
+    Metric counting observations in buckets, such as latencies.
+
+    Attributes:
+        buckets (tuple): The upper bounds of the buckets, ascending.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name, description, labels=(),
+                 buckets=LATENCY_BUCKETS):
+        """
+        Initializes a new instance of the Histogram class.
+
+        Args:
+            name (str): The metric name.
+            description (str): The description of the metric.
+            labels (tuple, optional): The label names. Defaults to none.
+            buckets (tuple, optional): The upper bounds of the buckets.
+            Defaults to LATENCY_BUCKETS.
+        """
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets) + (float('inf'),)
+
+    def observe(self, value, **labels):
+        """
+        Count an observation.
+
+        Args:
+            value (float): The observed value.
+            **labels: The label values.
+        """
+        key = self.key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(
+                key, ([0] * len(self.buckets), 0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def samples(self):
+        """
+        Retrieve the cumulative buckets, sum and count of every combination
+        of label values.
+
+        Returns:
+            list: (suffix, labels, value) tuples of the samples.
+        """
+        samples = []
+        with self._lock:
+            values = [(key, list(counts), total)
+                      for key, (counts, total) in self._values.items()]
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                samples.append((
+                    '_bucket',
+                    format_labels(self.labels, key,
+                                  f'le="{format_value(bound)}"'),
+                    cumulative))
+            labels = format_labels(self.labels, key)
+            samples.append(('_sum', labels, total))
+            samples.append(('_count', labels, cumulative))
+        return samples
+
+
+class CallbackMetric(Metric):
+    """
+    Metric read from a function when scraped, such as the hits of a cache.
+
+    Attributes:
+        kind (str): The Prometheus type of the metric.
+        __function (callable): Returns (label values, value) tuples.
+    """
+
+    def __init__(self, name, description, kind, labels, function):
+        """
+        Initializes a new instance of the CallbackMetric class.
+
+        Args:
+            name (str): The metric name.
+            description (str): The description of the metric.
+            kind (str): The Prometheus type of the metric.
+            labels (tuple): The label names.
+            function (callable): Returns (label values, value) tuples when
+            called without arguments.
+        """
+        super().__init__(name, description, labels)
+        self.kind = kind
+        self.__function = function
+
+    def samples(self):
+        """
+        Retrieve the samples returned by the function.
+
+        Returns:
+            list: (suffix, labels, value) tuples of the samples.
+        """
+        return [('', format_labels(self.labels, key), value)
+                for key, value in self.__function()]
+
+
+class Registry:
+    """
+    Collection of metrics rendered together.
+
+    Attributes:
+        __metrics (list): The registered metrics.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new, empty instance of the Registry class.
+        """
+        self.__metrics = []
+
+    def register(self, metric):
+        """
+        Add a metric to the registry.
+
+        Args:
+            metric (Metric): The metric.
+
+        Returns:
+            Metric: The same metric.
+        """
+        self.__metrics.append(metric)
+        return metric
+
+    def render(self):
+        """
+        Render every metric in the Prometheus text format.
+
+        Returns:
+            str: The metrics.
+        """
+        lines = []
+        for metric in self.__metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(
+                    f"{metric.name}{suffix}{labels} {format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+
+class UpdateStats:
+    """
+    Calls made while handling an update.
+
+    Attributes:
+        handler (str): The handler of the update.
+        update: The message, callback query or inline query handled.
+        mongo_calls (int): Number of MongoDB calls.
+        mongo_commands (int): Number of MongoDB commands, as traced by
+        pymongo.
+        mongo_seconds (float): Total duration of the MongoDB commands.
+        slowest (tuple or None): Duration, command and collection of the
+        slowest MongoDB command.
+        telegram_calls (int): Number of Telegram API calls.
+        __pending (int): Telegram API calls queued and not made yet.
+        __finished (bool): Whether the handler has returned.
+        __lock (threading.Lock): Guards the calls made from other threads.
+    """
+
+    # Disable too many instance attributes, since every kind of call made by
+    # the update is counted separately.
+    # pylint: disable=R0902
+
+    def __init__(self, handler, update=None):
+        """
+        Initializes a new instance of the UpdateStats class.
+
+        Args:
+            handler (str): The handler of the update.
+            update (optional): The message, callback query or inline query
+            handled.
+        """
+        self.handler = handler
+        self.update = update
+        self.mongo_calls = 0
+        self.mongo_commands = 0
+        self.mongo_seconds = 0.0
+        self.slowest = None
+        self.telegram_calls = 0
+        self.__pending = 0
+        self.__finished = False
+        self.__lock = threading.Lock()
+
+    def record_command(self, command, collection, seconds):
+        """
+        Count a MongoDB command made while handling the update.
+
+        Args:
+            command (str): The command name, such as 'find'.
+            collection (str): The collection of the command.
+            seconds (float): The duration of the command.
+        """
+        self.mongo_commands += 1
+        self.mongo_seconds += seconds
+        if self.slowest is None or seconds > self.slowest[0]:
+            self.slowest = (seconds, command, collection)
+
+    def record_telegram_call(self):
+        """
+        Count a Telegram API call made for the update, possibly from another
+        thread.
+        """
+        with self.__lock:
+            self.telegram_calls += 1
+
+    def defer(self):
+        """
+        Count a Telegram API call queued for the update, which is observed
+        once it is settled.
+        """
+        with self.__lock:
+            self.__pending += 1
+
+    def settle(self):
+        """
+        Settle a queued Telegram API call, made, coalesced into another or
+        failed.
+        """
+        with self.__lock:
+            self.__pending -= 1
+            done = self.__finished and not self.__pending
+        if done:
+            self.observe()
+
+    def finish(self):
+        """
+        Mark the handler as returned, observing the Telegram API calls of
+        the update unless some are still queued.
+        """
+        with self.__lock:
+            self.__finished = True
+            done = not self.__pending
+        if done:
+            self.observe()
+
+    def observe(self):
+        """
+        Observe the Telegram API calls made for the update.
+        """
+        UPDATE_TELEGRAM_CALLS.observe(self.telegram_calls,
+                                      handler=self.handler)
+
+    def describe(self):
+        """
+        Describe the update, for logs.
+
+        Returns:
+            str: The handler and the chat and message, callback query or
+            inline query handled.
+        """
+        chat = getattr(getattr(self.update, 'chat', None), 'id', None)
+        if chat is not None:
+            return f"{self.handler} (chat {chat}, message " \
+                   f"{self.update.message_id})"
+        update_id = getattr(self.update, 'id', None)
+        if update_id is not None:
+            return f"{self.handler} ({type(self.update).__name__} " \
+                   f"{update_id})"
+        return self.handler
+
+
+def hit_ratio(hits, misses):
+    """
+    Compute the hit ratio of a cache.
+
+    Args:
+        hits (int): The lookups served from the cache.
+        misses (int): The lookups not found in the cache.
+
+    Returns:
+        float: The share of the lookups served, 0 without lookups.
+    """
+    return hits / (hits + misses) if hits + misses else 0.0
+
+
+REGISTRY = Registry()
+
+HANDLER_LATENCY = REGISTRY.register(Histogram(
+    'isaacbot_handler_latency_seconds', 'Time spent handling an update.',
+    ('handler',)))
+HANDLER_ERRORS = REGISTRY.register(Counter(
+    'isaacbot_handler_errors_total', 'Updates whose handler raised an error.',
+    ('handler',)))
+IN_FLIGHT = REGISTRY.register(Gauge(
+    'isaacbot_updates_in_flight', 'Updates being handled.', ('handler',)))
+MONGO_CALLS = REGISTRY.register(Counter(
+    'isaacbot_mongo_calls_total', 'MongoDB calls.',
+    ('collection', 'operation')))
+UPDATE_MONGO_CALLS = REGISTRY.register(Histogram(
+    'isaacbot_update_mongo_calls', 'MongoDB calls made by an update.',
+    ('handler',), CALL_BUCKETS))
+MONGO_COMMAND_LATENCY = REGISTRY.register(Histogram(
+    'isaacbot_mongo_command_seconds', 'Duration of the MongoDB commands.',
+    ('command', 'collection')))
+UPDATE_MONGO_SECONDS = REGISTRY.register(Histogram(
+    'isaacbot_update_mongo_seconds',
+    'Time spent in MongoDB commands by an update.', ('handler',)))
+TELEGRAM_CALLS = REGISTRY.register(Counter(
+    'isaacbot_telegram_calls_total', 'Telegram API calls.', ('method',)))
+UPDATE_TELEGRAM_CALLS = REGISTRY.register(Histogram(
+    'isaacbot_update_telegram_calls', 'Telegram API calls made by an update.',
+    ('handler',), CALL_BUCKETS))
+
+# Caches watched by name, with a function returning their hits and misses
+CACHES = {}
+
+REGISTRY.register(CallbackMetric(
+    'isaacbot_cache_hits_total', 'Lookups served from a cache.', 'counter',
+    ('cache',), lambda: [((name,), stats()[0])
+                         for name, stats in list(CACHES.items())]))
+REGISTRY.register(CallbackMetric(
+    'isaacbot_cache_misses_total', 'Lookups not found in a cache.',
+    'counter', ('cache',), lambda: [((name,), stats()[1])
+                                    for name, stats in list(CACHES.items())]))
+REGISTRY.register(CallbackMetric(
+    'isaacbot_cache_hit_ratio', 'Share of the lookups served from a cache.',
+    'gauge', ('cache',), lambda: [((name,), hit_ratio(*stats()))
+                                  for name, stats in list(CACHES.items())]))
+
+# Single-flight groups watched by name, with a function returning the
+# lookups they served from another caller's fetch
+COALESCED = {}
+
+REGISTRY.register(CallbackMetric(
+    'isaacbot_coalesced_lookups_total',
+    'Cache misses served by a fetch already in progress.', 'counter',
+    ('group',), lambda: [((name,), shared())
+                         for name, shared in list(COALESCED.items())]))
+
+# The update handled in the current thread or task, if any
+CURRENT_UPDATE = contextvars.ContextVar('update', default=None)
+
+
+def watch_cache(name, stats):
+    """
+    Expose the hits and misses of a cache.
+
+    Args:
+        name (str): The cache name.
+        stats (callable): Returns the hits and misses of the cache when
+        called without arguments.
+    """
+    CACHES[name] = stats
+
+
+def watch_controller(controller):
+    """
+    Expose the caches of a controller and of the markups.
+
+    Args:
+        controller (Controller): The controller.
+    """
+    # Imported here, so the metrics don't depend on Telebot
+    from markups import Markup  # pylint: disable=C0415
+
+    for name, cache in (('render', controller.render_cache),
+                        ('inline', controller.inline_cache)):
+        watch_cache(name, lambda cache=cache: (cache.hits, cache.misses))
+    # The cached function is wrapped by staticmethod, which pylint reads as
+    # a missing argument
+    # pylint: disable=E1120
+    watch_cache('markup_entity',
+                lambda: tuple(Markup.markup_entity.cache_info()[:2]))
+    COALESCED['render'] = lambda: controller.single_flight.shared
+
+
+@contextmanager
+def track(handler, update=None):
+    """
+    Track an update while it is handled: its latency, errors and the calls
+    it makes.
+
+    Args:
+        handler (str): The handler of the update.
+        update (optional): The message, callback query or inline query
+        handled.
+
+    Yields:
+        UpdateStats: The calls made by the update.
+    """
+    stats = UpdateStats(handler, update)
+    token = CURRENT_UPDATE.set(stats)
+    IN_FLIGHT.inc(handler=handler)
+    start = time.perf_counter()
+    try:
+        yield stats
+    except Exception:
+        HANDLER_ERRORS.inc(handler=handler)
+        raise
+    finally:
+        HANDLER_LATENCY.observe(time.perf_counter() - start, handler=handler)
+        UPDATE_MONGO_CALLS.observe(stats.mongo_calls, handler=handler)
+        stats.finish()
+        if stats.mongo_commands:
+            UPDATE_MONGO_SECONDS.observe(stats.mongo_seconds, handler=handler)
+            logger.debug(
+                "%s made %d MongoDB commands in %.1f ms, slowest %s on %s "
+                "in %.1f ms", stats.describe(), stats.mongo_commands,
+                stats.mongo_seconds * 1000, stats.slowest[1],
+                stats.slowest[2], stats.slowest[0] * 1000)
+        IN_FLIGHT.dec(handler=handler)
+        CURRENT_UPDATE.reset(token)
+
+
+def timed(handler):
+    """
+    Decorate a handler, synchronous or asynchronous, to track the updates it
+    handles.
+
+    Args:
+        handler (str): The name of the handler in the metrics.
+
+    Returns:
+        function: The decorator.
+    """
+    def decorator(function):
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with track(handler, args[0] if args else None):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with track(handler, args[0] if args else None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_mongo_call(collection, operation):
+    """
+    Count a MongoDB call, and attribute it to the current update.
+
+    Args:
+        collection (str): The collection queried.
+        operation (str): The operation, such as 'find_one'.
+    """
+    MONGO_CALLS.inc(collection=collection, operation=operation)
+    stats = CURRENT_UPDATE.get()
+    if stats is not None:
+        stats.mongo_calls += 1
+
+
+def record_telegram_call(method, stats=None):
+    """
+    Count a Telegram API call, and attribute it to an update.
+
+    Args:
+        method (str): The API method, such as 'sendMessage'.
+        stats (UpdateStats, optional): The update the call is made for.
+        Defaults to the current one.
+    """
+    TELEGRAM_CALLS.inc(method=method)
+    if stats is None:
+        stats = CURRENT_UPDATE.get()
+    if stats is not None:
+        stats.record_telegram_call()
+
+
+def queue_telegram_call(method, submit, call):
+    """
+    Queue a Telegram API call, counting it when it is made instead of when
+    it is queued, so calls coalesced into another or never made aren't
+    counted.
+
+    The call is still attributed to the current update, whose calls are
+    observed once every queued one is settled, although queued calls are
+    made from other threads.
+
+    Args:
+        method (str): The API method, such as 'sendMessage'.
+        submit (callable): Queues the call, returning a Future, when called
+        with it.
+        call (callable): Makes the call when called without arguments.
+
+    Returns:
+        concurrent.futures.Future: Resolves to the result of the call.
+    """
+    stats = CURRENT_UPDATE.get()
+
+    def make():
+        record_telegram_call(method, stats)
+        return call()
+
+    future = submit(make)
+    if stats is not None:
+        stats.defer()
+        future.add_done_callback(lambda _: stats.settle())
+    return future
+
+
+class MeteredCollection:
+    """
+    Collection counting the queries made to it.
+
+    Attributes:
+        __collection: The collection queried.
+        __name (str): The collection name.
+    """
+
+    def __init__(self, collection, name):
+        """
+        Initializes a new instance of the MeteredCollection class.
+
+        Args:
+            collection: The collection queried.
+            name (str): The collection name.
+        """
+        self.__collection = collection
+        self.__name = name
+
+    def find(self, *args, **kwargs):
+        """
+        Retrieve the documents matching a query.
+
+        Returns:
+            The result of the collection's find.
+        """
+        record_mongo_call(self.__name, 'find')
+        return self.__collection.find(*args, **kwargs)
+
+    def find_one(self, *args, **kwargs):
+        """
+        Retrieve the first document matching a query.
+
+        Returns:
+            The result of the collection's find_one.
+        """
+        record_mongo_call(self.__name, 'find_one')
+        return self.__collection.find_one(*args, **kwargs)
+
+    def aggregate(self, *args, **kwargs):
+        """
+        Run an aggregation pipeline.
+
+        Returns:
+            The result of the collection's aggregate.
+        """
+        record_mongo_call(self.__name, 'aggregate')
+        return self.__collection.aggregate(*args, **kwargs)
+
+
+class MeteredDatabase:
+    """
+    Database whose collections count the queries made to them.
+
+    Attributes:
+        __database: The database queried, a pymongo, Motor or snapshot
+        database.
+    """
+
+    def __init__(self, database):
+        """
+        Initializes a new instance of the MeteredDatabase class.
+
+        Args:
+            database: The database queried.
+        """
+        self.__database = database
+
+    def __getitem__(self, name):
+        """
+        Retrieve a collection.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            MeteredCollection: The collection.
+        """
+        return MeteredCollection(self.__database[name], name)
+
+    def __getattr__(self, name):
+        """
+        Retrieve a collection as an attribute, as pymongo does.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            MeteredCollection: The collection.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self[name]
+
+
+class MetricsServer:
+    """
+    HTTP server exposing the metrics at /metrics.
+
+    Attributes:
+        registry (Registry): The metrics exposed.
+        server (ThreadingHTTPServer): The underlying HTTP server.
+    """
+
+    def __init__(self, registry=REGISTRY, address=('127.0.0.1', 9100)):
+        """
+        Initializes a new instance of the MetricsServer class.
+
+        Args:
+            registry (Registry, optional): The metrics exposed. Defaults to
+            REGISTRY.
+            address (tuple, optional): The (host, port) to listen on, port 0
+            picking a free one. Defaults to ('127.0.0.1', 9100), so the
+            metrics are only reachable locally.
+        """
+        self.registry = registry
+        self.server = ThreadingHTTPServer(address, self.__handler())
+        self.server.daemon_threads = True
+
+    @property
+    def address(self):
+        """
+        Retrieves the address the server listens on.
+
+        Returns:
+            tuple: The (host, port) the server is bound to.
+        """
+        return self.server.server_address
+
+    def __handler(self):
+        """
+        Build the request handler class bound to this server.
+
+        Returns:
+            type: A BaseHTTPRequestHandler subclass.
+        """
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Handles the scrapes of the metrics.
+            """
+
+            def do_GET(self):  # pylint: disable=C0103
+                """
+                Renders the metrics.
+                """
+                if self.path.partition('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # pylint: disable=W0221
+                """
+                Silences the per-request access log.
+                """
+
+        return Handler
+
+    def start(self):
+        """
+        Serve the metrics from a background thread.
+
+        Returns:
+            threading.Thread: The serving thread.
+        """
+        thread = threading.Thread(target=self.server.serve_forever,
+                                  daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        """
+        Stop serving the metrics.
+        """
+        self.server.shutdown()
+        self.server.server_close()
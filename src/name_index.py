@@ -0,0 +1,222 @@
+"""
+This module provides an in-memory index of game element names, so looking up
+an element by its name doesn't require a database round-trip per message.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import hashlib
+from bisect import bisect_left
+
+from symspell import SymSpell
+from trigram_index import TrigramIndex
+
+
+# Bytes of the name digest an ID is taken from
+ID_BYTES = 6
+
+
+def stable_id(name, attempt=0):
+    """
+    Derive the ID of an element from its name, so every process assigns it
+    the same ID regardless of the order the dataset is read in.
+
+    Args:
+        name (str): The element name.
+        attempt (int, optional): Number of IDs of the name already taken by
+        other names. Defaults to 0.
+
+    Returns:
+        int: The ID.
+    """
+    data = name.encode('utf-8')
+    if attempt:
+        data += b'\0' + str(attempt).encode('ascii')
+    return int.from_bytes(
+        hashlib.blake2b(data, digest_size=ID_BYTES).digest(), 'big')
+
+
+def assign_ids(names):
+    """
+    Assign a stable ID to every name of an element type.
+
+    Names whose IDs clash are resolved in alphabetical order, so the IDs
+    only depend on the names themselves.
+
+    Args:
+        names (iterable): The names of the element type.
+
+    Returns:
+        dict: Maps every name to its ID.
+    """
+    ids = {}
+    taken = set()
+    for name in sorted(set(names)):
+        attempt = 0
+        elem_id = stable_id(name)
+        while elem_id in taken:
+            attempt += 1
+            elem_id = stable_id(name, attempt)
+        taken.add(elem_id)
+        ids[name] = elem_id
+    return ids
+
+
+class NameIndex:
+    """
+    Process-wide index of element names, grouped by element type.
+
+    The index is loaded once from the database and can be refreshed on
+    demand. Every load is fully built before replacing the previous one, so
+    concurrent readers never see a partially loaded index.
+
+    Attributes:
+        __loaders (dict): Maps element types to a function retrieving their
+        names from a database, in lookup priority order.
+        __index (tuple): The names of every element type, the element type
+        and ID of every name, the name of every ID, the TrigramIndex and
+        SymSpell built over every name, and every (casefolded name, name)
+        sorted for prefix lookups.
+    """
+
+    def __init__(self, loaders):
+        """
+        Initializes a new, empty instance of the NameIndex class.
+
+        Args:
+            loaders (dict): Maps element types to a function retrieving their
+            names from a database. When a name exists in several types, the
+            first one wins.
+        """
+        self.__loaders = loaders
+        self.__index = ({}, {}, {}, {}, TrigramIndex([]), SymSpell([]), [])
+
+    def load(self, database):
+        """
+        Loads (or reloads) every element name from the database.
+
+        The ID of a name is derived from the name itself (see stable_id), so
+        it is the same in every process, across restarts and when other
+        elements are added, and buttons keep opening the same element.
+
+        Args:
+            database: A database object with the indexed collections.
+        """
+        names = {}
+        types = {}
+        ids = {}
+        by_id = {}
+        for elem_type, loader in self.__loaders.items():
+            names[elem_type] = tuple(loader(database))
+            for name, elem_id in assign_ids(names[elem_type]).items():
+                types.setdefault(name, elem_type)
+                ids[(elem_type, name)] = elem_id
+                by_id[(elem_type, elem_id)] = name
+
+        self.__index = (names, types, ids, by_id, TrigramIndex(types.keys()),
+                        SymSpell(types.keys()),
+                        sorted((name.casefold(), name) for name in types))
+
+    def get_type(self, name):
+        """
+        Retrieves the element type of an exact name.
+
+        Args:
+            name (str): The element name to look up.
+
+        Returns:
+            str or None: The element type, or None if the name is not indexed.
+        """
+        return self.__index[1].get(name)
+
+    def get_names(self, elem_type):
+        """
+        Retrieves every indexed name of an element type.
+
+        Args:
+            elem_type (str): The element type.
+
+        Returns:
+            tuple: The names of the element type, in database order.
+        """
+        return self.__index[0].get(elem_type, ())
+
+    def get_id(self, elem_type, name):
+        """
+        Retrieves the ID of a name among the names of its type.
+
+        Args:
+            elem_type (str): The element type.
+            name (str): The element name.
+
+        Returns:
+            int or None: The ID, or None if the name is not indexed.
+        """
+        return self.__index[2].get((elem_type, name))
+
+    def get_name(self, elem_type, elem_id):
+        """
+        Retrieves the name with an ID among the names of its type.
+
+        Args:
+            elem_type (str): The element type.
+            elem_id (int): The element ID.
+
+        Returns:
+            str or None: The name, or None if there isn't such ID.
+        """
+        return self.__index[3].get((elem_type, elem_id))
+
+    def correct(self, query):
+        """
+        Retrieves the name a query with up to two typos refers to.
+
+        Args:
+            query (str): The query to correct.
+
+        Returns:
+            str or None: The corrected name, or None if there isn't a single
+            close enough name.
+        """
+        return self.__index[5].lookup(query)
+
+    def similar(self, query):
+        """
+        Retrieves every indexed name similar to the query.
+
+        Args:
+            query (str): The query to compare against.
+
+        Returns:
+            list: Tuples with the name, element type and ID of every name
+            whose similarity ratio with the query is above 0.5, most similar
+            first.
+        """
+        _, types, ids, _, trigrams, _, _ = self.__index
+        return [(name, types[name], ids[(types[name], name)])
+                for name in trigrams.similar(query)]
+
+    def complete(self, prefix, limit=20):
+        """
+        Retrieves the indexed names starting with a prefix, ignoring case.
+
+        Args:
+            prefix (str): The prefix to complete.
+            limit (int, optional): Maximum number of names. Defaults to 20.
+
+        Returns:
+            list: Tuples with the name, element type and ID of every name
+            starting with the prefix, in alphabetical order.
+        """
+        _, types, ids, _, _, _, prefixes = self.__index
+        prefix = prefix.casefold()
+        result = []
+        position = bisect_left(prefixes, (prefix,))
+        while position < len(prefixes) and len(result) < limit:
+            folded, name = prefixes[position]
+            if not folded.startswith(prefix):
+                break
+            result.append((name, types[name], ids[(types[name], name)]))
+            position += 1
+        return result
@@ -0,0 +1,21 @@
+"""
+This script builds a packed snapshot of every rendered game element from the
+current dataset:
+
+    python3 src/pack.py isaac.pack
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import sys
+
+from bootstrap import create_controller, load_environment
+from packed_snapshot import pack_snapshot
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        sys.exit('Usage: python3 src/pack.py <path>')
+
+    load_environment()
+    pack_snapshot(create_controller().get_records(), sys.argv[1])
@@ -0,0 +1,168 @@
+"""
+This module provides a packed snapshot of pre-rendered game elements, read
+through mmap so several bot processes on one host share a single copy of the
+data in the OS page cache.
+
+A packed snapshot is built from the current dataset with:
+
+    python3 src/pack.py isaac.pack
+
+and used by setting the PACKED_SNAPSHOT_PATH environment variable.
+
+File layout:
+    - Header: magic, number of records and offset of the index.
+    - Records: rendered Markdown of every element and section, in UTF-8.
+    - Index: fixed-width (key offset, key length, record offset, record
+      length) entries sorted by key, followed by the keys.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import mmap
+import os
+import struct
+
+MAGIC = b'ISAACPK1'
+HEADER = struct.Struct('<8sIQ')
+ENTRY = struct.Struct('<QIQI')
+SEPARATOR = '\x1f'
+
+
+def make_key(elem_type, name, section=None):
+    """
+    Build the index key of an element or element section.
+
+    Args:
+        elem_type (str): The element type.
+        name (str): The element name.
+        section (str, optional): The section name.
+
+    Returns:
+        bytes: The encoded key.
+    """
+    parts = [elem_type, name] + ([section] if section else [])
+    return SEPARATOR.join(parts).encode('utf-8')
+
+
+def pack_snapshot(records, path):
+    """
+    Write a packed snapshot.
+
+    Args:
+        records (dict): Maps (elem_type, name) or (elem_type, name, section)
+        keys to their rendered Markdown.
+        path (str): Path of the packed snapshot, replaced if it exists.
+    """
+    entries = sorted((make_key(*key), text.encode('utf-8'))
+                     for key, text in records.items())
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as file:
+        file.write(b'\0' * HEADER.size)
+
+        offsets = []
+        for _, record in entries:
+            offsets.append(file.tell())
+            file.write(record)
+
+        index_offset = file.tell()
+        key_offset = index_offset + ENTRY.size * len(entries)
+        for (key, record), offset in zip(entries, offsets):
+            file.write(ENTRY.pack(key_offset, len(key), offset, len(record)))
+            key_offset += len(key)
+        for key, _ in entries:
+            file.write(key)
+
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, len(entries), index_offset))
+
+    # Replace the snapshot only once it is complete
+    os.replace(temp_path, path)
+
+
+class PackedSnapshot:
+    """
+    Read-only, memory-mapped packed snapshot.
+
+    Attributes:
+        path (str): Path of the packed snapshot.
+        __map (mmap.mmap): The mapped file.
+        __count (int): Number of records.
+        __index_offset (int): Offset of the first index entry.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new instance of the PackedSnapshot class.
+
+        Args:
+            path (str): Path of the packed snapshot.
+        """
+        self.path = path
+        with open(path, 'rb') as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.__count, self.__index_offset = HEADER.unpack_from(
+            self.__map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a packed snapshot")
+
+    def __entry(self, position):
+        """
+        Read an index entry.
+
+        Args:
+            position (int): Position of the entry in the index.
+
+        Returns:
+            tuple: The key, record offset and record length of the entry.
+        """
+        key_offset, key_length, offset, length = ENTRY.unpack_from(
+            self.__map, self.__index_offset + position * ENTRY.size)
+        return self.__map[key_offset:key_offset + key_length], offset, length
+
+    def get(self, elem_type, name, section=None):
+        """
+        Retrieve the rendered Markdown of an element or element section.
+
+        Args:
+            elem_type (str): The element type.
+            name (str): The element name.
+            section (str, optional): The section name.
+
+        Returns:
+            str or None: The rendered Markdown, or None if it isn't packed.
+        """
+        key = make_key(elem_type, name, section)
+        low, high = 0, self.__count
+        try:
+            while low < high:
+                middle = (low + high) // 2
+                entry_key, offset, length = self.__entry(middle)
+                if entry_key < key:
+                    low = middle + 1
+                elif entry_key > key:
+                    high = middle
+                else:
+                    return self.__map[offset:offset + length].decode('utf-8')
+        except ValueError:
+            # Closed by a reload while being read, so the element is
+            # rendered instead
+            pass
+        return None
+
+    def close(self):
+        """
+        Unmap the packed snapshot. Lookups on it find nothing afterwards.
+        """
+        self.__map.close()
+
+    def __len__(self):
+        """
+        Retrieve the number of records.
+
+        Returns:
+            int: The number of records.
+        """
+        return self.__count
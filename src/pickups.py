@@ -63,7 +63,7 @@ class Pickup:
             A list of pickup names extracted from the Pickups collection in the
             database.
         """
-        pickups = database.Pickups.find({})
+        pickups = database.Pickups.find({}, {'_id': 0, 'name': 1})
         return [pickup.get('name') for pickup in pickups]
 
     def get_element(self, database):
@@ -60,7 +60,7 @@ class Pill:
             A list of pill names extracted from the Pills collection in the
             database.
         """
-        pills = database.Pills.find({})
+        pills = database.Pills.find({}, {'_id': 0, 'name': 1})
         return [pill.get('name') for pill in pills]
 
     def get_element(self, database):
@@ -0,0 +1,121 @@
+"""
+This module provides the tracing of the MongoDB commands, so every find or
+find_one issued by the entity classes is attributed to the update that
+caused it, and slow commands are logged.
+
+The tracer is a pymongo command listener, passed to the client on startup.
+Every command is timed and added to the stats of the update handled in the
+same thread or task (see metrics.track). Updates issuing too many commands,
+such as one per element of a list, are logged once, which makes N+1
+patterns obvious. Motor runs commands in its own threads, but with a copy
+of the context of the task awaiting them, so they are attributed too.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import logging
+
+from pymongo import monitoring
+
+from metrics import CURRENT_UPDATE, MONGO_COMMAND_LATENCY
+
+logger = logging.getLogger(__name__)
+
+# Characters of a command filter kept in the slow-query log
+MAX_FILTER_LENGTH = 200
+
+
+class QueryTracer(monitoring.CommandListener):
+    """
+    Command listener timing the MongoDB commands and attributing them to
+    the update being handled.
+
+    Attributes:
+        slow_seconds (float): Commands taking longer are logged.
+        max_commands (int): Updates making more commands are logged.
+        __started (dict): Maps the connection and request of the commands
+        in progress to their name, collection, filter and update stats.
+    """
+
+    def __init__(self, slow_ms=100, max_commands=10):
+        """
+        Initializes a new instance of the QueryTracer class.
+
+        Args:
+            slow_ms (float, optional): Commands taking longer are logged.
+            Defaults to 100.
+            max_commands (int, optional): Updates making more commands are
+            logged. Defaults to 10.
+        """
+        self.slow_seconds = slow_ms / 1000
+        self.max_commands = max_commands
+        self.__started = {}
+
+    def started(self, event):
+        """
+        Remember a command until it finishes, with the update it was made
+        for.
+
+        Args:
+            event (monitoring.CommandStartedEvent): The started command.
+        """
+        command = event.command
+        collection = command.get(event.command_name)
+        if event.command_name == 'getMore':
+            collection = command.get('collection')
+        query = command.get('filter', command.get('pipeline'))
+        self.__started[(event.connection_id, event.request_id)] = (
+            str(collection), query, CURRENT_UPDATE.get())
+
+    def succeeded(self, event):
+        """
+        Trace a command that succeeded.
+
+        Args:
+            event (monitoring.CommandSucceededEvent): The finished command.
+        """
+        self.__finish(event)
+
+    def failed(self, event):
+        """
+        Trace a command that failed.
+
+        Args:
+            event (monitoring.CommandFailedEvent): The failed command.
+        """
+        self.__finish(event)
+
+    def __finish(self, event):
+        """
+        Time a finished command, attributing it to its update and logging it
+        if slow.
+
+        Args:
+            event: The succeeded or failed command event.
+        """
+        started = self.__started.pop(
+            (event.connection_id, event.request_id), None)
+        if started is None:
+            return
+
+        collection, query, stats = started
+        command = event.command_name
+        seconds = event.duration_micros / 1e6
+        MONGO_COMMAND_LATENCY.observe(seconds, command=command,
+                                      collection=collection)
+
+        if stats is not None:
+            stats.record_command(command, collection, seconds)
+            if stats.mongo_commands == self.max_commands + 1:
+                logger.warning(
+                    "%s made more than %d MongoDB commands, the last one "
+                    "%s on %s", stats.describe(), self.max_commands, command,
+                    collection)
+
+        if seconds >= self.slow_seconds:
+            logger.warning(
+                "Slow MongoDB command %s on %s took %.1f ms for %s: %s",
+                command, collection, seconds * 1000,
+                stats.describe() if stats is not None else "no update",
+                str(query)[:MAX_FILTER_LENGTH])
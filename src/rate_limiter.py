@@ -0,0 +1,356 @@
+"""
+This module provides an outbound rate limiter for the Telegram Bot API, so
+bursts of replies are spread within Telegram's limits instead of being
+answered with 429 errors.
+
+Sends are queued per chat and released by a small pool of workers under a
+global token bucket (about 30 messages per second) and a token bucket per
+chat (about 1 message per second). Interactive replies go before bulk ones,
+and sends with the same key, such as successive edits of a message, are
+coalesced into the latest one while they wait.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+# Priorities of the sends, lowest first
+INTERACTIVE = 0
+BULK = 1
+
+# Idle chats kept before their buckets are swept
+MAX_IDLE_CHATS = 1024
+
+
+class TokenBucket:
+    """
+    Token bucket allowing a sustained rate of events with short bursts.
+
+    Attributes:
+        rate (float): Tokens added per second.
+        capacity (float): Maximum number of tokens.
+        tokens (float): Tokens currently available.
+        updated (float): Monotonic time of the last refill.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Initializes a new, full instance of the TokenBucket class.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now):
+        """
+        Add the tokens earned since the last refill.
+
+        Args:
+            now (float): The current monotonic time.
+        """
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now):
+        """
+        Retrieve how long until a token is available.
+
+        Args:
+            now (float): The current monotonic time.
+
+        Returns:
+            float: Seconds to wait, 0 if a token is available.
+        """
+        self.refill(now)
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+    def take(self, now):
+        """
+        Take a token, which must be available.
+
+        Args:
+            now (float): The current monotonic time.
+        """
+        self.refill(now)
+        self.tokens -= 1
+
+    def drain(self, now, seconds):
+        """
+        Make the next token unavailable for a number of seconds.
+
+        Args:
+            now (float): The current monotonic time.
+            seconds (float): Seconds until the next token.
+        """
+        self.refill(now)
+        self.tokens = min(self.tokens, 1 - seconds * self.rate)
+
+    def is_full(self, now):
+        """
+        Check whether the bucket has refilled completely.
+
+        Args:
+            now (float): The current monotonic time.
+
+        Returns:
+            bool: Whether the bucket is full.
+        """
+        self.refill(now)
+        return self.tokens >= self.capacity
+
+
+class RateLimiter:
+    """
+    Queue of outbound sends released within global and per chat rates.
+
+    Sends to the same chat are made in order, one at a time.
+
+    Attributes:
+        __condition (threading.Condition): Guards the queues and wakes the
+        workers.
+        __bucket (TokenBucket): Global bucket.
+        __chat_rate (float): Sends per second to a single chat.
+        __chat_burst (float): Sends to a single chat allowed in a burst.
+        __buckets (dict): Maps chats to their bucket.
+        __queues (dict): Maps chats to their queued jobs.
+        __keys (dict): Maps coalescing keys to their queued job.
+        __scheduled (set): Chats waiting to be released or being sent to.
+        __ready (list): Heap of (priority, order, chat) of chats that can be
+        released once the global bucket allows it.
+        __delayed (list): Heap of (time, priority, order, chat) of chats
+        waiting for their own bucket.
+        __order (itertools.count): Tie breaker keeping the heaps FIFO.
+        __stopped (bool): Whether shutdown was requested.
+        __workers (list): The worker threads.
+    """
+
+    # Disable too many instance attributes, since the queues and their
+    # buckets are tracked separately to keep every lookup constant-time.
+    # pylint: disable=R0902
+
+    def __init__(self, rate=30, chat_rate=1, chat_burst=3, workers=4):
+        """
+        Initializes a new instance of the RateLimiter class and starts its
+        workers.
+
+        Args:
+            rate (float, optional): Sends per second overall. Defaults to 30.
+            chat_rate (float, optional): Sends per second to a single chat.
+            Defaults to 1.
+            chat_burst (float, optional): Sends to a single chat allowed in a
+            burst. Defaults to 3.
+            workers (int, optional): Number of sends made concurrently.
+            Defaults to 4.
+        """
+        self.__condition = threading.Condition()
+        # Sends are paced evenly, since Telegram limits them per second
+        self.__bucket = TokenBucket(rate, 1)
+        self.__chat_rate = chat_rate
+        self.__chat_burst = chat_burst
+        self.__buckets = {}
+        self.__queues = {}
+        self.__keys = {}
+        self.__scheduled = set()
+        self.__ready = []
+        self.__delayed = []
+        self.__order = itertools.count()
+        self.__stopped = False
+        self.__workers = [threading.Thread(target=self.__work, daemon=True)
+                          for _ in range(workers)]
+        for worker in self.__workers:
+            worker.start()
+
+    def submit(self, chat_id, call, priority=INTERACTIVE, key=None):
+        """
+        Queue a send to a chat.
+
+        Args:
+            chat_id: The chat the send goes to.
+            call (callable): Makes the send when called without arguments.
+            priority (int, optional): INTERACTIVE or BULK. Defaults to
+            INTERACTIVE.
+            key (optional): Coalescing key. A queued send with the same key
+            is replaced by this one. Defaults to None, never coalescing.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the result of the send.
+        """
+        with self.__condition:
+            if self.__stopped:
+                raise RuntimeError("The rate limiter was shut down")
+
+            job = self.__keys.get(key) if key is not None else None
+            if job is not None:
+                # Only the latest of the coalesced sends is made
+                job[0] = call
+                return job[1]
+
+            job = [call, Future(), key, priority]
+            if key is not None:
+                self.__keys[key] = job
+            if chat_id not in self.__queues:
+                if len(self.__buckets) > MAX_IDLE_CHATS:
+                    self.__sweep()
+                self.__queues[chat_id] = deque()
+                self.__buckets.setdefault(chat_id, TokenBucket(
+                    self.__chat_rate, self.__chat_burst))
+            self.__queues[chat_id].append(job)
+
+            if chat_id not in self.__scheduled:
+                self.__scheduled.add(chat_id)
+                heapq.heappush(self.__ready,
+                               (priority, next(self.__order), chat_id))
+                self.__condition.notify()
+            return job[1]
+
+    def __sweep(self):
+        """
+        Forget the buckets of idle chats that have refilled completely.
+        """
+        now = time.monotonic()
+        for chat_id in [chat_id for chat_id, bucket in self.__buckets.items()
+                        if chat_id not in self.__scheduled and
+                        bucket.is_full(now)]:
+            del self.__buckets[chat_id]
+
+    def __next_job(self):
+        """
+        Wait for the next job that can be released. Must be called with the
+        condition held.
+
+        Returns:
+            tuple or None: The chat and the job, or None once shutdown was
+            requested and every queue is empty.
+        """
+        while True:
+            now = time.monotonic()
+            while self.__delayed and self.__delayed[0][0] <= now:
+                _, priority, order, chat_id = heapq.heappop(self.__delayed)
+                heapq.heappush(self.__ready, (priority, order, chat_id))
+
+            timeout = None
+            if self.__delayed:
+                timeout = self.__delayed[0][0] - now
+            if self.__ready:
+                wait = self.__bucket.delay(now)
+                if not wait:
+                    priority, order, chat_id = heapq.heappop(self.__ready)
+                    bucket = self.__buckets[chat_id]
+                    wait = bucket.delay(now)
+                    if wait:
+                        heapq.heappush(self.__delayed,
+                                       (now + wait, priority, order, chat_id))
+                        continue
+
+                    self.__bucket.take(now)
+                    bucket.take(now)
+                    job = self.__queues[chat_id].popleft()
+                    self.__keys.pop(job[2], None)
+                    return chat_id, job
+                timeout = min(timeout, wait) if timeout else wait
+            elif self.__stopped and not self.__delayed:
+                return None
+            self.__condition.wait(timeout)
+
+    def __work(self):
+        """
+        Release jobs until shutdown is requested and the queues are empty.
+        """
+        while True:
+            with self.__condition:
+                released = self.__next_job()
+            if released is None:
+                return
+            self.__run(*released)
+
+    def __run(self, chat_id, job):
+        """
+        Make a send, and queue the next one of its chat.
+
+        A send answered with a 429 error is retried once the chat can send
+        again.
+
+        Args:
+            chat_id: The chat the send goes to.
+            job (list): The call, future, key and priority of the send.
+        """
+        call, future, _, priority = job
+        retry_after = None
+        # A retried send is already running
+        if future.running() or future.set_running_or_notify_cancel():
+            try:
+                result = call()
+            except Exception as error:  # pylint: disable=W0703
+                retry_after = self.retry_after(error)
+                if retry_after is None:
+                    logger.exception("Error sending to chat %s", chat_id)
+                    future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        with self.__condition:
+            now = time.monotonic()
+            queue = self.__queues[chat_id]
+            if retry_after is not None:
+                logger.warning("Chat %s rate limited for %s s", chat_id,
+                               retry_after)
+                queue.appendleft([call, future, None, priority])
+                self.__buckets[chat_id].drain(now, retry_after)
+
+            if not queue:
+                del self.__queues[chat_id]
+                self.__scheduled.discard(chat_id)
+                return
+            if retry_after is not None:
+                heapq.heappush(self.__delayed, (now + retry_after, priority,
+                                                next(self.__order), chat_id))
+            else:
+                heapq.heappush(self.__ready, (queue[0][3], next(self.__order),
+                                              chat_id))
+            self.__condition.notify()
+
+    @staticmethod
+    def retry_after(error):
+        """
+        Retrieve how long Telegram asked to wait after a failed send.
+
+        Args:
+            error (Exception): The error raised by the send.
+
+        Returns:
+            float or None: Seconds to wait, or None if the error isn't a 429.
+        """
+        if getattr(error, 'error_code', None) != 429:
+            return None
+        result = getattr(error, 'result_json', None) or {}
+        return float(result.get('parameters', {}).get('retry_after', 1))
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting sends, letting the queued ones finish.
+
+        Args:
+            wait (bool, optional): Whether to wait for the queued sends.
+            Defaults to True.
+        """
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify_all()
+        if wait:
+            for worker in self.__workers:
+                worker.join()
@@ -0,0 +1,95 @@
+"""
+This module provides a bounded cache for the rendered Markdown of game
+elements, so showing an element twice doesn't query and render it twice.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class RenderCache:
+    """
+    Thread-safe cache with least recently used eviction.
+
+    Attributes:
+        __maxsize (int): Maximum number of cached entries.
+        __entries (OrderedDict): Cached entries, least recently used first.
+        __lock (threading.Lock): Lock guarding the entries.
+        hits (int): Number of lookups served from the cache.
+        misses (int): Number of lookups not found in the cache.
+        generation (int): Bumped on every clear, so entries rendered before
+        it aren't cached after it.
+    """
+
+    def __init__(self, maxsize=2048):
+        """
+        Initializes a new, empty instance of the RenderCache class.
+
+        Args:
+            maxsize (int, optional): Maximum number of cached entries.
+            Defaults to 2048.
+        """
+        self.__maxsize = maxsize
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+    def get(self, key):
+        """
+        Retrieves a cached entry, marking it as recently used.
+
+        Args:
+            key (tuple): The entry key.
+
+        Returns:
+            str or None: The cached entry, or None if it isn't cached.
+        """
+        with self.__lock:
+            value = self.__entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, generation=None):
+        """
+        Caches an entry, evicting the least recently used one if full.
+
+        Args:
+            key (tuple): The entry key.
+            value (str): The entry to cache.
+            generation (int, optional): The generation the entry was rendered
+            in. The entry is dropped if the cache was cleared since then.
+            Defaults to None, caching it anyway.
+        """
+        with self.__lock:
+            if generation is not None and generation != self.generation:
+                return
+            self.__entries[key] = value
+            self.__entries.move_to_end(key)
+            if len(self.__entries) > self.__maxsize:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes every cached entry.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.generation += 1
+
+    def __len__(self):
+        """
+        Retrieves the number of cached entries.
+
+        Returns:
+            int: The number of cached entries.
+        """
+        return len(self.__entries)
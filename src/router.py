@@ -0,0 +1,119 @@
+"""
+This module provides the routing of callback queries to their handlers.
+
+Buttons carry structured callback data, an operation followed by its
+arguments, all separated by colons:
+
+    k:3
+    i:12:Effects
+
+The operation is looked up in a route table, so dispatching a callback takes
+a single dict lookup however many operations are registered, and names can't
+be mistaken for another operation.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+SEPARATOR = ':'
+
+
+def callback_data(operation, *args):
+    """
+    Build the callback data of a button.
+
+    Args:
+        operation (str): The operation handling the callback.
+        *args (str): The arguments of the operation. Only the last one may
+        contain the separator.
+
+    Returns:
+        str: The callback data.
+    """
+    return SEPARATOR.join((operation,) + args)
+
+
+class CallbackRouter:
+    """
+    Route table dispatching callback queries by their operation.
+
+    Attributes:
+        __routes (dict): Maps operations to their handler and number of
+        arguments.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new instance of the CallbackRouter class.
+        """
+        self.__routes = {}
+
+    def route(self, operation, arity=1, optional=0):
+        """
+        Register the decorated function as the handler of an operation.
+
+        The handler is called with the callback query followed by the
+        arguments of the operation.
+
+        Args:
+            operation (str): The operation to handle.
+            arity (int, optional): Number of arguments of the operation.
+            Defaults to 1.
+            optional (int, optional): Number of trailing arguments that can
+            be left out, for which the handler has defaults. Defaults to 0.
+
+        Returns:
+            function: The decorator.
+        """
+        def decorator(handler):
+            if operation in self.__routes:
+                raise ValueError(f"Operation {operation} is already routed")
+            self.__routes[operation] = (handler, arity, optional)
+            return handler
+        return decorator
+
+    def resolve(self, data):
+        """
+        Resolve callback data into its handler and arguments.
+
+        Args:
+            data (str): The callback data.
+
+        Returns:
+            tuple or None: The handler and its arguments, or None if the data
+            doesn't match any route.
+        """
+        operation, _, payload = data.partition(SEPARATOR)
+        route = self.__routes.get(operation)
+        if route is None:
+            return None
+
+        handler, arity, optional = route
+        # The last argument keeps any separator it contains
+        args = payload.split(SEPARATOR, arity - 1) if payload else []
+        if not arity - optional <= len(args) <= arity:
+            return None
+        return handler, args
+
+    def dispatch(self, call):
+        """
+        Call the handler of a callback query.
+
+        Args:
+            call (telebot.types.CallbackQuery): The callback query object from
+            Telegram.
+
+        Returns:
+            The result of the handler, or None if no route matches.
+        """
+        resolved = self.resolve(call.data)
+        if resolved is None:
+            logger.warning("No route for callback data %r", call.data)
+            return None
+
+        handler, args = resolved
+        return handler(call, *args)
@@ -63,7 +63,7 @@ class Rune:
             A list of rune names extracted from the Runes collection in the
             database.
         """
-        runes = database.Runes.find({})
+        runes = database.Runes.find({}, {'_id': 0, 'name': 1})
         return [rune.get('name') for rune in runes]
 
     def get_element(self, database):
@@ -0,0 +1,71 @@
+"""
+This module provides request coalescing (single-flight), so concurrent
+lookups of the same key wait for one in-progress fetch and share its result
+instead of each reaching the database.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import threading
+from concurrent.futures import Future
+
+# Disable too few public methods warning, since a single entry point is all
+# the callers need
+# pylint: disable=R0903
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time, sharing its outcome with the
+    callers that arrive while it is in progress.
+
+    Attributes:
+        shared (int): Number of callers served by another caller's call.
+        __lock (threading.Lock): Guards the calls in progress.
+        __calls (dict): Maps keys to the future of their call in progress.
+    """
+
+    def __init__(self):
+        """
+        Initializes a new instance of the SingleFlight class.
+        """
+        self.shared = 0
+        self.__lock = threading.Lock()
+        self.__calls = {}
+
+    def do(self, key, function):
+        """
+        Call a function, unless a call for the same key is in progress, in
+        which case wait for it and share its outcome.
+
+        Args:
+            key: Hashable key identifying the call.
+            function (callable): Called without arguments.
+
+        Returns:
+            The result of the function. Errors are raised to every caller
+            sharing the call.
+        """
+        with self.__lock:
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.__calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if not leader:
+            return call.result()
+
+        try:
+            result = function()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self.__lock:
+                del self.__calls[key]
@@ -0,0 +1,358 @@
+"""
+This module provides a local SQLite snapshot of the MongoDB dataset, so the
+bot can serve every request without reaching MongoDB Atlas.
+
+A snapshot is exported with:
+
+    python3 src/snapshot.py export isaac.db
+
+and used by setting the SNAPSHOT_PATH environment variable.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+# Fields the entity classes query by, stored in indexed columns so lookups by
+# them don't decode every document of the collection
+INDEXED_FIELDS = ('name', 'number', 'deck')
+
+
+def indexed_value(document, field):
+    """
+    Retrieve the value of a field as stored in its indexed column.
+
+    Args:
+        document (dict): The exported document.
+        field (str): The indexed field.
+
+    Returns:
+        The value of the field, or its JSON text if it isn't a scalar.
+    """
+    value = document.get(field)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return json.dumps(value, default=str)
+
+
+def export_snapshot(database, path):
+    """
+    Export every collection of a database into a SQLite snapshot.
+
+    Args:
+        database: A pymongo database object.
+        path (str): Path of the snapshot file, replaced if it exists.
+    """
+    temp_path = f"{path}.tmp"
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+
+    connection = sqlite3.connect(temp_path)
+    with connection:
+        # Number and deck are left without a type, so their values are
+        # compared as exported, as MongoDB does
+        connection.execute(
+            "CREATE TABLE documents (collection TEXT, position INTEGER, "
+            "name TEXT, number, deck, document TEXT, "
+            "PRIMARY KEY (collection, position))")
+        # Covering the position lets lookups return documents in export
+        # order from the index, instead of scanning the whole collection
+        for field in INDEXED_FIELDS:
+            connection.execute(
+                f"CREATE INDEX documents_{field} ON documents "
+                f"(collection, {field}, position)")
+        for collection in database.list_collection_names():
+            for position, document in enumerate(
+                    database[collection].find({}, {'_id': 0})):
+                connection.execute(
+                    "INSERT INTO documents VALUES (?, ?, ?, ?, ?, ?)",
+                    (collection, position,
+                     *(indexed_value(document, field)
+                       for field in INDEXED_FIELDS),
+                     json.dumps(document, default=str)))
+    connection.close()
+
+    # Replace the snapshot only once it is complete
+    os.replace(temp_path, path)
+
+
+def matches(document, query):
+    """
+    Check whether a document matches a query with equality and $ne
+    conditions.
+
+    Args:
+        document (dict): The document to check.
+        query (dict): The query to match.
+
+    Returns:
+        bool: Whether the document matches the query.
+    """
+    for key, condition in query.items():
+        value = document.get(key)
+        if isinstance(condition, dict):
+            if '$ne' in condition and value == condition['$ne']:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def project(document, projection):
+    """
+    Apply an inclusion projection to a document.
+
+    Args:
+        document (dict): The document to project.
+        projection (dict or None): Fields to include, and '_id': 0 to
+        exclude the id.
+
+    Returns:
+        dict: The projected document.
+    """
+    if not projection:
+        return document
+    fields = [key for key, value in projection.items() if value]
+    if projection.get('_id', 1):
+        fields.append('_id')
+    return {key: document[key] for key in fields if key in document}
+
+
+class SnapshotCollection:
+    """
+    Read-only collection of a snapshot, implementing the subset of the
+    pymongo collection API used by the entity classes.
+
+    Attributes:
+        __snapshot (SnapshotDatabase): The snapshot the collection belongs to.
+        __name (str): The collection name.
+    """
+
+    def __init__(self, snapshot, name):
+        """
+        Initializes a new instance of the SnapshotCollection class.
+
+        Args:
+            snapshot (SnapshotDatabase): The snapshot the collection belongs
+            to.
+            name (str): The collection name.
+        """
+        self.__snapshot = snapshot
+        self.__name = name
+
+    def __documents(self, query):
+        """
+        Retrieve the documents matching a query, in export order.
+
+        Args:
+            query (dict): The query to match.
+
+        Returns:
+            generator: The matching documents, with their position as '_id'.
+        """
+        # Conditions on indexed fields narrow the rows in SQL, the rest are
+        # checked once the documents are decoded
+        conditions, parameters = ['collection = ?'], [self.__name]
+        for key, condition in query.items():
+            if key not in self.__snapshot.indexed_fields:
+                continue
+            if isinstance(condition, dict):
+                if '$ne' not in condition:
+                    continue
+                operator, condition = 'IS NOT', condition['$ne']
+            else:
+                operator = 'IS'
+            if condition is None or isinstance(condition, (str, int, float)):
+                conditions.append(f"{key} {operator} ?")
+                parameters.append(condition)
+
+        rows = self.__snapshot.execute(
+            "SELECT position, document FROM documents "
+            f"WHERE {' AND '.join(conditions)} ORDER BY position",
+            tuple(parameters))
+        for position, document in rows:
+            document = json.loads(document)
+            document['_id'] = position
+            if matches(document, query):
+                yield document
+
+    def find(self, query=None, projection=None):
+        """
+        Retrieve the documents matching a query.
+
+        Args:
+            query (dict, optional): The query to match. Defaults to every
+            document.
+            projection (dict, optional): Fields to include.
+
+        Returns:
+            list: The matching documents.
+        """
+        return [project(document, projection)
+                for document in self.__documents(query or {})]
+
+    def find_one(self, query=None, projection=None):
+        """
+        Retrieve the first document matching a query.
+
+        Args:
+            query (dict, optional): The query to match. Defaults to every
+            document.
+            projection (dict, optional): Fields to include.
+
+        Returns:
+            dict or None: The first matching document, or None.
+        """
+        for document in self.__documents(query or {}):
+            return project(document, projection)
+        return None
+
+    def aggregate(self, pipeline):
+        """
+        Run an aggregation pipeline with $match, $group (grouping by a field
+        with $min or $first accumulators) and $sort stages.
+
+        Args:
+            pipeline (list): The pipeline stages.
+
+        Returns:
+            list: The resulting documents.
+        """
+        # A leading $match is run as a query, to use the indexed fields
+        query = {}
+        if pipeline and '$match' in pipeline[0]:
+            query, pipeline = pipeline[0]['$match'], pipeline[1:]
+        documents = list(self.__documents(query))
+        for stage in pipeline:
+            (operator, spec), = stage.items()
+            if operator == '$match':
+                documents = [doc for doc in documents if matches(doc, spec)]
+            elif operator == '$group':
+                documents = self.__group(documents, spec)
+            elif operator == '$sort':
+                for key, direction in reversed(list(spec.items())):
+                    documents.sort(key=lambda doc, key=key: doc.get(key),
+                                   reverse=direction < 0)
+            else:
+                raise ValueError(f"Unsupported stage {operator}")
+        return documents
+
+    @staticmethod
+    def __group(documents, spec):
+        """
+        Group documents by a field.
+
+        Args:
+            documents (list): The documents to group.
+            spec (dict): The $group stage specification.
+
+        Returns:
+            list: One document per group, in order of first appearance.
+        """
+        groups = {}
+        for document in documents:
+            group_id = document.get(spec['_id'].lstrip('$'))
+            group = groups.setdefault(group_id, {'_id': group_id})
+            for field, accumulator in spec.items():
+                if field == '_id':
+                    continue
+                (operator, source), = accumulator.items()
+                value = document.get(source.lstrip('$'))
+                if field not in group or \
+                        (operator == '$min' and value < group[field]):
+                    group[field] = value
+        return list(groups.values())
+
+
+class SnapshotDatabase:
+    """
+    Read-only database backed by a SQLite snapshot, used in place of a
+    pymongo database.
+
+    Attributes:
+        indexed_fields (frozenset): Fields with an indexed column, fewer in
+        snapshots exported before they were added.
+        __path (str): Path of the snapshot file.
+        __local (threading.local): Per-thread SQLite connections.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes a new instance of the SnapshotDatabase class.
+
+        Args:
+            path (str): Path of the snapshot file.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Snapshot {path} does not exist")
+        self.__path = path
+        self.__local = threading.local()
+        columns = {row[1] for row in self.execute(
+            "PRAGMA table_info(documents)")}
+        self.indexed_fields = frozenset(INDEXED_FIELDS) & columns
+
+    def execute(self, sql, parameters=()):
+        """
+        Run a query on the snapshot with the connection of the current
+        thread.
+
+        Args:
+            sql (str): The SQL query.
+            parameters (tuple, optional): The query parameters.
+
+        Returns:
+            list: The resulting rows.
+        """
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                f"file:{self.__path}?mode=ro", uri=True)
+            self.__local.connection = connection
+        return connection.execute(sql, parameters).fetchall()
+
+    def __getitem__(self, name):
+        """
+        Retrieve a collection of the snapshot.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            SnapshotCollection: The collection.
+        """
+        return SnapshotCollection(self, name)
+
+    def __getattr__(self, name):
+        """
+        Retrieve a collection of the snapshot as an attribute, as pymongo
+        does.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            SnapshotCollection: The collection.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return SnapshotCollection(self, name)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] != 'export':
+        sys.exit('Usage: python3 src/snapshot.py export <path>')
+
+    # Only the export needs MongoDB
+    # pylint: disable=C0415
+    import pymongo
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path='.env')
+    client = pymongo.MongoClient(os.getenv('MONGO_TOKEN'),
+                                 serverSelectionTimeoutMS=2000)
+    export_snapshot(client.Isaac, sys.argv[2])
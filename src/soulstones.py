@@ -63,7 +63,7 @@ class SoulStone:
             A list of soul stone names extracted from the Soulstones
             collection in the database.
         """
-        soulstones = database.SoulStones.find({})
+        soulstones = database.SoulStones.find({}, {'_id': 0, 'name': 1})
         return [soulstone.get('name') for soulstone in soulstones]
 
     def get_element(self, database):
@@ -0,0 +1,203 @@
+"""
+This module provides a symmetric delete spelling corrector, used to resolve
+names with a couple of typos directly to the intended element.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+
+class SymSpell:
+    """
+    Symmetric delete dictionary of element names.
+
+    Every name is stored under all the strings obtained by deleting up to
+    max_distance characters from its prefix, and from its suffix. A query
+    generates its own deletes, so candidates are found with dictionary hits
+    and only those are checked with the edit distance.
+
+    Candidates must be hit both by the prefix and by the suffix of the
+    query, so names sharing only their first words, such as "Mom's ...",
+    aren't all checked.
+
+    Attributes:
+        __max_distance (int): Maximum edit distance of a correction.
+        __prefix_length (int): Length of the prefix and suffix used to
+        generate deletes.
+        __max_candidates (int): Maximum number of candidates checked with
+        the edit distance. Queries with more are too ambiguous to correct.
+        __words (dict): Maps every normalized name to its original name.
+        __prefixes (dict): Maps every delete of a prefix to the normalized
+        names it comes from.
+        __suffixes (dict): Maps every delete of a suffix to the normalized
+        names it comes from.
+    """
+
+    def __init__(self, names, max_distance=2, prefix_length=7,
+                 max_candidates=64):
+        """
+        Initializes a new instance of the SymSpell class.
+
+        Args:
+            names (list): Names to index.
+            max_distance (int, optional): Maximum edit distance of a
+            correction. Defaults to 2.
+            prefix_length (int, optional): Length of the prefix and suffix
+            used to generate deletes. Defaults to 7.
+            max_candidates (int, optional): Maximum number of candidates
+            checked with the edit distance. Defaults to 64.
+        """
+        self.__max_distance = max_distance
+        self.__prefix_length = prefix_length
+        self.__max_candidates = max_candidates
+        self.__words = {}
+        self.__prefixes = {}
+        self.__suffixes = {}
+
+        for name in names:
+            word = self.normalize(name)
+            if word in self.__words:
+                continue
+            self.__words[word] = name
+            for delete in self.deletes(word[:prefix_length], max_distance):
+                self.__prefixes.setdefault(delete, []).append(word)
+            for delete in self.deletes(word[-prefix_length:], max_distance):
+                self.__suffixes.setdefault(delete, []).append(word)
+
+    @staticmethod
+    def normalize(text):
+        """
+        Normalize a text so corrections are case-insensitive.
+
+        Args:
+            text (str): The text to normalize.
+
+        Returns:
+            str: The normalized text.
+        """
+        return " ".join(text.casefold().split())
+
+    @staticmethod
+    def deletes(word, max_distance):
+        """
+        Generate every string obtained by deleting up to max_distance
+        characters from a word.
+
+        Args:
+            word (str): The word to generate deletes from.
+            max_distance (int): Maximum number of deleted characters.
+
+        Returns:
+            set: The deletes, including the word itself.
+        """
+        result = {word}
+        edits = {word}
+        for _ in range(max_distance):
+            edits = {edit[:i] + edit[i + 1:]
+                     for edit in edits for i in range(len(edit))}
+            result |= edits
+        return result
+
+    @staticmethod
+    def distance(source, target, max_distance):
+        """
+        Compute the optimal string alignment distance between two strings.
+
+        Args:
+            source (str): The first string.
+            target (str): The second string.
+            max_distance (int): Distance above which computing stops.
+
+        Returns:
+            int: The distance, or max_distance + 1 if it is greater than
+            max_distance.
+        """
+        if abs(len(source) - len(target)) > max_distance:
+            return max_distance + 1
+
+        current = list(range(len(target) + 1))
+        previous = current
+        for i in range(1, len(source) + 1):
+            previous, before = current, previous
+            current = [i] + [0] * len(target)
+            for j in range(1, len(target) + 1):
+                cost = 0 if source[i - 1] == target[j - 1] else 1
+                current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                                 previous[j - 1] + cost)
+                if (i > 1 and j > 1 and source[i - 1] == target[j - 2]
+                        and source[i - 2] == target[j - 1]):
+                    current[j] = min(current[j], before[j - 2] + 1)
+            if min(current) > max_distance:
+                return max_distance + 1
+
+        return current[-1]
+
+    def allowed_distance(self, query):
+        """
+        Compute the maximum edit distance allowed for a query, so short
+        queries aren't corrected into unrelated names.
+
+        Args:
+            query (str): The normalized query.
+
+        Returns:
+            int: The allowed edit distance.
+        """
+        return min(self.__max_distance, len(query) // 4)
+
+    def candidates(self, deletes, affix, max_distance):
+        """
+        Retrieve the names sharing a delete with the prefix or suffix of a
+        query.
+
+        Args:
+            deletes (dict): Maps every delete to the names it comes from.
+            affix (str): The prefix or suffix of the normalized query.
+            max_distance (int): Maximum number of deleted characters.
+
+        Returns:
+            set: The normalized candidate names.
+        """
+        result = set()
+        for delete in self.deletes(affix, max_distance):
+            result.update(deletes.get(delete, ()))
+        return result
+
+    def lookup(self, query):
+        """
+        Retrieve the name the query most likely refers to.
+
+        Args:
+            query (str): The query to correct.
+
+        Returns:
+            str or None: The corrected name, or None if there isn't a single
+            closest name within the allowed distance, or there are too many
+            candidates to tell.
+        """
+        word = self.normalize(query)
+        if word in self.__words:
+            return self.__words[word]
+
+        max_distance = self.allowed_distance(word)
+        if not max_distance:
+            return None
+
+        # Look for the closest names first, so most typos don't need the
+        # larger candidate sets of greater distances
+        for distance in range(1, max_distance + 1):
+            candidates = self.candidates(
+                self.__prefixes, word[:self.__prefix_length], distance)
+            candidates &= self.candidates(
+                self.__suffixes, word[-self.__prefix_length:], distance)
+            candidates = [candidate for candidate in candidates
+                          if abs(len(candidate) - len(word)) <= distance]
+            if len(candidates) > self.__max_candidates:
+                # Too ambiguous to be resolved directly
+                return None
+
+            best = [candidate for candidate in candidates
+                    if self.distance(word, candidate, distance) <= distance]
+            if best:
+                return self.__words[best[0]] if len(best) == 1 else None
+        return None
@@ -0,0 +1,130 @@
+"""
+This module provides an in-memory full-text index over the sections of game
+elements (effects, notes, synergies and interactions), ranked with BM25.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import heapq
+import math
+import re
+
+# Words too common to help ranking
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'do', 'does', 'for',
+    'from', 'has', 'have', 'how', 'i', 'if', 'in', 'is', 'it', 'its', 'me',
+    'of', 'on', 'or', 'that', 'the', 'this', 'to', 'what', 'when', 'which',
+    'who', 'with'
+}
+
+
+class TextIndex:
+    """
+    Inverted index from words to the game elements whose sections contain
+    them.
+
+    Queries only visit the postings of their own words, so answering doesn't
+    depend on scanning every element.
+
+    Attributes:
+        __loaders (dict): Maps element types to a function retrieving
+        (name, texts) tuples from a database.
+        __k1 (float): BM25 term frequency saturation.
+        __b (float): BM25 document length normalization.
+        __index (tuple): The (name, type) tuple of every document, the number
+        of words of every document, the postings mapping every word to
+        (document id, frequency) tuples, and the average document length.
+    """
+
+    def __init__(self, loaders, k1=1.2, b=0.75):
+        """
+        Initializes a new, empty instance of the TextIndex class.
+
+        Args:
+            loaders (dict): Maps element types to a function retrieving
+            (name, texts) tuples from a database.
+            k1 (float, optional): BM25 term frequency saturation.
+            Defaults to 1.2.
+            b (float, optional): BM25 document length normalization.
+            Defaults to 0.75.
+        """
+        self.__loaders = loaders
+        self.__k1 = k1
+        self.__b = b
+        self.__index = ([], [], {}, 0)
+
+    @staticmethod
+    def tokenize(text):
+        """
+        Split a text into normalized words, without stopwords.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            list: The words of the text.
+        """
+        words = []
+        for word in re.findall(r"[a-z0-9]+", text.lower()):
+            if word in STOPWORDS:
+                continue
+            # Naive plural stemming, so "grant" also finds "grants"
+            if len(word) > 3 and word.endswith('s') and \
+                    not word.endswith('ss'):
+                word = word[:-1]
+            words.append(word)
+        return words
+
+    def load(self, database):
+        """
+        Loads (or reloads) every element section from the database.
+
+        Args:
+            database: A database object with the indexed collections.
+        """
+        documents = []
+        lengths = []
+        postings = {}
+        for elem_type, loader in self.__loaders.items():
+            for name, texts in loader(database):
+                frequencies = {}
+                for text in texts:
+                    for word in self.tokenize(text):
+                        frequencies[word] = frequencies.get(word, 0) + 1
+                for word, frequency in frequencies.items():
+                    postings.setdefault(word, []).append(
+                        (len(documents), frequency))
+                documents.append((name, elem_type))
+                lengths.append(sum(frequencies.values()))
+
+        average_length = sum(lengths) / len(lengths) if lengths else 0
+        self.__index = (documents, lengths, postings, average_length)
+
+    def search(self, query, limit=10):
+        """
+        Retrieves the game elements whose sections best match a query.
+
+        Args:
+            query (str): Words to search for.
+            limit (int, optional): Maximum number of results. Defaults to 10.
+
+        Returns:
+            list: (name, type) tuples of the matching elements, best first.
+        """
+        documents, lengths, postings, average_length = self.__index
+        scores = {}
+        for word in set(self.tokenize(query)):
+            word_postings = postings.get(word, ())
+            if not word_postings:
+                continue
+            idf = math.log(1 + (len(documents) - len(word_postings) + 0.5)
+                           / (len(word_postings) + 0.5))
+            for doc_id, frequency in word_postings:
+                norm = self.__k1 * (1 - self.__b + self.__b *
+                                    lengths[doc_id] / average_length)
+                scores[doc_id] = scores.get(doc_id, 0) + (
+                    idf * frequency * (self.__k1 + 1) / (frequency + norm))
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda s: s[1])
+        return [documents[doc_id] for doc_id, _ in best]
@@ -5,6 +5,8 @@ Author: Carlos Morales Aguilera
 Date: 05-Nov-2023
 """
 
+from emojis import Emojis
+
 
 class Transformation:
     """
@@ -24,14 +26,13 @@ class Transformation:
         self.__name = name
 
     @staticmethod
-    def to_str(transformation, database):
+    def to_str(transformation):
         """
         Convert a transformation to a formatted string representation.
 
         Args:
             transformation (dict): A dictionary representing a transformation
             with 'name', 'description', 'condition', and 'effects' keys.
-            database: A database object with a Emoji collection.
 
         Returns:
             str: A formatted string representation of the transformation,
@@ -61,10 +62,7 @@ class Transformation:
             # Get all effects
             for key, value in effects.items():
                 # Retrieve emoji if defined
-                emoji = database.Emojis.find_one({'key': key})
-                if emoji:
-                    emoji = emoji.get('value').encode('utf-8').decode(
-                        'unicode_escape')
+                emoji = Emojis.get(key)
                 content.append(f"• {emoji or key}: {value}.")
             content = "\n".join(content)
 
@@ -81,7 +79,8 @@ class Transformation:
             A list of transformation names extracted from the Transformations
             collection in the database.
         """
-        transformations = database.Transformations.find({})
+        transformations = database.Transformations.find(
+            {}, {'_id': 0, 'name': 1})
         return [
             transformation.get('name') for transformation in transformations
         ]
@@ -95,4 +94,4 @@ class Transformation:
         """
         transformation = database.Transformations.find_one(
             {"name": self.__name})
-        return self.to_str(transformation, database)
+        return self.to_str(transformation)
@@ -0,0 +1,99 @@
+"""
+This module provides a character trigram index used to find names similar to
+a query without comparing the query against every indexed name.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+from collections import Counter
+from difflib import SequenceMatcher
+
+
+class TrigramIndex:
+    """
+    Inverted index from character trigrams to the names containing them.
+
+    Candidates sharing the most trigrams with the query are scored with
+    SequenceMatcher, so only a bounded number of names pay the expensive
+    comparison regardless of the size of the index.
+
+    Attributes:
+        __names (list): Indexed names, by name id.
+        __postings (dict): Maps each trigram to the ids of the names
+        containing it.
+        __max_candidates (int): Maximum number of names to score per query.
+    """
+
+    def __init__(self, names, max_candidates=50):
+        """
+        Initializes a new instance of the TrigramIndex class.
+
+        Args:
+            names (list): Names to index.
+            max_candidates (int, optional): Maximum number of names scored
+            per query. Defaults to 50.
+        """
+        self.__names = list(names)
+        self.__postings = {}
+        self.__max_candidates = max_candidates
+
+        for name_id, name in enumerate(self.__names):
+            for trigram in self.trigrams(name):
+                self.__postings.setdefault(trigram, []).append(name_id)
+
+    @staticmethod
+    def trigrams(text):
+        """
+        Split a text into its set of case-insensitive character trigrams.
+
+        Args:
+            text (str): The text to split.
+
+        Returns:
+            set: Trigrams of the text, padded so short texts have trigrams.
+        """
+        padded = f"  {text.lower()} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+    def candidates(self, query):
+        """
+        Retrieve the names sharing the most trigrams with the query.
+
+        Args:
+            query (str): The query to compare against.
+
+        Returns:
+            list: Up to max_candidates names, most shared trigrams first.
+        """
+        counts = Counter()
+        for trigram in self.trigrams(query):
+            counts.update(self.__postings.get(trigram, ()))
+
+        return [self.__names[name_id]
+                for name_id, _ in counts.most_common(self.__max_candidates)]
+
+    def similar(self, query, threshold=0.5):
+        """
+        Retrieve the indexed names similar to the query.
+
+        Args:
+            query (str): The query to compare against.
+            threshold (float, optional): Minimum similarity ratio (exclusive).
+            Defaults to 0.5.
+
+        Returns:
+            list: Similar names, most similar first.
+        """
+        scored = []
+        for name in self.candidates(query):
+            # Upper bound of the ratio, cheaper than computing it
+            bound = 2 * min(len(query), len(name)) / (len(query) + len(name))
+            if bound <= threshold:
+                continue
+            ratio = SequenceMatcher(None, query, name).ratio()
+            if ratio > threshold:
+                scored.append((ratio, name))
+
+        scored.sort(key=lambda score: score[0], reverse=True)
+        return [name for _, name in scored]
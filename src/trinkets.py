@@ -5,8 +5,6 @@ Author: Carlos Morales Aguilera
 Date: 08-Nov-2023
 """
 
-from difflib import SequenceMatcher
-
 
 class Trinket:
     """
@@ -14,8 +12,12 @@ class Trinket:
 
     Attributes:
         __name (str): The name of the trinket.
+        FIELDS (dict): Projection of the fields rendered by to_str.
     """
 
+    FIELDS = {'_id': 0, 'name': 1, 'message': 1, 'description': 1,
+              'unlock': 1}
+
     def __init__(self, name: str):
         """
         Initializes a new instance of the Trinket class.
@@ -76,35 +78,40 @@ class Trinket:
             content.append(f"• {element}")
         return "\n".join(content)
 
-    def get_list_elements(self, database, query, exact):
+    def get_list_elements(self, database):
         """
         Retrieve a list of trinket names from the provided database.
 
         Args:
             database: A database object with a Trinkets collection.
-            query: Trinket name to find.
-            exact: Whether to retrieve a trinket or a list of possible results.
 
         Returns:
             A list of trinket names extracted from the Trinkets
             collection in the database.
         """
-        trinkets = database.Trinkets.find({})
-        trinkets = [trinket.get('name') for trinket in trinkets]
-        result_trinkets = []
+        trinkets = database.Trinkets.find({}, {'_id': 0, 'name': 1})
+        return [trinket.get('name') for trinket in trinkets]
+
+    def get_list_texts(self, database):
+        """
+        Retrieve the section texts of every trinket from the provided
+        database.
 
-        if query in trinkets:
-            return query
-        if exact:
-            return False
+        Args:
+            database: A database object with a Trinkets collection.
 
-        for trinket in trinkets:
-            similarity_ratio = SequenceMatcher(None, query, trinket).ratio()
-            if similarity_ratio > 0.5:
-                result_trinkets.append(trinket)
-        if len(result_trinkets) == 0:
-            return []
-        return result_trinkets
+        Returns:
+            list: (name, texts) tuples with the effects, notes, synergies and
+            interactions texts of every trinket.
+        """
+        sections = ('effects', 'notes', 'synergies', 'interactions')
+        trinkets = database.Trinkets.find(
+            {}, {'_id': 0, 'name': 1, 'effects': 1, 'notes': 1, 'synergies': 1,
+                 'interactions': 1})
+        return [(trinket.get('name'),
+                 [value[1] for section in sections
+                  for value in trinket.get(section) or []])
+                for trinket in trinkets]
 
     def get_element(self, database):
         """
@@ -113,7 +120,8 @@ class Trinket:
         Returns:
             str: Description and details of the trinket
         """
-        trinket = database.Trinkets.find_one({"name": self.__name})
+        trinket = database.Trinkets.find_one({"name": self.__name},
+                                             self.FIELDS)
         return self.to_str(trinket)
 
     def get_element_section(self, database, section):
@@ -123,7 +131,22 @@ class Trinket:
         Returns:
             section (str): Section to retrieve.
         """
-        trinket = database.Trinkets.find_one({"name": self.__name})
+        trinket = database.Trinkets.find_one(
+            {"name": self.__name}, {'_id': 0, section.lower(): 1})
+        return self.section_to_str(trinket, section)
+
+    @staticmethod
+    def section_to_str(trinket, section):
+        """
+        Convert a section of a trinket to a formatted string representation.
+
+        Args:
+            trinket (dict): A dictionary representing a trinket.
+            section (str): Section to convert.
+
+        Returns:
+            str: A formatted string representation of the section.
+        """
         values = trinket.get(section.lower())
         content = [f"*{section}*:"]
 
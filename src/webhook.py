@@ -0,0 +1,197 @@
+"""
+This module provides an embedded HTTP server receiving Telegram updates
+through a webhook, as an alternative to long polling.
+
+Updates are acknowledged as soon as they are queued and handled by a bounded
+pool of workers. When the pool and its backlog are full, updates are refused
+with 503 so Telegram delivers them again later.
+
+Only updates carrying the secret token registered with setWebhook, in the
+X-Telegram-Bot-Api-Secret-Token header, are accepted, so updates can't be
+forged by anyone else reaching the server.
+
+Author: Carlos Morales Aguilera
+Date: 17-Oct-2026
+"""
+
+import hmac
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import telebot
+
+logger = logging.getLogger(__name__)
+
+# Updates that can wait for each worker before refusing new ones
+BACKLOG_PER_WORKER = 8
+
+# Header carrying the secret token registered with setWebhook
+SECRET_HEADER = 'X-Telegram-Bot-Api-Secret-Token'
+
+# Characters and length Telegram allows in a secret token
+SECRET_PATTERN = re.compile(r'[A-Za-z0-9_-]{1,256}')
+
+
+class WebhookServer:
+    """
+    HTTP server feeding Telegram webhook updates to a bot's handlers.
+
+    Attributes:
+        bot (telebot.TeleBot): The bot whose handlers process the updates.
+        path (str): URL path the updates are posted to.
+        secret_token (str): Secret token updates must carry.
+        server (ThreadingHTTPServer): The underlying HTTP server.
+        __executor (ThreadPoolExecutor): Workers processing the updates.
+        __slots (threading.BoundedSemaphore): Updates the workers and their
+        backlog can still take.
+    """
+
+    def __init__(self, bot, secret_token, address=('0.0.0.0', 8443), path='/',
+                 workers=8):
+        """
+        Initializes a new instance of the WebhookServer class.
+
+        The bot's own thread pool is disabled, since handlers run in the
+        server's workers.
+
+        Args:
+            bot (telebot.TeleBot): The bot whose handlers process the updates.
+            secret_token (str): Secret token updates must carry, as
+            registered with setWebhook.
+            address (tuple, optional): The (host, port) to listen on, port 0
+            picking a free one. Defaults to ('0.0.0.0', 8443).
+            path (str, optional): URL path the updates are posted to.
+            Defaults to '/'.
+            workers (int, optional): Number of workers. Defaults to 8.
+
+        Raises:
+            ValueError: If the secret token isn't valid for Telegram.
+        """
+        if not SECRET_PATTERN.fullmatch(secret_token or ''):
+            raise ValueError("The secret token must be 1 to 256 letters, "
+                             "digits, '_' or '-'")
+        self.bot = bot
+        self.secret_token = secret_token
+        self.bot.threaded = False
+        self.path = path
+        self.__executor = ThreadPoolExecutor(max_workers=workers)
+        self.__slots = threading.BoundedSemaphore(
+            workers * (1 + BACKLOG_PER_WORKER))
+        self.server = ThreadingHTTPServer(address, self.__handler())
+        self.server.daemon_threads = True
+
+    @property
+    def address(self):
+        """
+        Retrieves the address the server listens on.
+
+        Returns:
+            tuple: The (host, port) the server is bound to.
+        """
+        return self.server.server_address
+
+    def __handler(self):
+        """
+        Build the request handler class bound to this server.
+
+        Returns:
+            type: A BaseHTTPRequestHandler subclass.
+        """
+        webhook = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            Handles the requests posted by Telegram.
+            """
+
+            def do_POST(self):  # pylint: disable=C0103
+                """
+                Queues the update posted in the request body.
+                """
+                if self.path != webhook.path:
+                    self.send_error(404)
+                    return
+
+                length = int(self.headers.get('Content-Length', 0))
+                status = webhook.submit(self.rfile.read(length),
+                                        self.headers.get(SECRET_HEADER))
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):  # pylint: disable=W0221
+                """
+                Silences the per-request access log.
+                """
+
+        return Handler
+
+    def submit(self, body, secret_token):
+        """
+        Queue a raw update for the workers.
+
+        Args:
+            body (bytes): The JSON update posted by Telegram.
+            secret_token (str): The secret token sent with the update.
+
+        Returns:
+            int: HTTP status for Telegram: 200 if queued, 403 without the
+            secret token, 400 if malformed or 503 if the workers and their
+            backlog are full.
+        """
+        if not hmac.compare_digest((secret_token or '').encode('utf-8'),
+                                   self.secret_token.encode('utf-8')):
+            return 403
+        try:
+            update = telebot.types.Update.de_json(body.decode('utf-8'))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # Bodies that aren't a JSON object fail with TypeError or
+            # AttributeError
+            return 400
+        # Released by the worker once the update is processed
+        if not self.__slots.acquire(blocking=False):  # pylint: disable=R1732
+            return 503
+        self.__executor.submit(self.__process, update)
+        return 200
+
+    def __process(self, update):
+        """
+        Run the bot's handlers on an update.
+
+        Args:
+            update (telebot.types.Update): The update to process.
+        """
+        try:
+            self.bot.process_new_updates([update])
+        except Exception:  # pylint: disable=W0703
+            logger.exception("Error processing update %s", update.update_id)
+        finally:
+            self.__slots.release()
+
+    def serve_forever(self):
+        """
+        Serve updates until shutdown is called.
+        """
+        self.server.serve_forever()
+
+    def start(self):
+        """
+        Serve updates from a background thread.
+
+        Returns:
+            threading.Thread: The serving thread.
+        """
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        """
+        Stop serving and wait for the queued updates to be processed.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        self.__executor.shutdown(wait=True)